@@ -1,4 +1,4 @@
-from APICaller.Binance.binanceUtils import BinanceEnvVars
+from APICaller.Binance.binanceUtils import BinanceEnvVars, REQUEST_TIMEOUT_SECONDS
 from GlobalUtils.logger import *
 from binance.um_futures import UMFutures as Client
 from binance.enums import *
@@ -11,7 +11,7 @@ class BinanceCaller:
     def __init__(self):
         api_key = BinanceEnvVars.API_KEY.get_value()
         api_secret = BinanceEnvVars.API_SECRET.get_value()
-        self.client = Client(api_key, api_secret)
+        self.client = Client(api_key, api_secret, timeout=REQUEST_TIMEOUT_SECONDS)
 
     def get_price(self, symbol: str) -> float:
         try:
@@ -30,6 +30,33 @@ class BinanceCaller:
         return None
 
     def get_funding_rates(self, symbols: list):
+        funding_rates = self.get_funding_rates_snapshot(symbols)
+        if funding_rates:
+            return funding_rates
+
+        logger.info("BinanceAPICaller - Bulk funding snapshot unavailable, falling back to per-symbol requests.")
+        return self.get_funding_rates_per_symbol(symbols)
+
+    def get_funding_rates_snapshot(self, symbols: list) -> list:
+        """Fetches current funding for every requested symbol from a single all-symbols premium index request."""
+        funding_rates = []
+        try:
+            premium_index = self.client.mark_price()
+            if not isinstance(premium_index, list):
+                logger.error(f"BinanceAPICaller - Unexpected premium index response type: {type(premium_index)}")
+                return funding_rates
+
+            premium_index_by_symbol = {entry['symbol']: entry for entry in premium_index if 'symbol' in entry}
+            for symbol in symbols:
+                funding_rate_data = self._parse_premium_index_data(premium_index_by_symbol.get(symbol))
+                parsed_data = self._parse_funding_rate_data(funding_rate_data, symbol)
+                if parsed_data:
+                    funding_rates.append(parsed_data)
+        except Exception as e:
+            logger.error(f"BinanceAPICaller - Failed to fetch or parse bulk funding snapshot. Error: {e}")
+        return funding_rates
+
+    def get_funding_rates_per_symbol(self, symbols: list) -> list:
         funding_rates = []
         try:
             for symbol in symbols:
@@ -58,6 +85,11 @@ class BinanceCaller:
             logger.error(f"BinanceAPICaller - Error fetching funding rate for {symbol}: {e}")
         return None
         
+    def _parse_premium_index_data(self, premium_index_data):
+        if premium_index_data and 'lastFundingRate' in premium_index_data:
+            return {'fundingRate': premium_index_data['lastFundingRate']}
+        return None
+
     def _parse_funding_rate_data(self, funding_rate_data, symbol: str):
         if funding_rate_data:
             return {
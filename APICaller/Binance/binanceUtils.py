@@ -4,6 +4,8 @@ from enum import Enum
 
 load_dotenv()
 
+REQUEST_TIMEOUT_SECONDS = 5
+
 class BinanceEnvVars(Enum):
     API_KEY = "BINANCE_API_KEY"
     API_SECRET = "BINANCE_API_SECRET"
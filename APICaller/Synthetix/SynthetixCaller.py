@@ -23,7 +23,7 @@ class SynthetixCaller:
                     funding_rate_24 = market_data['current_funding_rate']
                     skew = market_data['skew']
                     funding_velocity = market_data['current_funding_velocity']
-                    funding_rate = funding_rate_24 / 3 
+                    funding_rate = funding_rate_24 / FUNDING_PERIODS_PER_DAY
                     market_funding_rates.append({
                         'exchange': 'Synthetix', 
                         'symbol': symbol,
@@ -1,10 +1,15 @@
 from synthetix import *
+from GlobalUtils.clientRegistry import ClientRegistry
 import os
 from dotenv import load_dotenv
 from enum import Enum
 
 load_dotenv()
 
+RPC_REQUEST_TIMEOUT_SECONDS = 10
+# Synthetix reports funding per day; rates are compared per 8 hour period to line up with Binance funding.
+FUNDING_PERIODS_PER_DAY = 3
+
 class SynthetixEnvVars(Enum):
     BASE_PROVIDER_RPC = 'BASE_PROVIDER_RPC'
     CHAIN_ID_BASE = 'CHAIN_ID_BASE'
@@ -20,9 +25,17 @@ class SynthetixEnvVars(Enum):
 
 
 def get_synthetix_client() -> Synthetix:
+    return ClientRegistry.get_or_create('synthetix', create_synthetix_client)
+
+def get_synthetix_transaction_lock():
+    """The SDK tracks nonce and account state on the shared client without locking, so every transaction send holds this lock."""
+    return ClientRegistry.get_transaction_lock('synthetix')
+
+def create_synthetix_client() -> Synthetix:
     synthetix_client = Synthetix(
                 provider_rpc=SynthetixEnvVars.BASE_PROVIDER_RPC.get_value(),
-                private_key=SynthetixEnvVars.PRIVATE_KEY.get_value()
+                private_key=SynthetixEnvVars.PRIVATE_KEY.get_value(),
+                request_kwargs={'timeout': RPC_REQUEST_TIMEOUT_SECONDS}
     )
     return synthetix_client
 
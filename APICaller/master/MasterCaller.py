@@ -1,7 +1,11 @@
 from APICaller.Synthetix.SynthetixCaller import SynthetixCaller
 from APICaller.Binance.binanceCaller import BinanceCaller
-from APICaller.master.MasterUtils import get_all_target_token_lists, get_target_exchanges
+from APICaller.master.MasterUtils import get_all_target_token_lists, get_target_exchanges, EXCHANGE_FETCH_TIMEOUT_SECONDS
 from GlobalUtils.logger import *
+from GlobalUtils.globalUtils import EventsDirectory
+from pubsub import pub
+from concurrent.futures import ThreadPoolExecutor, wait
+import time
 
 class MasterCaller:
     def __init__(self):
@@ -10,6 +14,9 @@ class MasterCaller:
         self.target_token_list_by_exchange = get_all_target_token_lists()
         self.target_exchanges = get_target_exchanges()
         self.filtered_exchange_objects_and_tokens = self.filter_exchanges_and_tokens()
+        self.last_fetch_times = {}
+        self.fetch_executor = ThreadPoolExecutor(max_workers=max(len(self.filtered_exchange_objects_and_tokens), 1), thread_name_prefix='FundingRateFetch')
+        self.in_flight_fetches = {}
 
     def filter_exchanges_and_tokens(self):
         try:
@@ -45,3 +52,56 @@ class MasterCaller:
             logger.error(f"MasterAPICaller - Error aggregating funding rates across exchanges: {e}")
             return []
 
+    def get_funding_rates_concurrently(self, timeout_seconds: float = EXCHANGE_FETCH_TIMEOUT_SECONDS) -> list:
+        """
+        Fetches funding rates from every target exchange in parallel on one long-lived pool. Exchanges that miss the
+        deadline are skipped and the rates from the rest are returned; a venue still busy from an earlier call is not
+        queued again, so a hung venue holds at most one worker.
+        """
+        try:
+            funding_rates = []
+            fetch_times = {}
+            exchanges = self.filtered_exchange_objects_and_tokens
+            if not exchanges:
+                return funding_rates
+
+            futures = {}
+            for exchange_name, (exchange, tokens) in exchanges.items():
+                in_flight = self.in_flight_fetches.get(exchange_name)
+                if in_flight is not None and not in_flight.done():
+                    fetch_times[exchange_name] = None
+                    logger.error(f"MasterAPICaller - {exchange_name} is still serving an earlier funding rate request, skipping it this round.")
+                    continue
+                future = self.fetch_executor.submit(self._get_funding_rates_with_timing, exchange, tokens)
+                self.in_flight_fetches[exchange_name] = future
+                futures[future] = exchange_name
+            done, _ = wait(futures, timeout=timeout_seconds)
+
+            for future, exchange_name in futures.items():
+                if future not in done:
+                    fetch_times[exchange_name] = None
+                    logger.error(f"MasterAPICaller - {exchange_name} did not return funding rates within {timeout_seconds}s, continuing with partial results.")
+                    continue
+                try:
+                    rates, elapsed = future.result()
+                    fetch_times[exchange_name] = elapsed
+                    if rates:
+                        funding_rates.extend(rates)
+                except Exception as inner_e:
+                    fetch_times[exchange_name] = None
+                    logger.error(f"MasterAPICaller - Error getting funding rates from {exchange_name}: {inner_e}")
+
+            self.last_fetch_times = fetch_times
+            logger.info(f"MasterAPICaller - Funding rate fetch times by exchange (seconds): {fetch_times}")
+            if funding_rates:
+                pub.sendMessage(EventsDirectory.FUNDING_RATES_UPDATED.value, funding_rates=funding_rates)
+            return funding_rates
+        except Exception as e:
+            logger.error(f"MasterAPICaller - Error aggregating funding rates concurrently across exchanges: {e}")
+            return []
+
+    def _get_funding_rates_with_timing(self, exchange, tokens: list) -> tuple:
+        start_time = time.perf_counter()
+        rates = exchange.get_funding_rates(tokens)
+        elapsed = time.perf_counter() - start_time
+        return rates, elapsed
@@ -13,6 +13,8 @@ TARGET_TOKENS = [
     {"token": "DOGE", "is_target": True},
 ]
 
+EXCHANGE_FETCH_TIMEOUT_SECONDS = 10
+
 TARGET_EXCHANGES = [
     {"exchange": "Synthetix", "is_target": True},
     {"exchange": "Binance", "is_target": True},
@@ -1,6 +1,9 @@
 from APICaller.Binance.binanceCaller import BinanceCaller
 from Backtesting.utils.backtestingUtils import *
 from Backtesting.Binance.binanceBacktesterUtils import *
+from Backtesting.utils.blockTimestampIndex import BlockTimestampIndex
+from Backtesting.utils.columnarStore import ColumnarStore
+from Backtesting.utils.memoryMappedDataset import MemoryMappedDataset
 from GlobalUtils.globalUtils import *
 from GlobalUtils.marketDirectory import MarketDirectory
 from GlobalUtils.logger import logger
@@ -13,6 +16,8 @@ class BinanceBacktester:
 
     def __init__(self):
         self.caller = BinanceCaller()
+        self.block_index = BlockTimestampIndex()
+        self.store = ColumnarStore('Binance', BINANCE_HISTORICAL_SCHEMA)
 
     def build_statistics_dict(self, symbol: str) -> dict:
         formatted_symbol = symbol + 'USDT'
@@ -156,25 +161,31 @@ class BinanceBacktester:
             return None
     
     def get_historical_data(self, symbol: str):
-        """Fetches historical funding rate data for a symbol from the Binance API and writes it to a JSON file"""
+        """Fetches historical funding rate data for a symbol from the Binance API and writes it to the columnar store"""
         try:
             data = self.build_backtest_data(symbol)
-            save_data_to_json(data, symbol)
+            self.store.write(symbol, data)
             return
         except Exception as e:
-            logger.error(f'BinanceBacktester - Error while fetching historical data for JSON file: {e}')
+            logger.error(f'BinanceBacktester - Error while storing historical data for {symbol}: {e}')
             return
 
-    def load_data_from_json(self, symbol: str):
+    def load_historical_data(self, symbol: str) -> pd.DataFrame:
         try:
-            filename = f'Backtesting/MasterBacktester/historicalDataJSON/Binance/{symbol}Historical.json'
-            with open(filename, 'r') as file:
-                data = json.load(file)
-            if not isinstance(data, list) or not all(isinstance(item, dict) for item in data):
-                raise ValueError("BinanceBacktester - Loaded data is not a list of dictionaries.")
-            return data
+            if not self.store.exists(symbol) and not self.store.import_json(symbol, get_legacy_json_path(symbol)):
+                raise FileNotFoundError(f"No historical data stored for {symbol}")
+            return self.store.read_dataframe(symbol)
+        except Exception as e:
+            logger.error(f'BinanceBacktester - Error while retrieving historical data for {symbol}: {e}')
+            return None
+
+    def open_dataset(self, symbol: str, columns: list = None) -> MemoryMappedDataset:
+        try:
+            if not self.store.exists(symbol) and not self.store.import_json(symbol, get_legacy_json_path(symbol)):
+                raise FileNotFoundError(f"No historical data stored for {symbol}")
+            return MemoryMappedDataset(self.store, symbol, columns)
         except Exception as e:
-            logger.error(f'BinanceBacktester - Error while retrieving historical data from JSON file: {e}')
+            logger.error(f'BinanceBacktester - Error while opening historical dataset for {symbol}: {e}')
             return None
 
     def build_backtest_data(self, symbol: str) -> dict:
@@ -183,11 +194,11 @@ class BinanceBacktester:
             formatted_symbol = symbol + 'USDT'
             max_limit = 100
             rates = self.caller.get_historical_funding_rate_for_symbol(formatted_symbol, max_limit)
-            for rate in rates:
-                timestamp = rate['fundingTime'] // 1000
+            self.block_index.extend_to_latest(start_timestamp=MARKET_DEPLOYMENT_TIMESTAMP)
+            timestamps = [rate['fundingTime'] // 1000 for rate in rates]
+            block_numbers = self.block_index.get_block_numbers(timestamps)
+            for rate, timestamp, block_number in zip(rates, timestamps, block_numbers):
                 if timestamp > MARKET_DEPLOYMENT_TIMESTAMP:
-                    block_number = get_base_block_number_by_timestamp(timestamp)
-                    time.sleep(0.2)
                     del rate['fundingTime']
                     rate['block_number'] = block_number
                     rate['funding_rate'] = rate['fundingRate']
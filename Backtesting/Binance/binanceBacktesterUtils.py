@@ -3,6 +3,12 @@ import pandas as pd
 import json
 
 MARKET_DEPLOYMENT_TIMESTAMP = 1702522800
+BINANCE_HISTORICAL_SCHEMA = {
+    'block_number': 'int64',
+    'market_id': 'int64',
+    'funding_rate': 'float64',
+    'markPrice': 'float64'
+}
 
 def calculate_open_interest_differential_usd(ratio: float, open_interest: float, price: float) -> float:
     try:
@@ -21,6 +27,9 @@ def calculate_open_interest_differential_usd(ratio: float, open_interest: float,
         logger.info(f"BinanceBacktesterUtils - An error occurred: {e}")
     return 0.0
 
+def get_legacy_json_path(symbol: str) -> str:
+    return f'Backtesting/MasterBacktester/historicalDataJSON/Binance/{symbol}Historical.json'
+
 def save_data_to_json(data, symbol: str):
     try:
         filename = f'Backtesting/MasterBacktester/historicalDataJSON/Binance/{symbol}Historical.json'
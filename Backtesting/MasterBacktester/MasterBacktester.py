@@ -17,7 +17,7 @@ class MasterBacktester:
 
     def run_updates(self):
         try:
-            self.synthetix.fetch_and_process_events_for_all_symbols()
+            self.synthetix.fetch_and_process_events_for_all_tokens()
 
             for token_info in TARGET_TOKENS:
                 if token_info["is_target"]:
@@ -28,11 +28,13 @@ class MasterBacktester:
     
     def backtest_arbitrage_strategy(self, symbol: str, entry_threshold=0.0001, exit_threshold=0.00005):
         try:
-            synthetix_funding_events = self.synthetix.load_data_from_json(symbol)
-            binance_funding_events = self.binance.load_data_from_json(symbol)
-
-            synthetix_df = pd.DataFrame(synthetix_funding_events)
-            binance_df = pd.DataFrame(binance_funding_events).sort_values('block_number')
+            synthetix_dataset = self.synthetix.open_dataset(symbol, SYNTHETIX_BACKTEST_COLUMNS)
+            binance_dataset = self.binance.open_dataset(symbol, BINANCE_BACKTEST_COLUMNS)
+            if synthetix_dataset is None or binance_dataset is None:
+                logger.error(f'MasterBacktester - Historical data unavailable for symbol {symbol}, skipping backtest.')
+                return None
+            synthetix_df = synthetix_dataset.get_frame()
+            binance_df = binance_dataset.get_frame()
 
             total_profit = 0.0
             trades = []
@@ -40,10 +42,10 @@ class MasterBacktester:
             potential_trades = determine_trade_entry_exit_points(synthetix_df, binance_df, entry_threshold, exit_threshold)
 
             for trade in potential_trades:
-                binance_trade_events = extract_funding_events(binance_df, trade['entry_block_binance'], trade['exit_block_binance'])
+                binance_trade_events = binance_dataset.get_frame(trade['entry_block_binance'], trade['exit_block_binance'])
                 binance_funding_impact = calculate_total_funding_impact(binance_trade_events, trade['binance_position_size'])
 
-                synthetix_trade_data = synthetix_df[(synthetix_df['block_number'] >= trade['entry_block_snx']) & (synthetix_df['block_number'] <= trade['exit_block_snx'])]
+                synthetix_trade_data = synthetix_dataset.get_frame(trade['entry_block_snx'], trade['exit_block_snx'])
                 synthetix_funding_impact = accumulate_funding_costs(synthetix_trade_data, trade['entry_block_snx'], trade['exit_block_snx'], trade['snx_position_size'])
 
                 trade_details = calculate_profit_or_loss_for_trade(trade, synthetix_funding_impact, binance_funding_impact)
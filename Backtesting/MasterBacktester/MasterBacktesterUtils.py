@@ -4,6 +4,9 @@ from GlobalUtils.globalUtils import *
 import numpy as np
 import matplotlib.pyplot as plt
 
+SYNTHETIX_BACKTEST_COLUMNS = ['block_number', 'funding_rate', 'funding_velocity', 'skew', 'price']
+BINANCE_BACKTEST_COLUMNS = ['block_number', 'funding_rate', 'markPrice']
+
 def determine_trade_entry_exit_points(data_snx: pd.DataFrame, data_binance: pd.DataFrame, entry_threshold: float, exit_threshold: float):
     trades = []
     data_snx['skew'] = data_snx['skew'].astype(float)
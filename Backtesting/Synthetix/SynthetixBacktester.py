@@ -1,5 +1,8 @@
 from Backtesting.utils.backtestingUtils import *
 from Backtesting.Synthetix.SynthetixBacktesterUtils import *
+from Backtesting.utils.adaptiveLogFetcher import AdaptiveLogFetcher, LogFetchIncompleteError
+from Backtesting.utils.columnarStore import ColumnarStore
+from Backtesting.utils.memoryMappedDataset import MemoryMappedDataset
 from APICaller.Synthetix.SynthetixCaller import SynthetixCaller
 from GlobalUtils.globalUtils import *
 from GlobalUtils.marketDirectory import MarketDirectory
@@ -11,6 +14,7 @@ class SynthetixBacktester:
     def __init__(self):
         self.caller = SynthetixCaller()
         self.contract = get_perps_contract()
+        self.store = ColumnarStore('Synthetix', SYNTHETIX_HISTORICAL_SCHEMA)
 
     def build_statistics_dict(self, symbol: str) -> dict:
         try:
@@ -176,49 +180,104 @@ class SynthetixBacktester:
             logger.info(f"SynthetixBacktester - Error calculating dollar value of open interest for {symbol}: {e}")
             return None
 
-    def fetch_and_process_events_for_all_tokens(self):
+    def fetch_and_process_events_for_all_tokens(self, full_refresh: bool = False):
         try:
-            events = self.fetch_all_events()
-            self.process_events_for_all_symbols(events)
+            if full_refresh:
+                end_block = client.eth.block_number
+                events = self.fetch_all_events(end_block=end_block)
+                if events is None:
+                    logger.error("SynthetixBacktester - Full refresh incomplete, keeping existing history and sync state.")
+                    return
+                synced_symbols = self.process_events_for_all_symbols(events)
+                sync_state = load_sync_state()
+                sync_state.update({symbol: end_block for symbol in synced_symbols})
+                save_sync_state(sync_state)
+            else:
+                self.sync_new_events()
 
         except Exception as e:
             logger.error(f"SynthetixBacktester - Error fetching or processing events for all symbols: {e}")
             return
 
-    def process_events_for_all_symbols(self, parsed_events: list):
+    def sync_new_events(self):
+        """Fetches only blocks after each market's last synced block and appends the new events to its stored history."""
         try:
-            for token_info in TARGET_TOKENS:
-                symbol = token_info["token"]
-                if token_info["is_target"]:
-                    market_id = MarketDirectory.get_market_id(symbol)
-                    market_events = [event for event in parsed_events if event.get('market_id') == market_id]
-                    save_data_to_json(market_events, symbol)
-                    logger.info(f"SynthetixBacktester - Processed {len(market_events)} events for symbol {symbol}")
-
+            current_block = client.eth.block_number
+            sync_state = load_sync_state()
+            last_blocks = {}
+            for symbol in get_target_symbols():
+                if not self.store.exists(symbol):
+                    self.store.import_json(symbol, get_legacy_json_path(symbol))
+                last_block = sync_state.get(symbol)
+                if last_block is None:
+                    last_block = self.store.get_last_block(symbol)
+                if last_block is None:
+                    last_block = max(current_block - HISTORY_WINDOW_BLOCKS, 0) - 1
+                last_blocks[symbol] = last_block
+
+            if not last_blocks:
+                return
+            start_block = min(last_blocks.values()) + 1
+            if start_block > current_block:
+                logger.info(f"SynthetixBacktester - Historical data already synced to block {current_block}")
+                return
+
+            events = self.fetch_all_events(start_block, current_block)
+            if events is None:
+                logger.error(f"SynthetixBacktester - Sync of blocks {start_block} to {current_block} incomplete, sync cursors not advanced.")
+                return
+            for symbol, last_block in last_blocks.items():
+                market_id = MarketDirectory.get_market_id(symbol)
+                new_events = [event for event in events if event.get('market_id') == market_id and event['block_number'] > last_block]
+                self.store.append(symbol, new_events)
+                sync_state[symbol] = current_block
+                save_sync_state(sync_state)
+                logger.info(f"SynthetixBacktester - Appended {len(new_events)} new events for symbol {symbol}")
+        except Exception as e:
+            logger.error(f"SynthetixBacktester - Error while syncing new events: {e}")
             return
+
+    def process_events_for_all_symbols(self, parsed_events: list) -> list:
+        """Rewrites each market's history and returns the symbols that were written."""
+        written_symbols = []
+        try:
+            for symbol in get_target_symbols():
+                market_id = MarketDirectory.get_market_id(symbol)
+                market_events = [event for event in parsed_events if event.get('market_id') == market_id]
+                self.store.write(symbol, market_events)
+                written_symbols.append(symbol)
+                logger.info(f"SynthetixBacktester - Processed {len(market_events)} events for symbol {symbol}")
+
+            return written_symbols
         except Exception as e:
             logger.error(f"SynthetixBacktester - Error processing events for all symbols: {e}")
-            return 
+            return written_symbols
 
-    def fetch_all_events(self) -> list:
+    def fetch_all_events(self, start_block: int = None, end_block: int = None) -> list:
+        """Returns None rather than a partial list when any block range could not be fetched."""
         try:
-            current_block = client.eth.block_number
-            start_block = max(current_block - 1000000, 0)
-            step_size = 1000000
-            all_events = []
-            for block in range(start_block, current_block, step_size): 
-                current_end_block = min(block + 1000000, current_block)
-                logger.info(f"Fetching events from block {block} to {current_end_block}")
-                events = self.fetch_events_for_block_range(block, current_end_block)
-                if events:
-                    parsed_events = parse_event_data(events)
-                    all_events.extend(events)
-                else:
-                    logger.error(f"SynthetixBacktester - No events found from blocks {block} to {current_end_block}")
+            current_block = end_block if end_block is not None else client.eth.block_number
+            if start_block is None:
+                start_block = max(current_block - HISTORY_WINDOW_BLOCKS, 0)
+            fetcher = AdaptiveLogFetcher(
+                fetch_logs=self.get_market_updated_logs,
+                parse_logs=parse_event_data,
+                checkpoint_path=EVENT_FETCH_CHECKPOINT_PATH
+            )
+            parsed_events = fetcher.fetch(start_block, current_block)
+            fetcher.clear_checkpoint()
+            if not parsed_events:
+                logger.error(f"SynthetixBacktester - No events found from blocks {start_block} to {current_block}")
             return parsed_events
+        except LogFetchIncompleteError as e:
+            logger.error(f"SynthetixBacktester - Fetched {len(e.events)} events but blocks {e.failed_ranges} are missing, checkpoint kept for the next run.")
+            return None
         except Exception as e:
             logger.error(f"SynthetixBacktester - Error while retrieving historical events from node: {e}")
-            return []
+            return None
+
+    def get_market_updated_logs(self, start_block: int, end_block: int) -> list:
+        return self.contract.events.MarketUpdated.get_logs(fromBlock=start_block, toBlock=end_block)
 
     def fetch_events_for_block_range(self, start_block, end_block):
         contract = get_perps_contract()
@@ -308,12 +367,20 @@ class SynthetixBacktester:
             logger.error(f'SynthetixBacktester - Error while calculating average funding rate: {e}')
             return 0.0
 
-    def load_data_from_json(self, symbol: str):
+    def load_historical_data(self, symbol: str) -> pd.DataFrame:
         try:
-            filename = f'Backtesting/MasterBacktester/historicalDataJSON/Synthetix/{symbol}Historical.json'
-            with open(filename, 'r') as file:
-                return json.load(file)
+            if not self.store.exists(symbol) and not self.store.import_json(symbol, get_legacy_json_path(symbol)):
+                raise FileNotFoundError(f"No historical data stored for {symbol}")
+            return self.store.read_dataframe(symbol)
         except Exception as e:
-            logger.error(f'SynthetixBacktester - Error while retriving historical data from JSON file: {e}')
-            return
-            
+            logger.error(f'SynthetixBacktester - Error while retrieving historical data for {symbol}: {e}')
+            return None
+
+    def open_dataset(self, symbol: str, columns: list = None) -> MemoryMappedDataset:
+        try:
+            if not self.store.exists(symbol) and not self.store.import_json(symbol, get_legacy_json_path(symbol)):
+                raise FileNotFoundError(f"No historical data stored for {symbol}")
+            return MemoryMappedDataset(self.store, symbol, columns)
+        except Exception as e:
+            logger.error(f'SynthetixBacktester - Error while opening historical dataset for {symbol}: {e}')
+            return None
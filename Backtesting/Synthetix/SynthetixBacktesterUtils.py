@@ -6,16 +6,28 @@ from web3 import *
 from web3.datastructures import AttributeDict
 from hexbytes import HexBytes
 from GlobalUtils.globalUtils import *
+from APICaller.master.MasterUtils import TARGET_TOKENS
 import pandas as pd
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
-provider_url = os.getenv('BASE_PROVIDER_RPC')
-client = Web3(Web3.HTTPProvider(provider_url))
+client = initialise_client()
 
 MULTICALL_GAS = 500000
+HISTORY_WINDOW_BLOCKS = 1000000
+EVENT_FETCH_CHECKPOINT_PATH = 'Backtesting/MasterBacktester/historicalDataJSON/Synthetix/MarketUpdatedCheckpoint.jsonl'
+SYNC_STATE_FILE_PATH = 'Backtesting/MasterBacktester/historicalDataJSON/Synthetix/SyncState.json'
+SYNTHETIX_HISTORICAL_SCHEMA = {
+    'block_number': 'int64',
+    'market_id': 'int64',
+    'price': 'float64',
+    'size': 'float64',
+    'skew': 'float64',
+    'funding_rate': 'float64',
+    'funding_velocity': 'float64'
+}
 
 class ContractAddresses(Enum):
     PERPS = Web3.to_checksum_address('0x0a2af931effd34b81ebcc57e3d3c9b1e1de1c9ce')
@@ -108,6 +120,29 @@ def save_data_to_json(data, symbol: str):
             logger.error(f'SynthetixBacktester - Error while logging historical data to JSON file: {e}')
             return
 
+def get_legacy_json_path(symbol: str) -> str:
+    return f'Backtesting/MasterBacktester/historicalDataJSON/Synthetix/{symbol}Historical.json'
+
+def get_target_symbols() -> list:
+    return [token_info["token"] for token_info in TARGET_TOKENS if token_info["is_target"]]
+
+def load_sync_state() -> dict:
+    try:
+        if not os.path.exists(SYNC_STATE_FILE_PATH):
+            return {}
+        with open(SYNC_STATE_FILE_PATH, 'r') as file:
+            return json.load(file)
+    except json.JSONDecodeError as e:
+        logger.error(f'SynthetixBacktester - Sync state file is not valid JSON, starting from stored data: {e}')
+        return {}
+
+def save_sync_state(state: dict):
+    try:
+        with open(SYNC_STATE_FILE_PATH, 'w') as file:
+            json.dump(state, file, indent=4)
+    except Exception as e:
+        logger.error(f'SynthetixBacktester - Error while saving sync state: {e}')
+
 def preprocess_rates(rates):
     try:
         preprocessed_rates = {}
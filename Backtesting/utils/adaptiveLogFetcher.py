@@ -0,0 +1,165 @@
+from GlobalUtils.logger import logger
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from collections import deque
+import threading
+import json
+import time
+import os
+
+INITIAL_LOG_CHUNK_BLOCKS = 20000
+MIN_LOG_CHUNK_BLOCKS = 1
+MAX_LOG_CHUNK_BLOCKS = 500000
+SPARSE_RESULT_THRESHOLD = 1000
+MAX_LOG_FETCH_WORKERS = 8
+MAX_LOG_FETCH_RETRIES = 3
+RETRY_BACKOFF_SECONDS = 1
+
+# Substrings providers use when a getLogs range holds too many results or spans too many blocks.
+RANGE_TOO_LARGE_ERRORS = [
+    'returned more than',
+    'too many results',
+    'response size',
+    'block range',
+    'range too large',
+    'range is too large',
+    'max results'
+]
+
+class LogFetchIncompleteError(Exception):
+    """Raised once every other range is done when some ranges kept failing, carrying the events that were fetched."""
+    def __init__(self, events: list, failed_ranges: list):
+        self.events = events
+        self.failed_ranges = failed_ranges
+        super().__init__(f"AdaptiveLogFetcher - {len(failed_ranges)} block ranges could not be fetched: {failed_ranges}")
+
+class AdaptiveLogFetcher:
+    """
+    Downloads event logs over a block range with a bounded worker pool. Chunks are halved when a provider
+    rejects them as too large and grown when results come back sparse. Every completed chunk is appended
+    to a JSON-lines checkpoint so an interrupted download resumes where it stopped. Ranges that keep failing
+    do not stop the others; they are reported at the end through LogFetchIncompleteError.
+    """
+    def __init__(self, fetch_logs, parse_logs, checkpoint_path: str = None, max_workers: int = MAX_LOG_FETCH_WORKERS, initial_chunk_blocks: int = INITIAL_LOG_CHUNK_BLOCKS):
+        self.fetch_logs = fetch_logs
+        self.parse_logs = parse_logs
+        self.checkpoint_path = checkpoint_path
+        self.max_workers = max_workers
+        self.chunk_blocks = initial_chunk_blocks
+        self._checkpoint_lock = threading.Lock()
+
+    def fetch(self, start_block: int, end_block: int) -> list:
+        completed_ranges, events = self.load_checkpoint(start_block, end_block)
+        segments = deque(get_uncovered_ranges(start_block, end_block, completed_ranges))
+        retry_ranges = deque()
+        attempts = {}
+        failed_ranges = []
+        started_at = time.perf_counter()
+        logger.info(f"AdaptiveLogFetcher - Fetching blocks {start_block} to {end_block}, {len(completed_ranges)} chunks restored from checkpoint.")
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {}
+            while segments or retry_ranges or futures:
+                while len(futures) < self.max_workers and (segments or retry_ranges):
+                    block_range, delay = retry_ranges.popleft() if retry_ranges else (self._next_chunk(segments), 0)
+                    futures[executor.submit(self._fetch_range, *block_range, delay)] = block_range
+
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    block_range = futures.pop(future)
+                    try:
+                        chunk_events = future.result()
+                    except Exception as e:
+                        retry_ranges.extend(self._handle_failure(block_range, e, attempts, failed_ranges))
+                        continue
+
+                    events.extend(chunk_events)
+                    self._record_checkpoint(block_range, chunk_events)
+                    if len(chunk_events) < SPARSE_RESULT_THRESHOLD:
+                        self.chunk_blocks = min(self.chunk_blocks * 2, MAX_LOG_CHUNK_BLOCKS)
+
+        events.sort(key=lambda event: event['block_number'])
+        logger.info(f"AdaptiveLogFetcher - Retrieved {len(events)} events in {time.perf_counter() - started_at:.1f}s.")
+        if failed_ranges:
+            raise LogFetchIncompleteError(events, sorted(failed_ranges))
+        return events
+
+    def clear_checkpoint(self):
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+    def load_checkpoint(self, start_block: int, end_block: int) -> tuple:
+        completed_ranges = []
+        events = []
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return completed_ranges, events
+
+        with open(self.checkpoint_path, 'r') as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.error("AdaptiveLogFetcher - Skipping truncated checkpoint entry.")
+                    continue
+                from_block, to_block = entry['from_block'], entry['to_block']
+                if to_block < start_block or from_block > end_block:
+                    continue
+                completed_ranges.append((from_block, to_block))
+                events.extend(event for event in entry['events'] if start_block <= event['block_number'] <= end_block)
+        return completed_ranges, events
+
+    def _next_chunk(self, segments: deque) -> tuple:
+        segment_start, segment_end = segments[0]
+        chunk_end = min(segment_start + self.chunk_blocks - 1, segment_end)
+        if chunk_end == segment_end:
+            segments.popleft()
+        else:
+            segments[0] = (chunk_end + 1, segment_end)
+        return (segment_start, chunk_end)
+
+    def _fetch_range(self, from_block: int, to_block: int, delay: float = 0) -> list:
+        if delay:
+            time.sleep(delay)
+        logs = self.fetch_logs(from_block, to_block)
+        return self.parse_logs(logs) if logs else []
+
+    def _handle_failure(self, block_range: tuple, error: Exception, attempts: dict, failed_ranges: list) -> list:
+        from_block, to_block = block_range
+        span = to_block - from_block + 1
+        if is_range_too_large_error(error) and span > MIN_LOG_CHUNK_BLOCKS:
+            self.chunk_blocks = max(span // 2, MIN_LOG_CHUNK_BLOCKS)
+            middle_block = from_block + span // 2 - 1
+            logger.info(f"AdaptiveLogFetcher - Range {from_block}-{to_block} too large, splitting; chunk size now {self.chunk_blocks}.")
+            return [((from_block, middle_block), 0), ((middle_block + 1, to_block), 0)]
+
+        attempts[block_range] = attempts.get(block_range, 0) + 1
+        if attempts[block_range] > MAX_LOG_FETCH_RETRIES:
+            logger.error(f"AdaptiveLogFetcher - Giving up on blocks {from_block}-{to_block} after {MAX_LOG_FETCH_RETRIES} retries: {error}")
+            failed_ranges.append(block_range)
+            return []
+        logger.error(f"AdaptiveLogFetcher - Error fetching blocks {from_block}-{to_block}, retrying: {error}")
+        return [(block_range, RETRY_BACKOFF_SECONDS * attempts[block_range])]
+
+    def _record_checkpoint(self, block_range: tuple, events: list):
+        if not self.checkpoint_path:
+            return
+        entry = {'from_block': block_range[0], 'to_block': block_range[1], 'events': events}
+        with self._checkpoint_lock:
+            with open(self.checkpoint_path, 'a') as file:
+                file.write(json.dumps(entry) + '\n')
+
+def is_range_too_large_error(error: Exception) -> bool:
+    message = str(error).lower()
+    return any(marker in message for marker in RANGE_TOO_LARGE_ERRORS)
+
+def get_uncovered_ranges(start_block: int, end_block: int, completed_ranges: list) -> list:
+    uncovered = []
+    cursor = start_block
+    for from_block, to_block in sorted(completed_ranges):
+        if from_block > cursor:
+            uncovered.append((cursor, min(from_block - 1, end_block)))
+        cursor = max(cursor, to_block + 1)
+        if cursor > end_block:
+            break
+    if cursor <= end_block:
+        uncovered.append((cursor, end_block))
+    return uncovered
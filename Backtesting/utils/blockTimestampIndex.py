@@ -0,0 +1,114 @@
+from GlobalUtils.globalUtils import initialise_client, get_base_block_number_by_timestamp, BLOCKS_PER_DAY_BASE
+from GlobalUtils.blockClock import BASE_BLOCK_TIME_SECONDS
+from GlobalUtils.logger import logger
+import numpy as np
+import bisect
+import json
+import os
+
+BLOCK_INDEX_FILE_PATH = 'Backtesting/MasterBacktester/historicalDataJSON/BaseBlockTimestampIndex.json'
+
+class BlockTimestampIndex:
+    """
+    Sparse, persistent map of Base block numbers to block timestamps. Blocks between
+    samples are linearly interpolated, so lookups never touch the network.
+    """
+    def __init__(self, file_path: str = BLOCK_INDEX_FILE_PATH, sample_interval_blocks: int = BLOCKS_PER_DAY_BASE):
+        self.file_path = file_path
+        self.sample_interval_blocks = sample_interval_blocks
+        self.block_numbers = []
+        self.timestamps = []
+        self.load()
+
+    def load(self):
+        try:
+            if not os.path.exists(self.file_path):
+                logger.info(f"BlockTimestampIndex - No index file found at {self.file_path}. Starting fresh.")
+                return
+            with open(self.file_path, 'r') as file:
+                samples = json.load(file)
+            self.block_numbers = [int(sample['block_number']) for sample in samples]
+            self.timestamps = [int(sample['timestamp']) for sample in samples]
+            logger.info(f"BlockTimestampIndex - Loaded {len(self.block_numbers)} samples from {self.file_path}.")
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            logger.error(f"BlockTimestampIndex - Error decoding index file {self.file_path}, starting fresh: {e}")
+            self.block_numbers = []
+            self.timestamps = []
+
+    def save(self):
+        try:
+            samples = [
+                {'block_number': block_number, 'timestamp': timestamp}
+                for block_number, timestamp in zip(self.block_numbers, self.timestamps)
+            ]
+            with open(self.file_path, 'w') as file:
+                json.dump(samples, file)
+        except Exception as e:
+            logger.error(f"BlockTimestampIndex - Failed to save index to {self.file_path}: {e}")
+
+    def add_sample(self, block_number: int, timestamp: int):
+        position = bisect.bisect_left(self.block_numbers, block_number)
+        if position < len(self.block_numbers) and self.block_numbers[position] == block_number:
+            self.timestamps[position] = timestamp
+            return
+        self.block_numbers.insert(position, block_number)
+        self.timestamps.insert(position, timestamp)
+
+    def seed(self, timestamp: int) -> bool:
+        block_number = get_base_block_number_by_timestamp(timestamp)
+        if block_number is None or block_number < 0:
+            logger.error(f"BlockTimestampIndex - Unable to seed index at timestamp {timestamp}.")
+            return False
+        return self._sample_block(initialise_client(), block_number)
+
+    def extend_to_latest(self, start_timestamp: int = None):
+        try:
+            if not self.block_numbers and start_timestamp is not None:
+                self.seed(start_timestamp)
+            if not self.block_numbers:
+                logger.error("BlockTimestampIndex - Index is empty and was not seeded, cannot extend.")
+                return
+
+            client = initialise_client()
+            latest_block = client.eth.block_number
+            last_sampled_block = self.block_numbers[-1]
+            for block_number in range(last_sampled_block + self.sample_interval_blocks, latest_block, self.sample_interval_blocks):
+                self._sample_block(client, block_number)
+            if latest_block > self.block_numbers[-1]:
+                self._sample_block(client, latest_block)
+
+            self.save()
+            logger.info(f"BlockTimestampIndex - Index extended to block {self.block_numbers[-1]} with {len(self.block_numbers)} samples.")
+        except Exception as e:
+            logger.error(f"BlockTimestampIndex - Error while extending index to latest block: {e}")
+
+    def get_block_number(self, timestamp: int) -> int:
+        block_numbers = self.get_block_numbers([timestamp])
+        return block_numbers[0] if block_numbers else -1
+
+    def get_block_numbers(self, timestamps: list) -> list:
+        """Returns the last block produced at or before each timestamp, mirroring Basescan's closest='before' lookup."""
+        if not self.block_numbers:
+            logger.error("BlockTimestampIndex - Index is empty, cannot map timestamps to blocks.")
+            return [-1 for _ in timestamps]
+
+        query = np.asarray(timestamps, dtype=np.float64)
+        sampled_timestamps = np.asarray(self.timestamps, dtype=np.float64)
+        sampled_blocks = np.asarray(self.block_numbers, dtype=np.float64)
+
+        estimated_blocks = np.interp(query, sampled_timestamps, sampled_blocks)
+        before_first = query < sampled_timestamps[0]
+        after_last = query > sampled_timestamps[-1]
+        estimated_blocks[before_first] = sampled_blocks[0] + (query[before_first] - sampled_timestamps[0]) / BASE_BLOCK_TIME_SECONDS
+        estimated_blocks[after_last] = sampled_blocks[-1] + (query[after_last] - sampled_timestamps[-1]) / BASE_BLOCK_TIME_SECONDS
+
+        return np.floor(estimated_blocks).astype(np.int64).tolist()
+
+    def _sample_block(self, client, block_number: int) -> bool:
+        try:
+            block = client.eth.get_block(block_number)
+            self.add_sample(int(block['number']), int(block['timestamp']))
+            return True
+        except Exception as e:
+            logger.error(f"BlockTimestampIndex - Error sampling block {block_number}: {e}")
+            return False
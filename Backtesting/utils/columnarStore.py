@@ -0,0 +1,138 @@
+from GlobalUtils.logger import logger
+import pandas as pd
+import numpy as np
+import shutil
+import json
+import os
+
+HISTORICAL_DATA_ROOT = 'Backtesting/MasterBacktester/historicalData'
+MANIFEST_FILENAME = 'manifest.json'
+COLUMN_FILE_SUFFIX = '.bin'
+
+class ColumnarStore:
+    """
+    Per-symbol historical data stored as one fixed-width, little-endian file per column plus a manifest
+    holding the dtypes and row count. Rows are kept sorted by block_number so readers can binary search.
+    Appends only write past the last committed row and the manifest is replaced last, so a torn append is
+    ignored and trimmed on the next write.
+    """
+    def __init__(self, exchange: str, schema: dict, root: str = HISTORICAL_DATA_ROOT):
+        self.exchange = exchange
+        self.schema = {column: np.dtype(dtype).newbyteorder('<') for column, dtype in schema.items()}
+        self.directory = os.path.join(root, exchange)
+
+    def get_symbol_directory(self, symbol: str) -> str:
+        return os.path.join(self.directory, symbol)
+
+    def get_column_path(self, symbol: str, column: str) -> str:
+        return os.path.join(self.get_symbol_directory(symbol), column + COLUMN_FILE_SUFFIX)
+
+    def exists(self, symbol: str) -> bool:
+        return os.path.exists(os.path.join(self.get_symbol_directory(symbol), MANIFEST_FILENAME))
+
+    def load_manifest(self, symbol: str) -> dict:
+        with open(os.path.join(self.get_symbol_directory(symbol), MANIFEST_FILENAME), 'r') as file:
+            return json.load(file)
+
+    def get_row_count(self, symbol: str) -> int:
+        return self.load_manifest(symbol)['rows'] if self.exists(symbol) else 0
+
+    def write(self, symbol: str, rows: list):
+        """Replaces a symbol's data with rows, building the new columns beside the old ones and swapping them in."""
+        self.write_columns(symbol, self.build_columns(rows))
+
+    def write_columns(self, symbol: str, columns: dict):
+        symbol_directory = self.get_symbol_directory(symbol)
+        staging_directory = symbol_directory + '.tmp'
+        shutil.rmtree(staging_directory, ignore_errors=True)
+        os.makedirs(staging_directory)
+
+        for column, values in columns.items():
+            values.tofile(os.path.join(staging_directory, column + COLUMN_FILE_SUFFIX))
+        row_count = len(next(iter(columns.values())))
+        self._write_manifest(staging_directory, row_count)
+
+        shutil.rmtree(symbol_directory, ignore_errors=True)
+        os.replace(staging_directory, symbol_directory)
+        logger.info(f"ColumnarStore - Wrote {row_count} {self.exchange} rows for {symbol}.")
+
+    def append(self, symbol: str, rows: list):
+        if not rows:
+            return
+        if not self.exists(symbol):
+            self.write(symbol, rows)
+            return
+
+        row_count = self.get_row_count(symbol)
+        columns = self.build_columns(rows)
+        appended_rows = len(next(iter(columns.values())))
+        last_block = self.get_last_block(symbol)
+        if appended_rows and last_block is not None and columns['block_number'][0] < last_block:
+            existing_columns = self.read_columns(symbol, list(self.schema))
+            merged_columns = {column: np.concatenate([existing_columns[column], columns[column]]) for column in self.schema}
+            self.write_columns(symbol, sort_columns_by_block(merged_columns))
+            logger.info(f"ColumnarStore - Merged {appended_rows} out-of-order {self.exchange} rows for {symbol}.")
+            return
+
+        for column, values in columns.items():
+            with open(self.get_column_path(symbol, column), 'r+b') as file:
+                file.truncate(row_count * values.itemsize)
+                file.seek(0, os.SEEK_END)
+                values.tofile(file)
+        self._write_manifest(self.get_symbol_directory(symbol), row_count + appended_rows)
+        logger.info(f"ColumnarStore - Appended {appended_rows} {self.exchange} rows for {symbol}.")
+
+    def read_columns(self, symbol: str, columns: list = None) -> dict:
+        manifest = self.load_manifest(symbol)
+        return {
+            column: np.fromfile(self.get_column_path(symbol, column), dtype=np.dtype(manifest['columns'][column]), count=manifest['rows'])
+            for column in (columns or manifest['columns'])
+        }
+
+    def read_dataframe(self, symbol: str, columns: list = None) -> pd.DataFrame:
+        return pd.DataFrame(self.read_columns(symbol, columns), copy=False)
+
+    def get_last_block(self, symbol: str):
+        row_count = self.get_row_count(symbol)
+        if row_count == 0:
+            return None
+        dtype = self.schema['block_number']
+        with open(self.get_column_path(symbol, 'block_number'), 'rb') as file:
+            file.seek((row_count - 1) * dtype.itemsize)
+            return int(np.frombuffer(file.read(dtype.itemsize), dtype=dtype)[0])
+
+    def import_json(self, symbol: str, json_path: str) -> bool:
+        """One-off conversion of a legacy JSON history file into this store."""
+        if not os.path.exists(json_path):
+            return False
+        with open(json_path, 'r') as file:
+            rows = json.load(file)
+        self.write(symbol, rows)
+        return True
+
+    def build_columns(self, rows: list) -> dict:
+        complete_rows = [row for row in rows if all(row.get(column) is not None for column in self.schema)]
+        if len(complete_rows) < len(rows):
+            logger.info(f"ColumnarStore - Skipped {len(rows) - len(complete_rows)} {self.exchange} rows with missing columns.")
+        columns = {
+            column: np.fromiter((dtype.type(row[column]) for row in complete_rows), dtype=dtype, count=len(complete_rows))
+            for column, dtype in self.schema.items()
+        }
+        return sort_columns_by_block(columns)
+
+    def _write_manifest(self, directory: str, row_count: int):
+        manifest = {
+            'rows': row_count,
+            'columns': {column: dtype.str for column, dtype in self.schema.items()}
+        }
+        manifest_path = os.path.join(directory, MANIFEST_FILENAME)
+        with open(manifest_path + '.tmp', 'w') as file:
+            json.dump(manifest, file, indent=4)
+        os.replace(manifest_path + '.tmp', manifest_path)
+
+def sort_columns_by_block(columns: dict) -> dict:
+    block_numbers = columns['block_number']
+    if len(block_numbers) < 2 or not np.any(block_numbers[1:] < block_numbers[:-1]):
+        return columns
+    order = np.argsort(block_numbers, kind='stable')
+    return {column: values[order] for column, values in columns.items()}
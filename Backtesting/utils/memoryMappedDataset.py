@@ -0,0 +1,49 @@
+from Backtesting.utils.columnarStore import ColumnarStore
+from GlobalUtils.logger import logger
+import pandas as pd
+import numpy as np
+
+class MemoryMappedDataset:
+    """
+    Read-only view of a symbol's columnar history. Columns are memory-mapped, so block-range slices are
+    views into the OS page cache rather than copies, and concurrent backtest processes share the same pages.
+    """
+    def __init__(self, store: ColumnarStore, symbol: str, columns: list = None):
+        manifest = store.load_manifest(symbol)
+        self.symbol = symbol
+        self.row_count = manifest['rows']
+        column_names = set(columns or manifest['columns']) | {'block_number'}
+        self.columns = {
+            column: map_column(store.get_column_path(symbol, column), np.dtype(manifest['columns'][column]), self.row_count)
+            for column in manifest['columns'] if column in column_names
+        }
+        self.block_numbers = self.columns['block_number']
+        if self.row_count > 1 and np.any(self.block_numbers[1:] < self.block_numbers[:-1]):
+            raise ValueError(f"MemoryMappedDataset - Block numbers for {symbol} are not sorted, block-range slicing needs sorted data")
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    def get_index_range(self, start_block: int, end_block: int) -> tuple:
+        start_index = int(np.searchsorted(self.block_numbers, start_block, side='left'))
+        end_index = int(np.searchsorted(self.block_numbers, end_block, side='right'))
+        return start_index, end_index
+
+    def slice(self, start_block: int, end_block: int, columns: list = None) -> dict:
+        """Views of each column for rows with start_block <= block_number <= end_block."""
+        start_index, end_index = self.get_index_range(start_block, end_block)
+        return {column: self.columns[column][start_index:end_index] for column in (columns or self.columns)}
+
+    def get_frame(self, start_block: int = None, end_block: int = None, columns: list = None) -> pd.DataFrame:
+        start_block = start_block if start_block is not None else np.iinfo(np.int64).min
+        end_block = end_block if end_block is not None else np.iinfo(np.int64).max
+        return pd.DataFrame(self.slice(start_block, end_block, columns), copy=False)
+
+def map_column(path: str, dtype: np.dtype, row_count: int) -> np.ndarray:
+    if row_count == 0:
+        return np.empty(0, dtype=dtype)
+    try:
+        return np.memmap(path, dtype=dtype, mode='r', shape=(row_count,))
+    except (OSError, ValueError) as e:
+        logger.error(f"MemoryMappedDataset - Error mapping column file {path}: {e}")
+        raise e
@@ -0,0 +1,62 @@
+from GlobalUtils.globalUtils import initialise_client, BLOCKS_PER_HOUR_BASE
+from GlobalUtils.logger import logger
+import threading
+import time
+import os
+
+BASE_BLOCK_TIME_SECONDS = 3600 / BLOCKS_PER_HOUR_BASE
+BLOCK_CLOCK_RESYNC_SECONDS = float(os.getenv('BLOCK_CLOCK_RESYNC_SECONDS', 300))
+
+class BlockClock:
+    _anchor_block = None
+    _anchor_timestamp = None
+    _last_sync_time = None
+    _last_drift_blocks = 0
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_current_block(cls) -> int:
+        now = time.time()
+        if cls._anchor_block is None or now - cls._last_sync_time >= BLOCK_CLOCK_RESYNC_SECONDS:
+            cls.sync()
+
+        with cls._lock:
+            if cls._anchor_block is None:
+                logger.error('BlockClock - No chain anchor available, cannot estimate current block number.')
+                return None
+            return cls._extrapolate(now)
+
+    @classmethod
+    def sync(cls):
+        try:
+            client = initialise_client()
+            latest_block = client.eth.get_block('latest')
+            block_number = int(latest_block['number'])
+            block_timestamp = int(latest_block['timestamp'])
+        except Exception as e:
+            with cls._lock:
+                if cls._anchor_block is None:
+                    logger.error(f'BlockClock - Error while syncing with BASE network, no anchor yet so retrying on next call: {e}')
+                    return
+                logger.error(f'BlockClock - Error while syncing with BASE network, continuing to extrapolate: {e}')
+                cls._last_sync_time = time.time()
+            return
+
+        with cls._lock:
+            if cls._anchor_block is not None:
+                estimated_block = cls._extrapolate(block_timestamp)
+                cls._last_drift_blocks = block_number - estimated_block
+                if cls._last_drift_blocks != 0:
+                    logger.info(f'BlockClock - Corrected drift of {cls._last_drift_blocks} blocks on resync.')
+            cls._anchor_block = block_number
+            cls._anchor_timestamp = block_timestamp
+            cls._last_sync_time = time.time()
+
+    @classmethod
+    def get_last_drift(cls) -> int:
+        return cls._last_drift_blocks
+
+    @classmethod
+    def _extrapolate(cls, timestamp: float) -> int:
+        elapsed_seconds = max(timestamp - cls._anchor_timestamp, 0)
+        return cls._anchor_block + int(elapsed_seconds // BASE_BLOCK_TIME_SECONDS)
@@ -0,0 +1,46 @@
+from GlobalUtils.logger import logger
+import threading
+
+class ClientRegistry:
+    """Process-wide shared clients. Clients that keep nonce or account state also get a transaction lock that callers hold while sending."""
+    _clients = {}
+    _locks = {}
+    _transaction_locks = {}
+    _registry_lock = threading.Lock()
+
+    @classmethod
+    def get_or_create(cls, name: str, factory):
+        client = cls._clients.get(name)
+        if client is not None:
+            return client
+
+        with cls._get_lock(name):
+            client = cls._clients.get(name)
+            if client is None:
+                client = factory()
+                if client is not None:
+                    cls._clients[name] = client
+                    logger.info(f"ClientRegistry - Initialised shared client: {name}.")
+            return client
+
+    @classmethod
+    def get_transaction_lock(cls, name: str) -> threading.RLock:
+        with cls._registry_lock:
+            if name not in cls._transaction_locks:
+                cls._transaction_locks[name] = threading.RLock()
+            return cls._transaction_locks[name]
+
+    @classmethod
+    def reset(cls, name: str = None):
+        with cls._registry_lock:
+            if name is None:
+                cls._clients.clear()
+            else:
+                cls._clients.pop(name, None)
+
+    @classmethod
+    def _get_lock(cls, name: str) -> threading.Lock:
+        with cls._registry_lock:
+            if name not in cls._locks:
+                cls._locks[name] = threading.Lock()
+            return cls._locks[name]
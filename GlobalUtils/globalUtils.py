@@ -2,9 +2,13 @@ from web3 import *
 import os
 from dotenv import load_dotenv
 import requests
+import threading
+import time
 from decimal import Decimal, InvalidOperation
 from enum import Enum
 from GlobalUtils.logger import *
+from pubsub import pub
+from GlobalUtils.clientRegistry import ClientRegistry
 from synthetix import Synthetix
 from APICaller.Synthetix.SynthetixCaller import get_synthetix_client
 
@@ -12,17 +16,26 @@ load_dotenv()
 
 BLOCKS_PER_DAY_BASE = 43200
 BLOCKS_PER_HOUR_BASE = 1800
+BINANCE_FUNDING_COORDINATION_BLOCK = 13664526
+BINANCE_FUNDING_INTERVAL_BLOCKS = 14400
 
 class EventsDirectory(Enum):
     CLOSE_ALL_POSITIONS = "close_positions"
     OPPORTUNITY_FOUND = "opportunity_found"
+    OPPORTUNITIES_RANKED = "opportunities_ranked"
+    PRICES_UPDATED = "prices_updated"
+    FUNDING_RATES_UPDATED = "funding_rates_updated"
     POSITION_OPENED = "position_opened"
     POSITION_CLOSED = "position_closed"
     TRADE_LOGGED = "trade_logged"
 
 def initialise_client() -> Web3:
+    return ClientRegistry.get_or_create('web3', create_web3_client)
+
+def create_web3_client() -> Web3:
     try:
-        client = Web3(Web3.HTTPProvider(os.getenv('BASE_PROVIDER_RPC')))
+        session = requests.Session()
+        client = Web3(Web3.HTTPProvider(os.getenv('BASE_PROVIDER_RPC'), session=session))
     except Exception as e:
         logger.info(f"GlobalUtils - Error initialising Web3 client: {e}")
         return None 
@@ -40,26 +53,98 @@ def get_gas_price() -> float:
     return 0.0
 
 def get_price_from_pyth(client: Synthetix, symbol: str):
+    prices = fetch_prices_from_pyth(client, [symbol])
+    price = prices.get(symbol)
+    if price is None:
+        logger.error(f"GlobalUtils - Price missing in Pyth response for {symbol}.")
+    return price
+
+def fetch_prices_from_pyth(client: Synthetix, symbols: list) -> dict:
     try:
-        response = client.pyth.get_price_from_symbols([symbol])
-        if 'price' in response:
-            price: float = response['price']
-            return price
-        else:
-            logger.error(f"GlobalUtils - 'price' key missing in Pyth response for {symbol}.")
-            return None
+        response = client.pyth.get_price_from_symbols(symbols)
+        if not response or 'meta' not in response:
+            logger.error(f"GlobalUtils - 'meta' key missing in Pyth response for {symbols}.")
+            return {}
+
+        prices = {}
+        for feed_data in response['meta'].values():
+            prices[feed_data['symbol']] = float(feed_data['price'])
+        return prices
     except KeyError as ke:
-        logger.error(f"GlobalUtils - KeyError accessing Pyth response data for {symbol}: {ke}")
-        return None
+        logger.error(f"GlobalUtils - KeyError accessing Pyth response data for {symbols}: {ke}")
+        return {}
     except Exception as e:
-        logger.error(f"GlobalUtils - Unexpected error fetching asset price for {symbol} from Pyth: {e}")
-        return None
+        logger.error(f"GlobalUtils - Unexpected error fetching asset prices for {symbols} from Pyth: {e}")
+        return {}
+
+class PriceCache:
+    _prices = {}
+    _lock = threading.Lock()
+    _ttl_seconds = float(os.getenv('PRICE_CACHE_TTL_SECONDS', 5))
+    hits = 0
+    misses = 0
+    oracle_requests = 0
+
+    @classmethod
+    def set_ttl(cls, ttl_seconds: float):
+        cls._ttl_seconds = float(ttl_seconds)
+
+    @classmethod
+    def get_price(cls, symbol: str) -> float:
+        return cls.get_prices([symbol]).get(symbol)
+
+    @classmethod
+    def get_prices(cls, symbols: list) -> dict:
+        now = time.monotonic()
+        prices = {}
+        stale_symbols = []
+        with cls._lock:
+            for symbol in dict.fromkeys(symbols):
+                cached = cls._prices.get(symbol)
+                if cached is not None and now - cached[1] <= cls._ttl_seconds:
+                    prices[symbol] = cached[0]
+                    cls.hits += 1
+                else:
+                    stale_symbols.append(symbol)
+                    cls.misses += 1
+
+        if stale_symbols:
+            fetched_prices = fetch_prices_from_pyth(get_synthetix_client(), stale_symbols)
+            fetched_at = time.monotonic()
+            with cls._lock:
+                cls.oracle_requests += 1
+                for symbol, price in fetched_prices.items():
+                    cls._prices[symbol] = (price, fetched_at)
+            for symbol in stale_symbols:
+                if symbol in fetched_prices:
+                    prices[symbol] = fetched_prices[symbol]
+                else:
+                    logger.error(f"GlobalUtils - No Pyth price returned for {symbol}.")
+            if fetched_prices:
+                pub.sendMessage(EventsDirectory.PRICES_UPDATED.value, prices=fetched_prices)
+
+        return prices
+
+    @classmethod
+    def get_stats(cls) -> dict:
+        with cls._lock:
+            return {
+                'hits': cls.hits,
+                'misses': cls.misses,
+                'oracle_requests': cls.oracle_requests,
+                'cached_symbols': len(cls._prices)
+            }
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._prices.clear()
 
 
 def calculate_transaction_cost_usd(total_gas: int) -> float:
     try:
         gas_price_gwei = get_gas_price()
-        eth_price_usd = get_price_from_pyth('ETH')
+        eth_price_usd = PriceCache.get_price('ETH')
         gas_cost_eth = (gas_price_gwei * total_gas) / Decimal('1e9')
         transaction_cost_usd = float(gas_cost_eth) * eth_price_usd
         return transaction_cost_usd
@@ -69,8 +154,7 @@ def calculate_transaction_cost_usd(total_gas: int) -> float:
 
 def get_asset_amount_for_given_dollar_amount(asset: str, dollar_amount: float) -> float:
     try:
-        client = get_synthetix_client()
-        asset_price = get_price_from_pyth(client, asset)
+        asset_price = PriceCache.get_price(asset)
         asset_amount = dollar_amount / asset_price
         return asset_amount
     except ZeroDivisionError:
@@ -79,8 +163,7 @@ def get_asset_amount_for_given_dollar_amount(asset: str, dollar_amount: float) -
 
 def get_dollar_amount_for_given_asset_amount(asset: str, asset_amount: float) -> float:
     try:
-        client = get_synthetix_client()
-        asset_price = get_price_from_pyth(client, asset)
+        asset_price = PriceCache.get_price(asset)
         dollar_amount = asset_amount * asset_price
         return dollar_amount
     except Exception as e:
@@ -128,8 +211,8 @@ def get_base_block_number() -> int:
 
 def get_binance_funding_event_schedule(current_block_number: int) -> list:
     try:
-        coordination_block = 13664526
-        interval_in_blocks = 14400
+        coordination_block = BINANCE_FUNDING_COORDINATION_BLOCK
+        interval_in_blocks = BINANCE_FUNDING_INTERVAL_BLOCKS
 
         intervals_since_last_event = (current_block_number - coordination_block) // interval_in_blocks
         next_funding_event = coordination_block + (intervals_since_last_event + 1) * interval_in_blocks
@@ -21,4 +21,10 @@ class TopicDefinitionProvider:
     def getDefn(self, topicNameTuple):
         if topicNameTuple == ('opportunity_found',):
             return {'opportunity': "arbitrage opportunity found."}
+        if topicNameTuple == ('opportunities_ranked',):
+            return {'opportunities': "top ranked arbitrage opportunities."}
+        if topicNameTuple == ('prices_updated',):
+            return {'prices': "freshly fetched oracle prices by symbol."}
+        if topicNameTuple == ('funding_rates_updated',):
+            return {'funding_rates': "latest funding rates across exchanges."}
         return None
\ No newline at end of file
@@ -23,10 +23,11 @@ class Main:
     
     def search_for_opportunities(self):
         try:
-            funding_rates = self.caller.get_funding_rates()
-            opportunities = self.matching_engine.find_delta_neutral_arbitrage_opportunities(funding_rates)
-            opportunity = self.profitability_checker.find_most_profitable_opportunity(opportunities)
+            funding_rates = self.caller.get_funding_rates_concurrently()
+            opportunities, changed_symbols = self.matching_engine.find_delta_neutral_arbitrage_opportunities_incremental(funding_rates)
+            opportunity = self.profitability_checker.find_most_profitable_opportunity_incremental(opportunities, changed_symbols)
             if opportunity is not None:
+                pub.sendMessage(EventsDirectory.OPPORTUNITIES_RANKED.value, opportunities=self.profitability_checker.ranked_opportunities)
                 pub.sendMessage(EventsDirectory.OPPORTUNITY_FOUND.value, opportunity=opportunity)
             else:
                 logger.info("MainClass - Error while searching for opportunity.")
@@ -1,9 +1,15 @@
 from MatchingEngine.MatchingEngineUtils import *
 from GlobalUtils.logger import *
+from GlobalUtils.blockClock import BlockClock
+from APICaller.master.MasterUtils import get_target_exchanges
+import time
 
 class matchingEngine:
     def __init__(self):
-        pass
+        self.exchanges = get_target_exchanges()
+        self.previous_snapshot = {}
+        self.opportunities_by_symbol = {}
+        self.last_full_match_time = None
     
     def find_arbitrage_opportunities_for_symbol(self, sorted_rates):
         try:
@@ -13,7 +19,7 @@ class matchingEngine:
             synthetix_dict = {normalize_symbol(rate['symbol']): rate for rate in synthetix_rates}
             binance_dict = {normalize_symbol(rate['symbol']): rate for rate in binance_rates}
 
-            block_number = get_base_block_number()
+            block_number = BlockClock.get_current_block()
             
             arbitrage_opportunities = []
             for symbol in synthetix_dict:
@@ -53,9 +59,79 @@ class matchingEngine:
             return None
 
     def find_delta_neutral_arbitrage_opportunities(self, funding_rates):
+        try:
+            return self.find_arbitrage_opportunities_from_matrix(funding_rates)
+        except Exception as e:
+            logger.error(f'MatchingEngine - Error while matching funding rate matrix, falling back to per-symbol matching: {e}')
+            return self.find_arbitrage_opportunities_by_symbol(funding_rates)
+
+    def find_delta_neutral_arbitrage_opportunities_incremental(self, funding_rates, force_full_match=False):
+        """Re-matches only symbols whose rates, skew or velocity moved beyond tolerance since they were last matched. Returns (opportunities, changed_symbols)."""
+        try:
+            snapshot = build_funding_rate_snapshot(funding_rates)
+            now = time.time()
+            is_full_match_due = self.last_full_match_time is None or now - self.last_full_match_time >= FULL_REMATCH_INTERVAL_SECONDS
+            if force_full_match or is_full_match_due:
+                changed_symbols = set(snapshot.keys())
+                self.last_full_match_time = now
+            else:
+                changed_symbols = get_changed_symbols(self.previous_snapshot, snapshot)
+
+            for symbol in set(self.previous_snapshot.keys()) - set(snapshot.keys()):
+                self.previous_snapshot.pop(symbol, None)
+                self.opportunities_by_symbol.pop(symbol, None)
+
+            if changed_symbols:
+                changed_rates = [rate for rate in funding_rates if normalize_symbol(rate['symbol']) in changed_symbols]
+                for symbol in changed_symbols:
+                    self.previous_snapshot[symbol] = snapshot[symbol]
+                    self.opportunities_by_symbol.pop(symbol, None)
+                for opportunity in self.find_delta_neutral_arbitrage_opportunities(changed_rates):
+                    self.opportunities_by_symbol[opportunity['symbol']] = opportunity
+
+            logger.info(f'MatchingEngine - Re-matched {len(changed_symbols)} of {len(snapshot)} symbols.')
+            return list(self.opportunities_by_symbol.values()), changed_symbols
+        except Exception as e:
+            logger.error(f'MatchingEngine - Error during incremental matching, running a full match: {e}')
+            self.previous_snapshot = {}
+            self.opportunities_by_symbol = {}
+            opportunities = self.find_delta_neutral_arbitrage_opportunities(funding_rates)
+            return opportunities, {opportunity['symbol'] for opportunity in opportunities}
+
+    def find_arbitrage_opportunities_by_symbol(self, funding_rates):
         opportunities = []
         rates_by_symbol = group_by_symbol(funding_rates)
         for symbol, rates in rates_by_symbol.items():
             sorted_rates = sort_funding_rates_by_value(rates)
             opportunities.extend(self.find_arbitrage_opportunities_for_symbol(sorted_rates))
-        return opportunities
\ No newline at end of file
+        return opportunities
+
+    def find_arbitrage_opportunities_from_matrix(self, funding_rates):
+        exchanges = self.exchanges + sorted({rate['exchange'] for rate in funding_rates} - set(self.exchanges))
+        matrix, symbols, entries = build_funding_rate_matrix(funding_rates, exchanges)
+        if not symbols or SKEW_EXCHANGE not in exchanges:
+            return []
+
+        long_indices, short_indices, is_tradeable = find_best_venue_pairs(matrix, exchanges.index(SKEW_EXCHANGE))
+        block_number = BlockClock.get_current_block()
+
+        arbitrage_opportunities = []
+        for symbol_index in np.flatnonzero(is_tradeable):
+            symbol = symbols[symbol_index]
+            long_exchange = exchanges[long_indices[symbol_index]]
+            short_exchange = exchanges[short_indices[symbol_index]]
+            skew_entry = entries[(SKEW_EXCHANGE, symbol)]
+
+            arbitrage_opportunity = {
+                'long_exchange': long_exchange,
+                'short_exchange': short_exchange,
+                'symbol': symbol,
+                'long_exchange_funding_rate': float(matrix[long_indices[symbol_index], symbol_index]),
+                'short_exchange_funding_rate': float(matrix[short_indices[symbol_index], symbol_index]),
+                'skew': skew_entry.get('skew'),
+                'funding_velocity': skew_entry.get('funding_velocity'),
+                'block_number': block_number
+            }
+            arbitrage_opportunities.append(arbitrage_opportunity)
+
+        return arbitrage_opportunities
\ No newline at end of file
@@ -1,4 +1,11 @@
 from GlobalUtils.globalUtils import *
+import numpy as np
+
+SNAPSHOT_FIELDS = ['funding_rate', 'skew', 'funding_velocity']
+RATE_CHANGE_ABSOLUTE_TOLERANCE = 1e-8
+RATE_CHANGE_RELATIVE_TOLERANCE = 0.001
+FULL_REMATCH_INTERVAL_SECONDS = 300
+SKEW_EXCHANGE = 'Synthetix'
 
 def group_by_symbol(funding_rates):
     rates_by_symbol = {}
@@ -8,4 +15,71 @@ def group_by_symbol(funding_rates):
     return rates_by_symbol
 
 def sort_funding_rates_by_value(rates):
-    return sorted(rates, key=lambda x: float(x['funding_rate']))
\ No newline at end of file
+    return sorted(rates, key=lambda x: float(x['funding_rate']))
+
+def build_funding_rate_matrix(funding_rates, exchanges: list):
+    """Returns an (exchange x symbol) matrix of funding rates, with NaN where a venue does not list a symbol."""
+    rates_by_symbol = group_by_symbol(funding_rates)
+    symbols = list(rates_by_symbol.keys())
+    exchange_index = {exchange: index for index, exchange in enumerate(exchanges)}
+    symbol_index = {symbol: index for index, symbol in enumerate(symbols)}
+
+    matrix = np.full((len(exchanges), len(symbols)), np.nan, dtype=np.float64)
+    entries = {}
+    for symbol, rates in rates_by_symbol.items():
+        for entry in rates:
+            exchange = entry['exchange']
+            if exchange not in exchange_index:
+                continue
+            matrix[exchange_index[exchange], symbol_index[symbol]] = float(entry['funding_rate'])
+            entries[(exchange, symbol)] = entry
+
+    return matrix, symbols, entries
+
+def find_best_venue_pairs(matrix, anchor_index: int):
+    """
+    Pairs each symbol's anchor venue, the one whose skew and velocity the profitability scorer models, with the
+    other venue whose rate is furthest from it; the lower-rate venue goes long. Symbols the anchor does not list
+    are not tradeable, so every pair has a skew.
+    """
+    anchor_rates = matrix[anchor_index]
+    counter_matrix = matrix.copy()
+    counter_matrix[anchor_index] = np.nan
+    spreads = np.abs(counter_matrix - anchor_rates)
+
+    has_counter_venue = ~np.all(np.isnan(spreads), axis=0)
+    counter_indices = np.argmax(np.where(np.isnan(spreads), -np.inf, spreads), axis=0)
+    counter_rates = counter_matrix[counter_indices, np.arange(matrix.shape[1])]
+    is_anchor_long = anchor_rates <= counter_rates
+
+    long_indices = np.where(is_anchor_long, anchor_index, counter_indices)
+    short_indices = np.where(is_anchor_long, counter_indices, anchor_index)
+    is_tradeable = ~np.isnan(anchor_rates) & has_counter_venue
+    return long_indices, short_indices, is_tradeable
+
+def build_funding_rate_snapshot(funding_rates) -> dict:
+    snapshot = {}
+    for entry in funding_rates:
+        symbol = normalize_symbol(entry['symbol'])
+        symbol_snapshot = snapshot.setdefault(symbol, {})
+        for field in SNAPSHOT_FIELDS:
+            if entry.get(field) is not None:
+                symbol_snapshot[(entry['exchange'], field)] = float(entry[field])
+    return snapshot
+
+def has_value_moved(previous_value: float, current_value: float) -> bool:
+    tolerance = max(RATE_CHANGE_ABSOLUTE_TOLERANCE, RATE_CHANGE_RELATIVE_TOLERANCE * abs(previous_value))
+    return abs(current_value - previous_value) > tolerance
+
+def get_changed_symbols(previous_snapshot: dict, current_snapshot: dict) -> set:
+    changed_symbols = set()
+    for symbol, current_values in current_snapshot.items():
+        previous_values = previous_snapshot.get(symbol)
+        if previous_values is None or previous_values.keys() != current_values.keys():
+            changed_symbols.add(symbol)
+            continue
+        for key, current_value in current_values.items():
+            if has_value_moved(previous_values[key], current_value):
+                changed_symbols.add(symbol)
+                break
+    return changed_symbols
@@ -0,0 +1,159 @@
+from GlobalUtils.globalUtils import BLOCKS_PER_DAY_BASE, BLOCKS_PER_HOUR_BASE, BINANCE_FUNDING_COORDINATION_BLOCK, BINANCE_FUNDING_INTERVAL_BLOCKS
+from GlobalUtils.marketDirectory import MarketDirectory
+from GlobalUtils.logger import logger
+import numpy as np
+
+BINANCE_FUNDING_EVENTS_CONSIDERED = 3
+SCORABLE_EXCHANGE_PAIR = {'Synthetix', 'Binance'}
+
+def build_opportunity_arrays(opportunities: list, prices: dict, premiums: list, trade_size_usd: float) -> dict:
+    """
+    Opportunities that are not a Synthetix/Binance pair, lack market parameters or carry a missing skew or rate are
+    left out; 'opportunities' holds the rows the arrays describe.
+    """
+    scorable_opportunities = []
+    scorable_premiums = []
+    market_params = []
+    long_rates = []
+    short_rates = []
+    skews = []
+    for opportunity, premium in zip(opportunities, premiums):
+        symbol = opportunity.get('symbol')
+        try:
+            if {opportunity['long_exchange'], opportunity['short_exchange']} != SCORABLE_EXCHANGE_PAIR:
+                raise ValueError(f"scoring only supports {sorted(SCORABLE_EXCHANGE_PAIR)}, got {opportunity['long_exchange']}/{opportunity['short_exchange']}")
+            long_rate = float(opportunity['long_exchange_funding_rate'])
+            short_rate = float(opportunity['short_exchange_funding_rate'])
+            skew = float(opportunity['skew'])
+            params = MarketDirectory.get_market_params(symbol)
+        except (ValueError, TypeError, KeyError) as e:
+            logger.error(f"BatchProfitabilityUtils - Skipping {symbol} in batch scoring: {e}")
+            continue
+        scorable_opportunities.append(opportunity)
+        scorable_premiums.append(premium)
+        market_params.append(params)
+        long_rates.append(long_rate)
+        short_rates.append(short_rate)
+        skews.append(skew)
+    opportunities = scorable_opportunities
+    premiums = scorable_premiums
+
+    symbols = [opportunity['symbol'] for opportunity in opportunities]
+    is_synthetix_long = np.array([opportunity['long_exchange'] == 'Synthetix' for opportunity in opportunities], dtype=bool)
+    long_rates = np.array(long_rates, dtype=np.float64)
+    short_rates = np.array(short_rates, dtype=np.float64)
+    asset_prices = np.array([prices.get(symbol, np.nan) for symbol in symbols], dtype=np.float64)
+
+    return {
+        'opportunities': opportunities,
+        'symbols': symbols,
+        'is_synthetix_long': is_synthetix_long,
+        'synthetix_rates': np.where(is_synthetix_long, long_rates, short_rates),
+        'binance_rates': np.where(is_synthetix_long, short_rates, long_rates),
+        'skews': np.array(skews, dtype=np.float64),
+        'velocity_constants': np.array([params['max_funding_velocity'] / params['skew_scale'] for params in market_params], dtype=np.float64),
+        'maker_fees': np.array([params['maker_fee'] for params in market_params], dtype=np.float64),
+        'taker_fees': np.array([params['taker_fee'] for params in market_params], dtype=np.float64),
+        'premiums': np.array([premium if premium is not None else 0.0 for premium in premiums], dtype=np.float64),
+        'prices': asset_prices,
+        'sizes': (trade_size_usd / asset_prices) / 2,
+    }
+
+def calculate_funding_accrual_vectorized(initial_rates, funding_velocities, sizes, is_long, total_blocks, blocks_per_day: int):
+    """Array form of calculate_funding_accrual in checkProfitabilityUtils."""
+    rate_change_per_block = funding_velocities / blocks_per_day
+    has_velocity = rate_change_per_block != 0
+    safe_rate_change = np.where(has_velocity, rate_change_per_block, 1.0)
+
+    zero_crossing_block = np.where(has_velocity, -initial_rates / safe_rate_change, 0.0)
+    split_block = np.clip(np.floor(zero_crossing_block), 0, total_blocks)
+    split_block = np.where(has_velocity, split_block, 0)
+    before_crossing_sign = np.where(rate_change_per_block > 0, -1.0, 1.0)
+    after_crossing_sign = np.where(has_velocity, -before_crossing_sign, np.sign(initial_rates))
+
+    rate_sum_before_crossing = _sum_linear_funding_rates(initial_rates, rate_change_per_block, 1, split_block)
+    rate_sum_after_crossing = _sum_linear_funding_rates(initial_rates, rate_change_per_block, split_block + 1, total_blocks)
+
+    total_funding = (
+        _get_funding_direction_factors(before_crossing_sign, is_long) * rate_sum_before_crossing
+        + _get_funding_direction_factors(after_crossing_sign, is_long) * rate_sum_after_crossing
+    )
+    return total_funding * sizes / blocks_per_day
+
+def score_opportunity_arrays(arrays: dict, current_block_number: int, default_trade_duration_hours: float) -> dict:
+    try:
+        is_synthetix_long = arrays['is_synthetix_long']
+        direction = np.where(is_synthetix_long, 1.0, -1.0)
+        skews = arrays['skews']
+        sizes = arrays['sizes']
+
+        is_maker = np.where(is_synthetix_long, skews < 0, skews > 0)
+        fees = np.where(is_maker, arrays['maker_fees'], arrays['taker_fees'])
+        size_after_fee = sizes * (1 - fees)
+
+        hours_to_neutralize = _estimate_hours_to_neutralize(
+            arrays['synthetix_rates'],
+            arrays['velocity_constants'] * (skews + size_after_fee * direction),
+            default_trade_duration_hours
+        )
+
+        adjusted_synthetix_size = size_after_fee * (1 + arrays['premiums']) * direction
+        synthetix_velocities = arrays['velocity_constants'] * (skews + adjusted_synthetix_size)
+        total_blocks = np.floor(BLOCKS_PER_HOUR_BASE * hours_to_neutralize) + 1
+        synthetix_profit_loss = calculate_funding_accrual_vectorized(
+            arrays['synthetix_rates'],
+            synthetix_velocities,
+            adjusted_synthetix_size,
+            is_synthetix_long,
+            total_blocks,
+            BLOCKS_PER_DAY_BASE
+        )
+
+        binance_profit_loss = _estimate_binance_profit(
+            arrays['binance_rates'],
+            sizes * -direction,
+            ~is_synthetix_long,
+            hours_to_neutralize,
+            current_block_number
+        )
+
+        total_profit_loss = synthetix_profit_loss + binance_profit_loss
+        profit_estimate_usd = total_profit_loss * arrays['prices']
+        ranking = np.argsort(-np.nan_to_num(profit_estimate_usd, nan=-np.inf), kind='stable')
+
+        return {
+            'hours_to_neutralize': hours_to_neutralize,
+            'snx_profit_loss': synthetix_profit_loss,
+            'binance_profit_loss': binance_profit_loss,
+            'total_profit_loss': total_profit_loss,
+            'profit_estimate_usd': profit_estimate_usd,
+            'ranking': ranking
+        }
+    except Exception as e:
+        logger.error(f'BatchProfitabilityUtils - Error scoring opportunity arrays: {e}')
+        return None
+
+def _estimate_hours_to_neutralize(funding_rates, funding_velocities, default_trade_duration_hours: float):
+    is_neutralizing = (funding_rates * funding_velocities) < 0
+    safe_velocities = np.where(is_neutralizing, funding_velocities, 1.0)
+    blocks_to_neutral = -funding_rates / (safe_velocities / BLOCKS_PER_DAY_BASE)
+    return np.where(is_neutralizing, blocks_to_neutral / BLOCKS_PER_HOUR_BASE, default_trade_duration_hours)
+
+def _estimate_binance_profit(funding_rates, sizes, is_long, time_period_hours, current_block_number: int):
+    intervals_since_last_event = (current_block_number - BINANCE_FUNDING_COORDINATION_BLOCK) // BINANCE_FUNDING_INTERVAL_BLOCKS
+    next_funding_event = BINANCE_FUNDING_COORDINATION_BLOCK + (intervals_since_last_event + 1) * BINANCE_FUNDING_INTERVAL_BLOCKS
+    end_block_number = current_block_number + BLOCKS_PER_HOUR_BASE * time_period_hours
+
+    events_in_window = np.floor((end_block_number - next_funding_event) / BINANCE_FUNDING_INTERVAL_BLOCKS) + 1
+    events_in_window = np.clip(events_in_window, 0, BINANCE_FUNDING_EVENTS_CONSIDERED)
+
+    pays_funding = (is_long & (funding_rates > 0)) | (~is_long & (funding_rates < 0))
+    direction_factors = np.where(pays_funding, -1.0, 1.0)
+    return events_in_window * funding_rates * sizes * direction_factors
+
+def _sum_linear_funding_rates(initial_rates, rate_change_per_block, first_block, last_block):
+    block_count = np.maximum(last_block - first_block + 1, 0)
+    return block_count * initial_rates + rate_change_per_block * (first_block + last_block) * block_count / 2
+
+def _get_funding_direction_factors(rate_signs, is_long):
+    return np.where((is_long & (rate_signs < 0)) | (~is_long & (rate_signs > 0)), -1.0, 1.0)
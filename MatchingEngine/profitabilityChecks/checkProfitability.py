@@ -1,9 +1,10 @@
 from GlobalUtils.globalUtils import *
 from GlobalUtils.logger import *
 from TxExecution.Master.MasterPositionController import MasterPositionController
-from Backtesting.Synthetix.SynthetixBacktesterUtils import calculate_adjusted_funding_rate
 from MatchingEngine.profitabilityChecks.checkProfitabilityUtils import *
+from MatchingEngine.profitabilityChecks.batchProfitabilityUtils import build_opportunity_arrays, score_opportunity_arrays
 from GlobalUtils.marketDirectory import MarketDirectory
+from GlobalUtils.blockClock import BlockClock
 import json
 from math import floor
 import os
@@ -13,10 +14,13 @@ class ProfitabilityChecker:
         self.position_controller = MasterPositionController()
         self.default_trade_duration = float(os.getenv('DEFAULT_TRADE_DURATION_HOURS'))
         self.default_trade_size_usd = float(os.getenv('DEFAULT_TRADE_SIZE_USD')) * float(self.position_controller.synthetix.leverage_factor)
+        self.premiums_by_symbol = {}
+        self.ranked_opportunities = []
     
     def find_most_profitable_opportunity(self, opportunities):
         enhanced_opportunities = []
         trade_size_usd = self.default_trade_size_usd
+        PriceCache.get_prices([opportunity['symbol'] for opportunity in opportunities])
 
         for opportunity in opportunities:
             symbol = opportunity['symbol']
@@ -43,7 +47,99 @@ class ProfitabilityChecker:
 
         return enhanced_opportunities[0]
 
-    def estimate_synthetix_profit(self, time_period_hours, size, opportunity):
+    def find_most_profitable_opportunity_batch(self, opportunities):
+        ranked_opportunities = self.score_opportunities_batch(opportunities)
+        if not ranked_opportunities:
+            logger.info("CheckProfitability - No profitable opportunities found.")
+            return None
+
+        self.save_ordered_opportunities(ranked_opportunities)
+        return ranked_opportunities[0]
+
+    def find_most_profitable_opportunity_incremental(self, opportunities, changed_symbols: set):
+        """Re-scores every opportunity against the current block and prices, fetching premiums only for symbols whose inputs moved."""
+        current_symbols = {opportunity['symbol'] for opportunity in opportunities}
+        for symbol in list(self.premiums_by_symbol.keys()):
+            if symbol not in current_symbols:
+                del self.premiums_by_symbol[symbol]
+
+        current_block = BlockClock.get_current_block()
+        for opportunity in opportunities:
+            opportunity['block_number'] = current_block
+
+        opportunities_to_price = [
+            opportunity for opportunity in opportunities
+            if opportunity['symbol'] in changed_symbols or opportunity['symbol'] not in self.premiums_by_symbol
+        ]
+        if opportunities_to_price:
+            prices = PriceCache.get_prices([opportunity['symbol'] for opportunity in opportunities_to_price])
+            premiums = self.get_premiums_for_opportunities(opportunities_to_price, prices, self.default_trade_size_usd)
+            for opportunity, premium in zip(opportunities_to_price, premiums):
+                self.premiums_by_symbol[opportunity['symbol']] = premium
+        logger.info(f"CheckProfitability - Refreshed premiums for {len(opportunities_to_price)} of {len(opportunities)} opportunities.")
+
+        premiums = [self.premiums_by_symbol.get(opportunity['symbol']) for opportunity in opportunities]
+        ranked_opportunities = self.score_opportunities_batch(opportunities, premiums, current_block)
+        self.ranked_opportunities = ranked_opportunities
+        if not ranked_opportunities:
+            logger.info("CheckProfitability - No profitable opportunities found.")
+            return None
+
+        self.save_ordered_opportunities(ranked_opportunities)
+        return ranked_opportunities[0]
+
+    def score_opportunities_batch(self, opportunities, premiums: list = None, current_block: int = None) -> list:
+        if not opportunities:
+            return []
+
+        trade_size_usd = self.default_trade_size_usd
+        symbols = [opportunity['symbol'] for opportunity in opportunities]
+        prices = PriceCache.get_prices(symbols)
+        if premiums is None:
+            premiums = self.get_premiums_for_opportunities(opportunities, prices, trade_size_usd)
+        if current_block is None:
+            current_block = BlockClock.get_current_block()
+
+        arrays = build_opportunity_arrays(opportunities, prices, premiums, trade_size_usd)
+        scores = score_opportunity_arrays(arrays, current_block, self.default_trade_duration)
+        if scores is None:
+            return []
+
+        ranked_opportunities = []
+        for index in scores['ranking']:
+            opportunity = arrays['opportunities'][index]
+            opportunity['profit_estimate_usd'] = float(scores['profit_estimate_usd'][index])
+            opportunity['profit_details'] = {
+                'symbol': opportunity['symbol'],
+                'total_profit_loss': float(scores['total_profit_loss'][index]),
+                'snx_profit_loss': float(scores['snx_profit_loss'][index]),
+                'binance_profit_loss': float(scores['binance_profit_loss'][index])
+            }
+            opportunity['hours_to_neutralize'] = float(scores['hours_to_neutralize'][index])
+            ranked_opportunities.append(opportunity)
+
+        return ranked_opportunities
+
+    def save_ordered_opportunities(self, ranked_opportunities):
+        filename = 'OrderedOpportunities.json'
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(ranked_opportunities, f, ensure_ascii=False, indent=4)
+
+    def get_premiums_for_opportunities(self, opportunities, prices: dict, trade_size_usd: float) -> list:
+        premiums = []
+        for opportunity in opportunities:
+            try:
+                symbol = opportunity['symbol']
+                is_long = opportunity['long_exchange'] == 'Synthetix'
+                size_per_exchange = (trade_size_usd / prices[symbol]) / 2
+                fee = MarketDirectory.get_maker_taker_fee(symbol, opportunity['skew'], is_long)
+                premiums.append(self.position_controller.synthetix.calculate_premium(symbol, size_per_exchange * (1 - fee)))
+            except Exception as e:
+                logger.error(f"CheckProfitability - Error fetching premium for {opportunity.get('symbol')}: {e}")
+                premiums.append(None)
+        return premiums
+
+    def estimate_synthetix_profit(self, time_period_hours, size, opportunity, use_per_block_reference=False):
         try:
             symbol = opportunity['symbol']
             skew = opportunity['skew']
@@ -60,21 +156,14 @@ class ProfitabilityChecker:
 
             adjusted_size = get_adjusted_size(size_with_premium, is_long)
 
-            current_block_number = get_base_block_number()
             initial_rate = opportunity['long_exchange_funding_rate'] if is_long else opportunity['short_exchange_funding_rate']
             funding_velocity = MarketDirectory.calculate_new_funding_velocity(symbol=symbol, current_skew=skew, trade_size=adjusted_size)
 
-            end_block_number = current_block_number + floor(BLOCKS_PER_HOUR_BASE * time_period_hours)
-            total_funding = 0
-            for block in range(current_block_number, end_block_number + 1):
-                adjusted_rate = calculate_adjusted_funding_rate(initial_rate, funding_velocity, 1)
-                profit_loss_per_day = adjusted_rate * adjusted_size
-                if (is_long and adjusted_rate < 0) or (not is_long and adjusted_rate > 0):
-                    profit_loss_per_day *= -1
-
-                total_funding += profit_loss_per_day / BLOCKS_PER_DAY_BASE
+            total_blocks = floor(BLOCKS_PER_HOUR_BASE * time_period_hours) + 1
+            if use_per_block_reference:
+                return calculate_funding_accrual_per_block(initial_rate, funding_velocity, adjusted_size, is_long, total_blocks, BLOCKS_PER_DAY_BASE)
 
-            return total_funding
+            return calculate_funding_accrual(initial_rate, funding_velocity, adjusted_size, is_long, total_blocks, BLOCKS_PER_DAY_BASE)
 
         except Exception as e:
             logger.error(f'CheckProfitability - Error estimating Synthetix profit for {symbol}: {e}')
@@ -123,7 +212,7 @@ class ProfitabilityChecker:
             symbol = opportunity['symbol']
             is_long = opportunity['long_exchange'] == 'Binance'
             funding_rate = opportunity['long_exchange_funding_rate'] if is_long else opportunity['short_exchange_funding_rate']
-            current_block_number = get_base_block_number()
+            current_block_number = BlockClock.get_current_block()
             size = get_adjusted_size(size, is_long)
 
             binance_funding_events = get_binance_funding_event_schedule(current_block_number)
@@ -1,4 +1,5 @@
 from GlobalUtils.logger import logger
+from math import floor
 
 def get_adjusted_size(size: float, is_long: bool) -> float:
     try:
@@ -10,4 +11,54 @@ def get_adjusted_size(size: float, is_long: bool) -> float:
             return size
     except Exception as e:
         logger.error(f'CheckProfitabilityUtils - Error while calculating adjusted trade size for size {size}, is_long = {is_long}: {e}')
-        return None
\ No newline at end of file
+        return None
+
+def get_funding_direction_factor(rate: float, is_long: bool) -> int:
+    if (is_long and rate < 0) or (not is_long and rate > 0):
+        return -1
+    return 1
+
+def sum_linear_funding_rates(initial_rate: float, rate_change_per_block: float, first_block: int, last_block: int) -> float:
+    block_count = last_block - first_block + 1
+    if block_count <= 0:
+        return 0.0
+    return block_count * initial_rate + rate_change_per_block * (first_block + last_block) * block_count / 2
+
+def calculate_funding_accrual(initial_rate: float, funding_velocity: float, size: float, is_long: bool, total_blocks: int, blocks_per_day: int) -> float:
+    """
+    Closed-form sum of per-block funding for a rate that moves linearly by funding_velocity per day.
+    The block range is split where the rate crosses zero so each side keeps its own direction factor.
+    """
+    try:
+        if total_blocks <= 0:
+            return 0.0
+
+        rate_change_per_block = funding_velocity / blocks_per_day
+        if rate_change_per_block == 0:
+            rate_sum = total_blocks * initial_rate
+            return get_funding_direction_factor(initial_rate, is_long) * rate_sum * size / blocks_per_day
+
+        zero_crossing_block = -initial_rate / rate_change_per_block
+        split_block = min(max(floor(zero_crossing_block), 0), total_blocks)
+        before_crossing_sign = -1 if rate_change_per_block > 0 else 1
+
+        rate_sum_before_crossing = sum_linear_funding_rates(initial_rate, rate_change_per_block, 1, split_block)
+        rate_sum_after_crossing = sum_linear_funding_rates(initial_rate, rate_change_per_block, split_block + 1, total_blocks)
+
+        total_funding = (
+            get_funding_direction_factor(before_crossing_sign, is_long) * rate_sum_before_crossing
+            + get_funding_direction_factor(-before_crossing_sign, is_long) * rate_sum_after_crossing
+        )
+        return total_funding * size / blocks_per_day
+    except Exception as e:
+        logger.error(f'CheckProfitabilityUtils - Error while calculating funding accrual for initial rate {initial_rate}, velocity {funding_velocity}, blocks {total_blocks}: {e}')
+        return None
+
+def calculate_funding_accrual_per_block(initial_rate: float, funding_velocity: float, size: float, is_long: bool, total_blocks: int, blocks_per_day: int) -> float:
+    """Reference implementation of calculate_funding_accrual that steps through every block."""
+    total_funding = 0
+    for blocks_elapsed in range(1, total_blocks + 1):
+        adjusted_rate = initial_rate + (funding_velocity / blocks_per_day) * blocks_elapsed
+        profit_loss_per_day = adjusted_rate * size * get_funding_direction_factor(adjusted_rate, is_long)
+        total_funding += profit_loss_per_day / blocks_per_day
+    return total_funding
@@ -4,50 +4,49 @@ from GlobalUtils.logger import *
 from GlobalUtils.globalUtils import *
 from binance.um_futures import UMFutures as Client
 from binance.enums import *
+from PositionMonitor.TradeDatabase.DatabaseConnectionManager import *
 import sqlite3
 from dotenv import load_dotenv
 
 load_dotenv()
 
 class BinancePositionMonitor():
-    def __init__(self, db_path='trades.db'):
+    def __init__(self, db_path=TRADE_DATABASE_PATH):
         api_key = BinanceEnvVars.API_KEY.get_value()
         api_secret = BinanceEnvVars.API_SECRET.get_value()
         self.client = Client(api_key, api_secret, base_url="https://testnet.binancefuture.com")
         self.db_path = db_path
         try:
-            self.conn = sqlite3.connect(self.db_path)
+            self.conn = DatabaseConnectionManager.get_connection(self.db_path)
         except Exception as e:
             logger.error(f"BinancePositionMonitor - Error accessing the database: {e}")
             raise e
 
     def get_open_position(self):
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''SELECT * FROM trade_log WHERE open_close = 'Open' AND exchange = 'Binance';''')
-                open_positions = cursor.fetchall()
-                if open_positions:
-                    position_dict = get_dict_from_database_response(open_positions[0])
-                    logger.info(f'BinancePositionMonitor - Open trade pulled from database: {position_dict}')
-                    return position_dict
-                else:
-                    logger.info(f"BinancePositionMonitor - No open Binance positions found")
-                    return None
+            open_positions = DatabaseConnectionManager.fetch_all(SELECT_OPEN_TRADE_BY_EXCHANGE, ('Binance',), self.db_path)
+            if open_positions:
+                position_dict = get_dict_from_database_response(open_positions[0])
+                logger.info(f'BinancePositionMonitor - Open trade pulled from database: {position_dict}')
+                return position_dict
+            else:
+                logger.info(f"BinancePositionMonitor - No open Binance positions found")
+                return None
         except Exception as e:
             logger.error(f"BinancePositionMonitor - Error while searching for open Binance positions:", {e})
             raise e
 
-    def is_near_liquidation_price(self, position) -> bool:
+    def is_near_liquidation_price(self, position, asset_price: float = None) -> bool:
         try:
             liquidation_price = float(position['liquidation_price'])
             symbol = position['symbol']
             
-            normalized_symbol = normalize_symbol(symbol)
-            asset_price = get_price_from_pyth(normalized_symbol)
+            if asset_price is None:
+                normalized_symbol = normalize_symbol(symbol)
+                asset_price = PriceCache.get_price(normalized_symbol)
 
-            lower_bound = liquidation_price * 0.9
-            upper_bound = liquidation_price * 1.1
+            lower_bound = liquidation_price * (1 - LIQUIDATION_PROXIMITY_FRACTION)
+            upper_bound = liquidation_price * (1 + LIQUIDATION_PROXIMITY_FRACTION)
 
             if lower_bound <= asset_price <= upper_bound:
                 return True
@@ -72,14 +71,11 @@ class BinancePositionMonitor():
 
     def is_open_position(self) -> bool:
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''SELECT * FROM trade_log WHERE open_close = 'Open' AND exchange = 'Binance';''')
-                open_positions = cursor.fetchall()
-                if open_positions:
-                    return True
-                else:
-                    return False
+            open_positions = DatabaseConnectionManager.fetch_all(SELECT_OPEN_TRADE_BY_EXCHANGE, ('Binance',), self.db_path)
+            if open_positions:
+                return True
+            else:
+                return False
         except Exception as e:
             logger.error(f"BinancePositionMonitor - Error while searching for open Binance positions:", {e})
             raise e
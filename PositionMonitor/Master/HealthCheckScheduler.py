@@ -0,0 +1,94 @@
+from PositionMonitor.Master.MasterPositionMonitorUtils import *
+from GlobalUtils.logger import *
+from GlobalUtils.globalUtils import normalize_symbol
+from collections import deque
+import threading
+import math
+import time
+
+PRICE_HISTORY_LENGTH = 120
+MIN_VOLATILITY_SAMPLES = 5
+DEFAULT_VOLATILITY_PER_SQRT_SECOND = 0.0002
+VOLATILITY_SIGMA_MULTIPLIER = 4
+FUNDING_FLIP_SAFETY_FRACTION = 0.1
+SECONDS_PER_DAY = 86400
+
+class HealthCheckScheduler:
+    """
+    Chooses the delay until the next health check from distance to liquidation, realised volatility and funding velocity.
+    Delta and profitability are re-checked every cycle, so the delay never exceeds HEALTH_CHECK_FALLBACK_INTERVAL_SECONDS.
+    """
+    def __init__(self):
+        self.price_history = {}
+        self._lock = threading.Lock()
+
+    def record_prices(self, prices: dict, timestamp: float = None):
+        timestamp = timestamp if timestamp is not None else time.time()
+        with self._lock:
+            for symbol, price in prices.items():
+                if not price or price <= 0:
+                    continue
+                history = self.price_history.setdefault(symbol, deque(maxlen=PRICE_HISTORY_LENGTH))
+                if history and timestamp <= history[-1][0]:
+                    continue
+                history.append((timestamp, float(price)))
+
+    def get_volatility(self, symbol: str) -> float:
+        """Realised volatility of log returns, scaled to one second so irregular sample spacing is handled."""
+        with self._lock:
+            history = list(self.price_history.get(symbol, []))
+        if len(history) < MIN_VOLATILITY_SAMPLES:
+            return DEFAULT_VOLATILITY_PER_SQRT_SECOND
+
+        squared_returns = 0.0
+        elapsed = 0.0
+        for (previous_time, previous_price), (current_time, current_price) in zip(history, history[1:]):
+            squared_returns += math.log(current_price / previous_price) ** 2
+            elapsed += current_time - previous_time
+        if elapsed <= 0:
+            return DEFAULT_VOLATILITY_PER_SQRT_SECOND
+        return max(math.sqrt(squared_returns / elapsed), DEFAULT_VOLATILITY_PER_SQRT_SECOND / 10)
+
+    def get_next_interval(self, snapshot: dict) -> float:
+        try:
+            intervals = [HEALTH_CHECK_FALLBACK_INTERVAL_SECONDS]
+            for position in [snapshot['synthetix_position'], snapshot['binance_position']]:
+                if position:
+                    intervals.append(self.get_liquidation_interval(position, snapshot['prices']))
+            if snapshot['synthetix_market_summary']:
+                intervals.append(self.get_funding_interval(snapshot['synthetix_market_summary']))
+
+            interval = min(max(min(intervals), MIN_HEALTH_CHECK_INTERVAL_SECONDS), HEALTH_CHECK_FALLBACK_INTERVAL_SECONDS)
+            logger.info(f"HealthCheckScheduler - Next health check in {interval:.1f}s.")
+            return interval
+        except Exception as e:
+            logger.error(f"HealthCheckScheduler - Error scheduling next health check, using minimum interval: {e}")
+            return MIN_HEALTH_CHECK_INTERVAL_SECONDS
+
+    def get_liquidation_interval(self, position: dict, prices: dict) -> float:
+        """Time for a VOLATILITY_SIGMA_MULTIPLIER sigma move to carry the price into the liquidation alert band."""
+        symbol = normalize_symbol(position['symbol'])
+        price = prices.get(symbol)
+        liquidation_price = float(position['liquidation_price'] or 0)
+        if not price or liquidation_price <= 0:
+            return LIQUIDATION_CHECK_MAX_INTERVAL_SECONDS
+
+        if price >= liquidation_price:
+            distance = (price - liquidation_price * (1 + LIQUIDATION_PROXIMITY_FRACTION)) / price
+        else:
+            distance = (liquidation_price * (1 - LIQUIDATION_PROXIMITY_FRACTION) - price) / price
+        if distance <= 0:
+            return MIN_HEALTH_CHECK_INTERVAL_SECONDS
+
+        volatility = self.get_volatility(symbol)
+        return min((distance / (VOLATILITY_SIGMA_MULTIPLIER * volatility)) ** 2, LIQUIDATION_CHECK_MAX_INTERVAL_SECONDS)
+
+    def get_funding_interval(self, market_summary: dict) -> float:
+        """A fraction of the time until funding, extrapolated at its current velocity, crosses zero."""
+        funding_rate = float(market_summary['current_funding_rate'])
+        funding_velocity = float(market_summary['current_funding_velocity'])
+        if funding_velocity == 0 or funding_rate * funding_velocity >= 0:
+            return HEALTH_CHECK_FALLBACK_INTERVAL_SECONDS
+
+        seconds_to_flip = abs(funding_rate / funding_velocity) * SECONDS_PER_DAY
+        return seconds_to_flip * FUNDING_FLIP_SAFETY_FRACTION
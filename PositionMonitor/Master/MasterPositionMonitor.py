@@ -1,10 +1,12 @@
 from PositionMonitor.Synthetix.SynthetixPositionMonitor import SynthetixPositionMonitor
 from PositionMonitor.Binance.BinancePositionMonitor import BinancePositionMonitor
 from PositionMonitor.Master.MasterPositionMonitorUtils import *
+from PositionMonitor.Master.HealthCheckScheduler import HealthCheckScheduler
 from GlobalUtils.logger import *
 from GlobalUtils.globalUtils import *
 from GlobalUtils.marketDirectory import MarketDirectory
 from pubsub import pub
+from concurrent.futures import ThreadPoolExecutor
 import threading
 import time
 
@@ -14,9 +16,15 @@ class MasterPositionMonitor():
         self.binance = BinancePositionMonitor()
         self.health_check_thread = None
         self.stop_health_check = threading.Event()
+        self.health_check_trigger = threading.Event()
+        self.risk_thresholds = None
+        self.scheduler = HealthCheckScheduler()
+        self.next_check_interval = MIN_HEALTH_CHECK_INTERVAL_SECONDS
         
         pub.subscribe(self.on_position_opened, EventsDirectory.TRADE_LOGGED.value)
         pub.subscribe(self.on_position_closed, EventsDirectory.POSITION_CLOSED.value)
+        pub.subscribe(self.on_prices_updated, EventsDirectory.PRICES_UPDATED.value)
+        pub.subscribe(self.on_funding_rates_updated, EventsDirectory.FUNDING_RATES_UPDATED.value)
 
     def on_position_opened(self, position_data):
         if self.health_check_thread is None or not self.health_check_thread.is_alive():
@@ -29,17 +37,100 @@ class MasterPositionMonitor():
 
     def on_position_closed(self, position_report):
         self.stop_health_check.set()
+        self.health_check_trigger.set()
+        self.risk_thresholds = None
+
+    def on_prices_updated(self, prices):
+        self.scheduler.record_prices(prices)
+        thresholds = self.risk_thresholds
+        if thresholds and is_price_threshold_crossed(thresholds, prices):
+            self.health_check_trigger.set()
+
+    def on_funding_rates_updated(self, funding_rates):
+        thresholds = self.risk_thresholds
+        if thresholds and is_funding_threshold_crossed(thresholds, funding_rates):
+            self.health_check_trigger.set()
 
     def start_health_check(self):
+        """Re-evaluates as soon as a price or funding update crosses a precomputed threshold, and otherwise after the interval chosen by the scheduler."""
         while not self.stop_health_check.is_set():
             self.position_health_check()
-            time.sleep(30)
+            self.wait_for_next_health_check()
+            self.stop_health_check.wait(MIN_HEALTH_CHECK_INTERVAL_SECONDS)
+
+    def wait_for_next_health_check(self):
+        """Polls the held position's own price and funding between checks, so thresholds are watched even when nothing else publishes updates."""
+        deadline = time.monotonic() + self.next_check_interval
+        while not self.stop_health_check.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            if self.health_check_trigger.wait(min(remaining, RISK_THRESHOLD_POLL_INTERVAL_SECONDS)):
+                return
+            self.poll_risk_thresholds()
+
+    def poll_risk_thresholds(self):
+        thresholds = self.risk_thresholds
+        if not thresholds:
+            return
+        try:
+            prices = PriceCache.get_prices(list(thresholds['price_bands'].keys()))
+            if is_price_threshold_crossed(thresholds, prices):
+                self.health_check_trigger.set()
+                return
+
+            if thresholds['funding']:
+                market_summary = self.get_synthetix_market_summary({'symbol': thresholds['funding']['symbol']})
+                if is_market_summary_threshold_crossed(thresholds, market_summary):
+                    self.health_check_trigger.set()
+        except Exception as e:
+            logger.error(f"MasterPositionMonitor - Error while polling risk thresholds: {e}")
+
+    def take_snapshot(self) -> dict:
+        """Collects positions, prices and Synthetix market state once, so every risk predicate in a cycle sees the same view."""
+        snapshot = {
+            'synthetix_position': None,
+            'binance_position': None,
+            'prices': {},
+            'synthetix_market_summary': None,
+            'taken_at': time.time()
+        }
+        try:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                synthetix_future = executor.submit(self.synthetix.get_open_position)
+                binance_future = executor.submit(self.binance.get_open_position)
+                snapshot['synthetix_position'] = synthetix_future.result()
+                snapshot['binance_position'] = binance_future.result()
+
+            positions = [position for position in [snapshot['synthetix_position'], snapshot['binance_position']] if position]
+            symbols = list({normalize_symbol(position['symbol']) for position in positions})
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                prices_future = executor.submit(PriceCache.get_prices, symbols) if symbols else None
+                summary_future = executor.submit(self.get_synthetix_market_summary, snapshot['synthetix_position']) if snapshot['synthetix_position'] else None
+                snapshot['prices'] = prices_future.result() if prices_future else {}
+                snapshot['synthetix_market_summary'] = summary_future.result() if summary_future else None
+        except Exception as e:
+            logger.error(f"MasterPositionMonitor - Error while taking position snapshot: {e}")
+        return snapshot
+
+    def get_synthetix_market_summary(self, synthetix_position):
+        try:
+            market_data = MarketDirectory.get_market_params(synthetix_position['symbol'])
+            return self.synthetix.client.perps.get_market_summary(market_data['market_id'])
+        except Exception as e:
+            logger.error(f"MasterPositionMonitor - Error fetching Synthetix market summary for {synthetix_position.get('symbol')}: {e}")
+            return None
 
     def position_health_check(self):
-        is_liquidation_risk = self.check_liquidation_risk()
-        is_profitable = self.check_profitability_for_open_position()
-        is_delta_within_bounds = self.is_position_delta_within_bounds()
-        is_funding_velocity_turning = self.is_funding_turning_against_trade()
+        snapshot = self.take_snapshot()
+        self.scheduler.record_prices(snapshot['prices'], snapshot['taken_at'])
+        self.risk_thresholds = build_risk_thresholds(snapshot)
+        self.next_check_interval = self.scheduler.get_next_interval(snapshot)
+        self.health_check_trigger.clear()
+        is_liquidation_risk = self.check_liquidation_risk(snapshot)
+        is_profitable = self.check_profitability_for_open_position(snapshot)
+        is_delta_within_bounds = self.is_position_delta_within_bounds(snapshot)
+        is_funding_velocity_turning = self.is_funding_turning_against_trade(snapshot)
 
         if is_liquidation_risk:
             reason = PositionCloseReason.LIQUIDATION_RISK.value
@@ -56,13 +147,14 @@ class MasterPositionMonitor():
         else:
             logger.info('MasterPositionMonitor - no threat detected for open position')
 
-    def check_liquidation_risk(self) -> bool:
+    def check_liquidation_risk(self, snapshot: dict = None) -> bool:
         try:
-            synthetix_position = self.synthetix.get_open_position()
-            binance_position = self.binance.get_open_position()
+            snapshot = snapshot or self.take_snapshot()
+            synthetix_position = snapshot['synthetix_position']
+            binance_position = snapshot['binance_position']
 
-            is_synthetix_risk = self.synthetix.is_near_liquidation_price(synthetix_position)
-            is_binance_risk = self.binance.is_near_liquidation_price(binance_position)
+            is_synthetix_risk = self.synthetix.is_near_liquidation_price(synthetix_position, get_snapshot_price(snapshot, synthetix_position))
+            is_binance_risk = self.binance.is_near_liquidation_price(binance_position, get_snapshot_price(snapshot, binance_position))
 
             if is_binance_risk or is_synthetix_risk:
                 return True
@@ -72,15 +164,16 @@ class MasterPositionMonitor():
             logger.error(f"MasterPositionMonitor - Error while checking liquidation risk for positions: {e}")
             return False
 
-    def check_profitability_for_open_position(self) -> bool:
+    def check_profitability_for_open_position(self, snapshot: dict = None) -> bool:
         try:
-            synthetix_position = self.synthetix.get_open_position()
+            snapshot = snapshot or self.take_snapshot()
+            synthetix_position = snapshot['synthetix_position']
 
             if not synthetix_position:
                 logger.info("MasterPositionMonitor - No open Synthetix positions found.")
                 return False
 
-            synthetix_funding_rate = self.synthetix.get_funding_rate(synthetix_position)
+            synthetix_funding_rate = self.synthetix.get_funding_rate(synthetix_position, snapshot['synthetix_market_summary'])
 
             size = float(synthetix_position['size'])
             is_long = size > 0
@@ -91,11 +184,12 @@ class MasterPositionMonitor():
             logger.error(f"MasterPositionMonitor - Error checking overall profitability for open positions: {e}")
             return False
 
-    def is_position_delta_within_bounds(self) -> bool:
+    def is_position_delta_within_bounds(self, snapshot: dict = None) -> bool:
         try:
+            snapshot = snapshot or self.take_snapshot()
             delta_bound = float(os.getenv('DELTA_BOUND'))
-            synthetix_position = self.synthetix.get_open_position()
-            binance_position = self.binance.get_open_position()
+            synthetix_position = snapshot['synthetix_position']
+            binance_position = snapshot['binance_position']
 
             if not synthetix_position:
                 logger.error("MasterPositionMonitor - Synthetix position is missing when trying to calculate delta.")
@@ -110,10 +204,9 @@ class MasterPositionMonitor():
                 logger.error(f"MasterPositionMonitor - Missing 'symbol' key in Synthetix position details: {e}")
                 return False
 
-            try:
-                asset_price = get_price_from_pyth(asset=symbol)
-            except Exception as e:
-                logger.error(f"MasterPositionMonitor - Error retrieving asset price for {symbol}: {e}")
+            asset_price = snapshot['prices'].get(symbol)
+            if asset_price is None:
+                logger.error(f"MasterPositionMonitor - No snapshot price available for {symbol}.")
                 return False
 
             synthetix_notional_value = float(synthetix_position['size']) * asset_price
@@ -133,17 +226,18 @@ class MasterPositionMonitor():
             logger.error(f"MasterPositionMonitor - Unexpected error in checking position delta: {e}")
             return False
 
-    def is_funding_turning_against_trade(self) -> bool:
+    def is_funding_turning_against_trade(self, snapshot: dict = None) -> bool:
+        symbol = None
         try:
-            synthetix_position = self.synthetix.get_open_position()
+            snapshot = snapshot or self.take_snapshot()
+            synthetix_position = snapshot['synthetix_position']
             is_long = synthetix_position['size'] > 0
             symbol = synthetix_position['symbol']
 
-            market_data = MarketDirectory.get_market_params(symbol)
-            if not market_data:
+            market_summary = snapshot['synthetix_market_summary']
+            if not market_summary:
                 raise ValueError(f"No market data available for symbol: {symbol}")
 
-            market_summary = self.synthetix.client.perps.get_market_summary(market_data['market_id'])
             funding_rate = market_summary['current_funding_rate']
             velocity = market_summary['current_funding_velocity']
 
@@ -156,6 +250,3 @@ class MasterPositionMonitor():
         except Exception as e:
             logger.error(f"MasterPositionMonitor - Error checking if funding is turning against trade for {symbol}: {e}")
             return False
-
-
-
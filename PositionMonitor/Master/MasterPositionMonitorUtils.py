@@ -1,5 +1,17 @@
 from enum import Enum
 from GlobalUtils.logger import logger
+from GlobalUtils.globalUtils import normalize_symbol, BLOCKS_PER_DAY_BASE
+from APICaller.Synthetix.SynthetixUtils import FUNDING_PERIODS_PER_DAY
+import os
+
+MAX_HEALTH_CHECK_INTERVAL_SECONDS = 30
+HEALTH_CHECK_FALLBACK_INTERVAL_SECONDS = min(float(os.getenv('HEALTH_CHECK_FALLBACK_INTERVAL_SECONDS', MAX_HEALTH_CHECK_INTERVAL_SECONDS)), MAX_HEALTH_CHECK_INTERVAL_SECONDS)
+LIQUIDATION_CHECK_MAX_INTERVAL_SECONDS = float(os.getenv('LIQUIDATION_CHECK_MAX_INTERVAL_SECONDS', 300))
+MIN_HEALTH_CHECK_INTERVAL_SECONDS = 1
+RISK_THRESHOLD_POLL_INTERVAL_SECONDS = float(os.getenv('RISK_THRESHOLD_POLL_INTERVAL_SECONDS', 5))
+PRICE_MOVE_TRIGGER_FRACTION = 0.01
+LIQUIDATION_PROXIMITY_FRACTION = 0.1
+FUNDING_PREDICTION_BLOCKS = 7200
 
 class PositionCloseReason(Enum):
     LIQUIDATION_RISK = "LIQUIDATION_RISK"
@@ -20,3 +32,77 @@ def get_dict_from_database_response(response):
 
     return response_dict
 
+def get_snapshot_price(snapshot: dict, position) -> float:
+    if not position:
+        return None
+    return snapshot['prices'].get(normalize_symbol(position['symbol']))
+
+def predict_funding_rate(funding_rate: float, funding_velocity: float, future_blocks: int = FUNDING_PREDICTION_BLOCKS) -> float:
+    return funding_rate + (funding_velocity * future_blocks / BLOCKS_PER_DAY_BASE)
+
+def build_risk_thresholds(snapshot: dict) -> dict:
+    """Precomputes the price band per symbol and the funding signs that, once crossed, make the last health check outdated."""
+    thresholds = {'price_bands': {}, 'funding': None}
+    for position in [snapshot['synthetix_position'], snapshot['binance_position']]:
+        if not position:
+            continue
+        symbol = normalize_symbol(position['symbol'])
+        price = snapshot['prices'].get(symbol)
+        if price is None:
+            continue
+
+        lower, upper = thresholds['price_bands'].get(symbol, (price * (1 - PRICE_MOVE_TRIGGER_FRACTION), price * (1 + PRICE_MOVE_TRIGGER_FRACTION)))
+        liquidation_price = float(position['liquidation_price'] or 0)
+        if liquidation_price > 0:
+            lower_alert = liquidation_price * (1 - LIQUIDATION_PROXIMITY_FRACTION)
+            upper_alert = liquidation_price * (1 + LIQUIDATION_PROXIMITY_FRACTION)
+            if price > upper_alert:
+                lower = max(lower, upper_alert)
+            elif price < lower_alert:
+                upper = min(upper, lower_alert)
+        thresholds['price_bands'][symbol] = (lower, upper)
+
+    synthetix_position = snapshot['synthetix_position']
+    market_summary = snapshot['synthetix_market_summary']
+    if synthetix_position and market_summary:
+        funding_rate = float(market_summary['current_funding_rate'])
+        predicted_funding_rate = predict_funding_rate(funding_rate, float(market_summary['current_funding_velocity']))
+        thresholds['funding'] = {
+            'symbol': synthetix_position['symbol'],
+            'is_rate_positive': funding_rate > 0,
+            'is_predicted_rate_positive': predicted_funding_rate > 0
+        }
+    return thresholds
+
+def is_price_threshold_crossed(thresholds: dict, prices: dict) -> bool:
+    for symbol, (lower, upper) in thresholds['price_bands'].items():
+        price = prices.get(symbol)
+        if price is not None and not lower <= price <= upper:
+            logger.info(f"MasterPositionMonitorUtils - {symbol} price {price} left the band ({lower}, {upper}).")
+            return True
+    return False
+
+def is_funding_threshold_crossed(thresholds: dict, funding_rates: list) -> bool:
+    funding_threshold = thresholds['funding']
+    if not funding_threshold:
+        return False
+
+    for rate in funding_rates:
+        if rate.get('exchange') != 'Synthetix' or rate.get('symbol') != funding_threshold['symbol']:
+            continue
+        if is_funding_sign_changed(funding_threshold, float(rate['funding_rate']) * FUNDING_PERIODS_PER_DAY, float(rate.get('funding_velocity', 0))):
+            return True
+    return False
+
+def is_market_summary_threshold_crossed(thresholds: dict, market_summary: dict) -> bool:
+    funding_threshold = thresholds['funding']
+    if not funding_threshold or not market_summary:
+        return False
+    return is_funding_sign_changed(funding_threshold, float(market_summary['current_funding_rate']), float(market_summary['current_funding_velocity']))
+
+def is_funding_sign_changed(funding_threshold: dict, funding_rate_24h: float, funding_velocity: float) -> bool:
+    predicted_funding_rate = predict_funding_rate(funding_rate_24h, funding_velocity)
+    if (funding_rate_24h > 0) != funding_threshold['is_rate_positive'] or (predicted_funding_rate > 0) != funding_threshold['is_predicted_rate_positive']:
+        logger.info(f"MasterPositionMonitorUtils - Funding for {funding_threshold['symbol']} changed sign, rate: {funding_rate_24h}, predicted: {predicted_funding_rate}.")
+        return True
+    return False
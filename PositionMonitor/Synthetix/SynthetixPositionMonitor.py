@@ -4,14 +4,15 @@ from GlobalUtils.globalUtils import *
 from GlobalUtils.logger import *
 from pubsub import pub
 from PositionMonitor.Master.MasterPositionMonitorUtils import *
+from PositionMonitor.TradeDatabase.DatabaseConnectionManager import *
 import sqlite3
 
 class SynthetixPositionMonitor():
-    def __init__(self, db_path='trades.db'):
+    def __init__(self, db_path=TRADE_DATABASE_PATH):
         self.client = get_synthetix_client()
         self.db_path = db_path
         try:
-            self.conn = sqlite3.connect(self.db_path)
+            self.conn = DatabaseConnectionManager.get_connection(self.db_path)
         except Exception as e:
             logger.error(f"SynthetixPositionMonitor - Error accessing the database: {e}")
             raise e
@@ -33,31 +34,29 @@ class SynthetixPositionMonitor():
 
     def get_open_position(self) -> dict:
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''SELECT * FROM trade_log WHERE open_close = 'Open' AND exchange = 'Synthetix';''')
-                open_positions = cursor.fetchall()
-                if open_positions:
-                    position_dict = get_dict_from_database_response(open_positions[0])
-                    logger.info(f'SynthetixPositionMonitor - Open trade pulled from database: {position_dict}')
-                    return position_dict
-                else:
-                    logger.info("SynthetixPositionMonitor - No open Synthetix positions found")
-                    return None
+            open_positions = DatabaseConnectionManager.fetch_all(SELECT_OPEN_TRADE_BY_EXCHANGE, ('Synthetix',), self.db_path)
+            if open_positions:
+                position_dict = get_dict_from_database_response(open_positions[0])
+                logger.info(f'SynthetixPositionMonitor - Open trade pulled from database: {position_dict}')
+                return position_dict
+            else:
+                logger.info("SynthetixPositionMonitor - No open Synthetix positions found")
+                return None
         except Exception as e:
             logger.error(f"SynthetixPositionMonitor - Error while searching for open Synthetix positions: {e}")
             raise e
 
-    def is_near_liquidation_price(self, position) -> bool:
+    def is_near_liquidation_price(self, position, asset_price: float = None) -> bool:
         try:
             liquidation_price = float(position['liquidation_price'])
             symbol = position['symbol']
             
-            normalized_symbol = normalize_symbol(symbol)
-            asset_price = get_price_from_pyth(normalized_symbol)
+            if asset_price is None:
+                normalized_symbol = normalize_symbol(symbol)
+                asset_price = PriceCache.get_price(normalized_symbol)
 
-            lower_bound = liquidation_price * 0.9
-            upper_bound = liquidation_price * 1.1
+            lower_bound = liquidation_price * (1 - LIQUIDATION_PROXIMITY_FRACTION)
+            upper_bound = liquidation_price * (1 + LIQUIDATION_PROXIMITY_FRACTION)
 
             if lower_bound <= asset_price <= upper_bound:
                 return True
@@ -67,10 +66,10 @@ class SynthetixPositionMonitor():
             logger.error(f"SynthetixPositionMonitor - Error checking if near liquidation price for {symbol}: {e}")
             return False
 
-    def get_funding_rate(self, position) -> float:
+    def get_funding_rate(self, position, market_summary: dict = None) -> float:
         try:
             symbol = position['symbol']
-            market = self.client.perps.get_market_summary(market_name=symbol)
+            market = market_summary if market_summary else self.client.perps.get_market_summary(market_name=symbol)
             
             if 'current_funding_rate' in market:
                 funding_rate = float(market['current_funding_rate'])
@@ -85,14 +84,11 @@ class SynthetixPositionMonitor():
 
     def is_open_position(self) -> bool:
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''SELECT * FROM trade_log WHERE open_close = 'Open' AND exchange = 'Synthetix';''')
-                open_positions = cursor.fetchall()
-                if open_positions:
-                    return True
-                else:
-                    return False
+            open_positions = DatabaseConnectionManager.fetch_all(SELECT_OPEN_TRADE_BY_EXCHANGE, ('Synthetix',), self.db_path)
+            if open_positions:
+                return True
+            else:
+                return False
         except Exception as e:
             logger.error(f"SynthetixPositionMonitor - Error while searching for open Synthetix positions:", {e})
             raise e
@@ -0,0 +1,132 @@
+from GlobalUtils.logger import *
+from contextlib import contextmanager
+import sqlite3
+import threading
+
+TRADE_DATABASE_PATH = 'trades.db'
+BUSY_TIMEOUT_MILLISECONDS = 5000
+CACHED_STATEMENTS = 128
+
+SELECT_OPEN_TRADE_BY_EXCHANGE = "SELECT * FROM trade_log WHERE open_close = 'Open' AND exchange = ? LIMIT 1;"
+SELECT_TRADES_BY_EXECUTION_ID = "SELECT * FROM trade_log WHERE strategy_execution_id = ?;"
+SELECT_OPEN_EXECUTION_IDS = "SELECT strategy_execution_id FROM trade_log WHERE open_close = 'Open' GROUP BY strategy_execution_id HAVING COUNT(*) = 2;"
+INSERT_OPEN_TRADE = '''INSERT INTO trade_log (strategy_execution_id, order_id, exchange, symbol, side, size, liquidation_price, open_close, open_time)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, 'Open', ?);'''
+UPDATE_CLOSE_TRADE = '''UPDATE trade_log
+                        SET close_time = ?, pnl = ?, accrued_funding = ?, close_reason = ?, open_close = 'Close'
+                        WHERE strategy_execution_id = ? AND exchange = ?;'''
+
+# Each entry upgrades the schema by one version, tracked in PRAGMA user_version.
+SCHEMA_MIGRATIONS = [
+    [
+        '''CREATE TABLE IF NOT EXISTS trade_log (
+            id INTEGER PRIMARY KEY,
+            strategy_execution_id TEXT NOT NULL,
+            order_id TEXT NOT NULL,
+            exchange TEXT NOT NULL,
+            symbol TEXT NOT NULL,
+            side TEXT NOT NULL,
+            size REAL NOT NULL,
+            liquidation_price REAL NOT NULL,
+            open_close TEXT NOT NULL,
+            open_time DATETIME,
+            close_time DATETIME,
+            pnl REAL,
+            accrued_funding REAL,
+            close_reason TEXT
+        );'''
+    ],
+    [
+        # Partial indexes only hold open trades, so monitor lookups stay small however long the history grows.
+        "CREATE INDEX IF NOT EXISTS idx_trade_log_open_by_exchange ON trade_log (exchange) WHERE open_close = 'Open';",
+        "CREATE INDEX IF NOT EXISTS idx_trade_log_open_by_execution_id ON trade_log (strategy_execution_id) WHERE open_close = 'Open';",
+        "CREATE INDEX IF NOT EXISTS idx_trade_log_strategy_execution_id ON trade_log (strategy_execution_id, exchange);"
+    ]
+]
+
+class DatabaseConnectionManager:
+    """Shares one WAL-mode connection per database file across the logger and monitors, serialising access with a per-file lock."""
+    _connections = {}
+    _locks = {}
+    _registry_lock = threading.Lock()
+
+    @classmethod
+    def get_connection(cls, db_path: str = TRADE_DATABASE_PATH) -> sqlite3.Connection:
+        with cls._registry_lock:
+            conn = cls._connections.get(db_path)
+            if conn is None:
+                conn = cls._open_connection(db_path)
+                cls._connections[db_path] = conn
+                cls._locks[db_path] = threading.RLock()
+            return conn
+
+    @classmethod
+    @contextmanager
+    def transaction(cls, db_path: str = TRADE_DATABASE_PATH):
+        conn = cls.get_connection(db_path)
+        with cls._locks[db_path]:
+            try:
+                yield conn.cursor()
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    @classmethod
+    def fetch_all(cls, query: str, params: tuple = (), db_path: str = TRADE_DATABASE_PATH) -> list:
+        with cls.transaction(db_path) as cursor:
+            cursor.execute(query, params)
+            return cursor.fetchall()
+
+    @classmethod
+    def execute(cls, query: str, params: tuple = (), db_path: str = TRADE_DATABASE_PATH) -> int:
+        with cls.transaction(db_path) as cursor:
+            cursor.execute(query, params)
+            return cursor.rowcount
+
+    @classmethod
+    def migrate(cls, db_path: str = TRADE_DATABASE_PATH) -> int:
+        with cls.transaction(db_path) as cursor:
+            return cls._apply_migrations(cursor)
+
+    @classmethod
+    def reset_schema(cls, db_path: str = TRADE_DATABASE_PATH):
+        with cls.transaction(db_path) as cursor:
+            cursor.execute("DROP TABLE IF EXISTS trade_log")
+            cursor.execute("PRAGMA user_version = 0")
+            cls._apply_migrations(cursor)
+
+    @classmethod
+    def close(cls, db_path: str = None):
+        with cls._registry_lock:
+            paths = [db_path] if db_path else list(cls._connections.keys())
+            for path in paths:
+                conn = cls._connections.pop(path, None)
+                cls._locks.pop(path, None)
+                if conn is not None:
+                    conn.close()
+
+    @classmethod
+    def _open_connection(cls, db_path: str) -> sqlite3.Connection:
+        try:
+            conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=CACHED_STATEMENTS)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MILLISECONDS}")
+            cls._apply_migrations(conn.cursor())
+            conn.commit()
+            logger.info(f"DatabaseConnectionManager - Opened shared connection to {db_path}.")
+            return conn
+        except sqlite3.Error as e:
+            logger.error(f"DatabaseConnectionManager - Error opening database {db_path}: {e}")
+            raise e
+
+    @classmethod
+    def _apply_migrations(cls, cursor) -> int:
+        version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        for target_version, statements in enumerate(SCHEMA_MIGRATIONS[version:], start=version + 1):
+            for statement in statements:
+                cursor.execute(statement)
+            cursor.execute(f"PRAGMA user_version = {target_version}")
+            logger.info(f"DatabaseConnectionManager - Migrated trade database schema to version {target_version}.")
+        return max(version, len(SCHEMA_MIGRATIONS))
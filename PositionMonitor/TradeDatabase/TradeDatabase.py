@@ -2,11 +2,14 @@ import sqlite3
 from datetime import datetime
 from GlobalUtils.logger import *
 from GlobalUtils.globalUtils import *
+from PositionMonitor.TradeDatabase.DatabaseConnectionManager import *
+from PositionMonitor.TradeDatabase.TradeJournalWriter import TradeJournalWriter
 from pubsub import pub
 import uuid
+import atexit
 
 class TradeLogger:
-    def __init__(self, db_path='trades.db'):
+    def __init__(self, db_path=TRADE_DATABASE_PATH):
         self.db_path = db_path
         pub.subscribe(self.log_trade_pair, EventsDirectory.POSITION_OPENED.value)
         pub.subscribe(self.log_close_trade, EventsDirectory.POSITION_CLOSED.value)
@@ -15,6 +18,9 @@ class TradeLogger:
         except Exception as e:
             logger.error(f"TradeLogger - Error accessing the database: {e}")
             raise e
+        self.journal = TradeJournalWriter(self.db_path)
+        self.journal.start()
+        atexit.register(self.close)
 
     #######################
     ### WRITE FUNCTIONS ###
@@ -22,23 +28,7 @@ class TradeLogger:
 
     def create_or_access_database(self):
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.execute('''CREATE TABLE IF NOT EXISTS trade_log (
-                        id INTEGER PRIMARY KEY,
-                        strategy_execution_id TEXT NOT NULL,
-                        order_id TEXT NOT NULL,
-                        exchange TEXT NOT NULL,
-                        symbol TEXT NOT NULL,
-                        side TEXT NOT NULL,
-                        size REAL NOT NULL,
-                        liquidation_price REAL NOT NULL,
-                        open_close TEXT NOT NULL,
-                        open_time DATETIME,
-                        close_time DATETIME,
-                        pnl REAL,
-                        accrued_funding REAL,
-                        close_reason TEXT
-                    );''')
+            conn = DatabaseConnectionManager.get_connection(self.db_path)
             logger.info("TradeLogger - Database accessed successfully.")
             return conn
         except sqlite3.Error as e:
@@ -50,67 +40,66 @@ class TradeLogger:
         open_time = datetime.now()
         logger.info(f"Logging trade pair with ID: {strategy_execution_id}, data: {position_data}")
 
-        for exchange, data in position_data.items():
-            order_id = data.get('order_id')
-            symbol = data.get('symbol')
-            side = data.get('side')
-            size = data.get('size')
-            liquidation_price = data.get('liquidation_price')
-            self.log_open_trade(strategy_execution_id, order_id, exchange, symbol, side, size, liquidation_price, open_time)
-        
-        pub.sendMessage(EventsDirectory.TRADE_LOGGED.value, position_data=position_data)
-
-    def log_open_trade(self, strategy_execution_id, order_id, exchange, symbol, side, size, liquidation_price, open_time=datetime.now()):
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute('''INSERT INTO trade_log (strategy_execution_id, order_id, exchange, symbol, side, size, liquidation_price, open_close, open_time)
-                                VALUES (?, ?, ?, ?, ?, ?, ?, 'Open', ?);''', (strategy_execution_id, order_id, exchange, symbol, side, size, liquidation_price, open_time))
-                logger.info(f"TradeLogger - Logged open trade for strategy_execution_id: {strategy_execution_id} on exchange: {exchange}")
-        except sqlite3.Error as e:
-            logger.error(f"TradeLogger - Error logging open trade for strategy_execution_id: {strategy_execution_id}, exchange: {exchange}. Error: {e}")
+        rows = [
+            (strategy_execution_id, data.get('order_id'), exchange, data.get('symbol'), data.get('side'), data.get('size'), data.get('liquidation_price'), open_time)
+            for exchange, data in position_data.items()
+        ]
+        self.journal.submit(
+            lambda cursor: self._write_open_trades(cursor, rows),
+            on_committed=lambda: pub.sendMessage(EventsDirectory.TRADE_LOGGED.value, position_data=position_data)
+        )
+
+    def log_open_trade(self, strategy_execution_id, order_id, exchange, symbol, side, size, liquidation_price, open_time=None):
+        row = (strategy_execution_id, order_id, exchange, symbol, side, size, liquidation_price, open_time or datetime.now())
+        self.journal.submit(lambda cursor: self._write_open_trades(cursor, [row]))
 
     def log_close_trade(self, position_report: dict):
-        try:
-            execution_id = self.get_open_execution_id()
-            reason = position_report['close_reason']
-            self.log_close_trade_pair(reason, execution_id, position_report)
-        except sqlite3.Error as e:
-            logger.error(f"TradeLogger - Error closing trades on the database: Error: {e}")
+        self.journal.submit(lambda cursor: self._write_close_trade(cursor, position_report))
 
     def log_close_trade_pair(self, close_reason, strategy_execution_id, position_report: dict):
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                trades = self.get_trade_pair_by_execution_id(strategy_execution_id)
-                if not trades:
-                    logger.error(f"TradeLogger - No trades found for strategy_execution_id: {strategy_execution_id}")
-                    return
-
-                if len(trades) != 2:
-                    logger.error(f"Expected two trades for strategy_execution_id: {strategy_execution_id}, found: {len(trades)}")
-                    return
-
-                close_time = datetime.now()
-                for trade in trades:
-                    exchange = trade[3]
-                    pnl = position_report.get(exchange, {}).get('pnl', 0)
-                    accrued_funding = position_report.get(exchange, {}).get('accrued_funding', 0)
-
-                    conn.execute('''UPDATE trade_log 
-                                        SET close_time = ?, pnl = ?, accrued_funding = ?, close_reason = ?, open_close = 'Close' 
-                                        WHERE strategy_execution_id = ? AND exchange = ?;''', 
-                                        (close_time, pnl, accrued_funding, close_reason, strategy_execution_id, exchange))
-                    logger.info(f"TradeLogger - Logged close trade for {exchange} with strategy_execution_id: {strategy_execution_id}")
-
-        except sqlite3.Error as e:
-            logger.error(f"TradeLogger - Error logging close trade for strategy_execution_id: {strategy_execution_id}. Error: {e}")
+        self.journal.submit(lambda cursor: self._write_close_trade_pair(cursor, close_reason, strategy_execution_id, position_report))
+
+    def flush(self, timeout: float = None) -> bool:
+        return self.journal.flush(timeout)
+
+    def close(self, timeout: float = None) -> bool:
+        return self.journal.close(timeout)
+
+    def _write_open_trades(self, cursor, rows: list):
+        cursor.executemany(INSERT_OPEN_TRADE, rows)
+        for row in rows:
+            logger.info(f"TradeLogger - Logged open trade for strategy_execution_id: {row[0]} on exchange: {row[2]}")
+
+    def _write_close_trade(self, cursor, position_report: dict):
+        execution_ids = cursor.execute(SELECT_OPEN_EXECUTION_IDS).fetchall()
+        execution_id = str(execution_ids[0][0]) if execution_ids else None
+        reason = position_report['close_reason']
+        self._write_close_trade_pair(cursor, reason, execution_id, position_report)
+
+    def _write_close_trade_pair(self, cursor, close_reason, strategy_execution_id, position_report: dict):
+        trades = cursor.execute(SELECT_TRADES_BY_EXECUTION_ID, (strategy_execution_id,)).fetchall()
+        if not trades:
+            logger.error(f"TradeLogger - No trades found for strategy_execution_id: {strategy_execution_id}")
+            return
+
+        if len(trades) != 2:
+            logger.error(f"Expected two trades for strategy_execution_id: {strategy_execution_id}, found: {len(trades)}")
+            return
+
+        close_time = datetime.now()
+        for trade in trades:
+            exchange = trade[3]
+            pnl = position_report.get(exchange, {}).get('pnl', 0)
+            accrued_funding = position_report.get(exchange, {}).get('accrued_funding', 0)
+
+            cursor.execute(UPDATE_CLOSE_TRADE, 
+                                (close_time, pnl, accrued_funding, close_reason, strategy_execution_id, exchange))
+            logger.info(f"TradeLogger - Logged close trade for {exchange} with strategy_execution_id: {strategy_execution_id}")
           
     def clear_database(self):
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute("DROP TABLE IF EXISTS trade_log")
-            conn.commit()
-            self.create_or_access_database()
+            self.journal.flush()
+            DatabaseConnectionManager.reset_schema(self.db_path)
         except sqlite3.Error as e:
             logger.error(f"TradeLogger - Error clearing the database: {e}")
 
@@ -120,30 +109,24 @@ class TradeLogger:
 
     def get_trade_pair_by_execution_id(self, strategy_execution_id):
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''SELECT * FROM trade_log WHERE strategy_execution_id = ?;''', (strategy_execution_id,))
-                trades = cursor.fetchall()
-                logger.info(f"TradeLogger - Retrieved trades for execution id: {strategy_execution_id}")
-                return trades
+            trades = DatabaseConnectionManager.fetch_all(SELECT_TRADES_BY_EXECUTION_ID, (strategy_execution_id,), self.db_path)
+            logger.info(f"TradeLogger - Retrieved trades for execution id: {strategy_execution_id}")
+            return trades
         except sqlite3.Error as e:
             logger.error(f"TradeLogger - Error retrieving trades for execution id: {strategy_execution_id}, Error: {e}")
             return []
 
     def get_open_execution_id(self) -> str:
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''SELECT strategy_execution_id FROM trade_log WHERE open_close = 'Open' GROUP BY strategy_execution_id HAVING COUNT(*) = 2;''')
-                execution_ids = cursor.fetchall()
-
-                if execution_ids:
-                    strategy_execution_id = execution_ids[0][0]
-                    logger.info(f"TradeLogger - Found open strategy execution ID: {strategy_execution_id}")
-                    return str(strategy_execution_id)
-                else:
-                    logger.info("TradeLogger - No open trade pairs found.")
-                    return None
+            execution_ids = DatabaseConnectionManager.fetch_all(SELECT_OPEN_EXECUTION_IDS, (), self.db_path)
+
+            if execution_ids:
+                strategy_execution_id = execution_ids[0][0]
+                logger.info(f"TradeLogger - Found open strategy execution ID: {strategy_execution_id}")
+                return str(strategy_execution_id)
+            else:
+                logger.info("TradeLogger - No open trade pairs found.")
+                return None
         except sqlite3.Error as e:
             logger.error(f"TradeLogger - Error retrieving execution ID for open trades. Error: {e}")
             return None
\ No newline at end of file
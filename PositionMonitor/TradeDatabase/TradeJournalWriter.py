@@ -0,0 +1,137 @@
+from PositionMonitor.TradeDatabase.DatabaseConnectionManager import *
+from GlobalUtils.logger import *
+import threading
+import queue
+import time
+import os
+
+JOURNAL_BATCH_SIZE = 100
+JOURNAL_FLUSH_INTERVAL_SECONDS = 0.05
+TRADE_JOURNAL_FSYNC_POLICY = os.getenv('TRADE_JOURNAL_FSYNC_POLICY', 'batch')
+TRADE_JOURNAL_FSYNC_INTERVAL_SECONDS = float(os.getenv('TRADE_JOURNAL_FSYNC_INTERVAL_SECONDS', 5))
+FSYNC_POLICIES = ('batch', 'interval', 'os')
+
+class TradeJournalWriter:
+    """
+    Write-behind journal for the trade database. Callers enqueue write jobs and return immediately;
+    a background thread commits them in batched transactions.
+
+    fsync policy: 'batch' syncs the WAL on every committed batch, 'interval' checkpoints every
+    TRADE_JOURNAL_FSYNC_INTERVAL_SECONDS, 'os' leaves durability to the operating system.
+    """
+    def __init__(self, db_path: str = TRADE_DATABASE_PATH, fsync_policy: str = TRADE_JOURNAL_FSYNC_POLICY):
+        if fsync_policy not in FSYNC_POLICIES:
+            logger.error(f"TradeJournalWriter - Unknown fsync policy {fsync_policy}, falling back to 'batch'.")
+            fsync_policy = 'batch'
+        self.db_path = db_path
+        self.fsync_policy = fsync_policy
+        self.queue = queue.Queue()
+        self.last_fsync_time = time.monotonic()
+        self.committed_jobs = 0
+        self.failed_jobs = 0
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='TradeJournalWriter', daemon=True)
+        self._thread.start()
+
+    def submit(self, write, on_committed=None):
+        """Queues write(cursor) for the next batch; on_committed runs on the writer thread once the batch is durable."""
+        self.queue.put((write, on_committed))
+
+    def flush(self, timeout: float = None) -> bool:
+        """Barrier that returns once every job submitted before the call has been committed."""
+        if self._thread is None or not self._thread.is_alive():
+            self._drain()
+            return True
+        barrier = threading.Event()
+        self.queue.put(barrier)
+        return barrier.wait(timeout)
+
+    def close(self, timeout: float = None) -> bool:
+        flushed = self.flush(timeout)
+        self._stop_event.set()
+        self.queue.put(None)
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return flushed
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                item = self.queue.get(timeout=JOURNAL_FLUSH_INTERVAL_SECONDS)
+            except queue.Empty:
+                self._maybe_checkpoint()
+                continue
+            self._process([item] + self._take_pending(JOURNAL_BATCH_SIZE - 1))
+        self._drain()
+
+    def _drain(self):
+        while True:
+            items = self._take_pending(JOURNAL_BATCH_SIZE)
+            if not items:
+                return
+            self._process(items)
+
+    def _take_pending(self, limit: int) -> list:
+        items = []
+        while len(items) < limit:
+            try:
+                items.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return items
+
+    def _process(self, items: list):
+        jobs = []
+        for item in items:
+            if isinstance(item, threading.Event):
+                self._write_batch(jobs)
+                jobs = []
+                item.set()
+            elif item is not None:
+                jobs.append(item)
+        self._write_batch(jobs)
+
+    def _write_batch(self, jobs: list):
+        if not jobs:
+            return
+        try:
+            self._commit(jobs)
+        except Exception as e:
+            logger.error(f"TradeJournalWriter - Batch of {len(jobs)} writes failed, retrying individually: {e}")
+            for job in jobs:
+                try:
+                    self._commit([job])
+                except Exception as job_error:
+                    self.failed_jobs += 1
+                    logger.error(f"TradeJournalWriter - Dropping journal write after failure: {job_error}")
+
+    def _commit(self, jobs: list):
+        with DatabaseConnectionManager.transaction(self.db_path) as cursor:
+            cursor.execute(f"PRAGMA synchronous={'FULL' if self.fsync_policy == 'batch' else 'NORMAL'}")
+            for write, _ in jobs:
+                write(cursor)
+        self.committed_jobs += len(jobs)
+
+        for _, on_committed in jobs:
+            if on_committed is not None:
+                try:
+                    on_committed()
+                except Exception as e:
+                    logger.error(f"TradeJournalWriter - Error in post-commit callback: {e}")
+
+    def _maybe_checkpoint(self):
+        if self.fsync_policy != 'interval':
+            return
+        if time.monotonic() - self.last_fsync_time < TRADE_JOURNAL_FSYNC_INTERVAL_SECONDS:
+            return
+        try:
+            DatabaseConnectionManager.fetch_all("PRAGMA wal_checkpoint(PASSIVE)", (), self.db_path)
+        except Exception as e:
+            logger.error(f"TradeJournalWriter - WAL checkpoint failed: {e}")
+        self.last_fsync_time = time.monotonic()
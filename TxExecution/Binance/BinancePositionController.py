@@ -1,10 +1,11 @@
 from GlobalUtils.logger import *
 from GlobalUtils.globalUtils import *
 from APICaller.Binance.binanceUtils import BinanceEnvVars
-from APICaller.master.MasterUtils import TARGET_TOKENS
+from APICaller.master.MasterUtils import TARGET_TOKENS, get_target_tokens_for_binance
 from binance.um_futures import UMFutures as Client
 from binance.enums import *
 from TxExecution.Binance.BinancePositionControllerUtils import *
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import os
 import time
 from dotenv import load_dotenv
@@ -23,12 +24,12 @@ class BinancePositionController:
     ### WRITE FUNCTIONS ###
     #######################
 
-    def execute_trade(self, opportunity, is_long: bool, trade_size: float):
+    def execute_trade(self, opportunity, is_long: bool, trade_size: float, prepared_size: float = None):
         order_with_amount = {} 
         try:
 
             order = get_order_from_opportunity(opportunity, is_long)
-            amount = calculate_adjusted_trade_size(opportunity, is_long, trade_size)
+            amount = prepared_size if prepared_size is not None else calculate_adjusted_trade_size(opportunity, is_long, trade_size)
             order_with_amount = add_amount_to_order(order, amount)
 
             response = self.client.new_order(
@@ -60,33 +61,55 @@ class BinancePositionController:
             return None
 
     def close_all_positions(self):
-        positions = []
-        for market in ALL_MARKETS:
-            close_details = self.close_position(market)
-            positions.append(close_details)
-        
-        return positions[0]
-
-    def close_position(self, symbol: str):
+        open_positions = self.get_open_positions()
+        if open_positions is None:
+            logger.error("BinancePositionController - Bulk position query failed, closing each target market individually.")
+            close_jobs = [(symbol, None) for symbol in get_target_tokens_for_binance()]
+        else:
+            close_jobs = [(position_risk['symbol'], position_risk) for position_risk in open_positions]
+        if not close_jobs:
+            logger.info("BinancePositionController - No open positions to close.")
+            return []
+
+        close_results = []
+        failed_symbols = []
+        with ThreadPoolExecutor(max_workers=min(len(close_jobs), MAX_CONCURRENT_CLOSE_ORDERS)) as executor:
+            futures = {
+                executor.submit(self.close_position, symbol, position_risk): (symbol, position_risk)
+                for symbol, position_risk in close_jobs
+            }
+            for future in as_completed(futures):
+                symbol, position_risk = futures[future]
+                try:
+                    close_details = future.result()
+                except Exception as e:
+                    logger.error(f"BinancePositionController - Error closing position for {symbol}: {e}")
+                    failed_symbols.append(symbol)
+                    continue
+                if close_details:
+                    close_results.append(close_details)
+                elif position_risk is not None:
+                    failed_symbols.append(symbol)
+
+        if failed_symbols:
+            logger.error(f"BinancePositionController - Failed to close positions for {failed_symbols}, they may still be open.")
+        return close_results
+
+    def close_position(self, symbol: str, position_risk: dict = None):
         try:
-            # Fetch the current open position for the symbol
-            position_info = self.client.get_position_risk(symbol=symbol)
-            
-            if not position_info or 'positionAmt' not in position_info[0]:
-                logger.error(f"BinancePositionController - No open position found for {symbol}, or missing required fields.")
-                return
+            if position_risk is None:
+                position_info = self.client.get_position_risk(symbol=symbol)
+                if not position_info or 'positionAmt' not in position_info[0]:
+                    logger.error(f"BinancePositionController - No open position found for {symbol}, or missing required fields.")
+                    return
+                position_risk = position_info[0]
             
-            position_amount = float(position_info[0]['positionAmt'])
-            if position_amount > 0:
-                is_long = True
-            elif position_amount < 0:
-                is_long = False
-        
-
+            position_amount = float(position_risk['positionAmt'])
             if position_amount == 0:
                 logger.info(f"BinancePositionController - No open position to close for {symbol}.")
                 return
 
+            is_long = position_amount > 0
             close_side = "BUY" if is_long == False else "SELL"
             close_quantity_raw = abs(position_amount)
             close_quantity = round(close_quantity_raw, 4)
@@ -95,13 +118,14 @@ class BinancePositionController:
                 symbol=symbol, 
                 side=close_side,
                 type=ORDER_TYPE_MARKET,
-                quantity=close_quantity)
+                quantity=close_quantity,
+                newOrderRespType='RESULT')
 
-            time.sleep(3)
-            if self.is_order_filled(x['orderId'], symbol):
+            if x.get('status') == 'FILLED' or self.is_order_filled(x['orderId'], symbol):
                 close_position_details = {
                     'exchange': 'Binance',
-                    'pnl': float(position_info[0]['unRealizedProfit']),
+                    'symbol': symbol,
+                    'pnl': float(position_risk['unRealizedProfit']),
                     'accrued_fees': 0.0
                 }
                 logger.info(f"BinancePositionController - Open position for symbol {symbol} has been successfully closed: {close_position_details}")
@@ -146,6 +170,19 @@ class BinancePositionController:
             'liquidation_price': liquidation_price
         }
 
+    def get_open_positions(self) -> list:
+        """Open positions in target markets, or None if the query fails."""
+        try:
+            target_symbols = set(get_target_tokens_for_binance())
+            position_risks = self.client.get_position_risk()
+            return [
+                position_risk for position_risk in position_risks
+                if position_risk['symbol'] in target_symbols and float(position_risk['positionAmt']) != 0
+            ]
+        except Exception as e:
+            logger.error(f"BinancePositionController - Failed to fetch open positions. Error: {e}")
+            return None
+
     def is_already_position_open(self) -> bool:
         try:
             for token in TARGET_TOKENS:
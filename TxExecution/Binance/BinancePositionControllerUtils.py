@@ -7,6 +7,8 @@ ALL_MARKETS = [
     'BTCUSDT'
 ]
 
+MAX_CONCURRENT_CLOSE_ORDERS = 8
+
 def get_order_from_opportunity(opportunity, is_long: bool):
         side = SIDE_BUY if is_long else SIDE_SELL
         order_without_amount = {
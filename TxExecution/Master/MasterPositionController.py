@@ -1,21 +1,147 @@
 from TxExecution.Binance.BinancePositionController import BinancePositionController
 from TxExecution.Synthetix.SynthetixPositionController import SynthetixPositionController
 from TxExecution.Master.MasterPositionControllerUtils import *
+from TxExecution.Master.OrderPreparer import OrderPreparer
 from PositionMonitor.Master.MasterPositionMonitorUtils import *
 from pubsub import pub
 from GlobalUtils.logger import *
 from GlobalUtils.globalUtils import *
+from GlobalUtils.marketDirectory import MarketDirectory
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
 
 class MasterPositionController:
-    def __init__(self):
+    def __init__(self, concurrent_execution: bool = True):
         self.synthetix = SynthetixPositionController()
         self.binance = BinancePositionController()
+        self.concurrent_execution = concurrent_execution
+        self.order_preparer = OrderPreparer(self.synthetix, self.binance)
 
     #######################
     ### WRITE FUNCTIONS ###
     #######################
 
     def execute_trades(self, opportunity):
+        if self.concurrent_execution:
+            self.execute_trades_concurrently(opportunity)
+        else:
+            self.execute_trades_sequentially(opportunity)
+
+    def execute_trades_concurrently(self, opportunity):
+        try:
+            started_at = time.perf_counter()
+            template = self.order_preparer.get_template(opportunity)
+            self.order_preparer.suspend()
+            if self.is_already_position_open():
+                logger.info("MasterPositionController - Position already open, skipping opportunity.")
+                return
+            if template is None:
+                trade_size = round(self.get_trade_size(opportunity), 6)
+                prepared_sizes = {}
+            else:
+                trade_size = template['trade_size_usd']
+                prepared_sizes = {exchange_name: leg['size'] for exchange_name, leg in template['legs'].items()}
+
+            long_exchange, short_exchange = opportunity['long_exchange'], opportunity['short_exchange']
+
+            leg_states = {long_exchange: LegExecutionState.PENDING, short_exchange: LegExecutionState.PENDING}
+            position_data_dict = {}
+
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = {
+                    executor.submit(
+                        getattr(self, exchange_name.lower()).execute_trade,
+                        opportunity,
+                        is_long=exchange_name == long_exchange,
+                        trade_size=trade_size,
+                        prepared_size=prepared_sizes.get(exchange_name)
+                    ): exchange_name
+                    for exchange_name in [long_exchange, short_exchange]
+                }
+                logger.info(f"MasterPositionController - Orders dispatched {(time.perf_counter() - started_at) * 1000:.1f}ms after opportunity received (prepared={template is not None}).")
+                for future in as_completed(futures):
+                    exchange_name = futures[future]
+                    try:
+                        position_data = future.result()
+                    except Exception as leg_error:
+                        logger.error(f"MasterPositionController - {exchange_name} leg raised during execution: {leg_error}")
+                        position_data = None
+
+                    logger.info(f"MasterPositionController - {exchange_name} trade execution response: {position_data}")
+                    if position_data:
+                        leg_states[exchange_name] = LegExecutionState.FILLED
+                        position_data_dict[exchange_name] = position_data
+                    else:
+                        leg_states[exchange_name] = LegExecutionState.FAILED
+
+            if leg_states.get('Synthetix') == LegExecutionState.FAILED:
+                position_data = self.reconcile_synthetix_leg(opportunity)
+                if position_data:
+                    leg_states['Synthetix'] = LegExecutionState.FILLED
+                    position_data_dict['Synthetix'] = position_data
+
+            if len(position_data_dict) == 2:
+                logger.info(f"Publishing POSITION_OPENED with position_data: {position_data_dict}")
+                pub.sendMessage(EventsDirectory.POSITION_OPENED.value, position_data=position_data_dict)
+                logger.info("MasterPositionController - Trades executed concurrently for opportunity.")
+                return
+
+            for exchange_name, state in leg_states.items():
+                if state == LegExecutionState.FILLED:
+                    leg_states[exchange_name] = self.unwind_leg(exchange_name, opportunity)
+            logger.error(f"MasterPositionController - Failed to execute both legs concurrently. Leg states: { {name: state.value for name, state in leg_states.items()} }")
+
+            if LegExecutionState.UNWIND_FAILED in leg_states.values():
+                self.close_all_positions(PositionCloseReason.POSITION_OPEN_ERROR.value)
+
+        except Exception as e:
+            logger.error(f"MasterPositionController - Failed to process concurrent trades for opportunity. Error: {e}")
+            self.close_all_positions(PositionCloseReason.POSITION_OPEN_ERROR.value)
+        finally:
+            self.order_preparer.resume()
+
+    def reconcile_synthetix_leg(self, opportunity):
+        """A committed Synthetix order can settle after execute_trade stopped waiting, so check the real position before treating the leg as failed."""
+        symbol = opportunity['symbol']
+        tx_hash = self.synthetix.unsettled_orders.pop(symbol, None)
+        if tx_hash is None:
+            return None
+        try:
+            if not self.synthetix.confirmer.wait_for_order_settlement(symbol, timeout=LATE_SETTLEMENT_GRACE_SECONDS):
+                logger.info(f"MasterPositionController - Synthetix order {tx_hash} for {symbol} did not settle, leg is not open.")
+                return None
+            logger.error(f"MasterPositionController - Synthetix order {tx_hash} for {symbol} settled late, treating leg as filled.")
+            position_data = self.synthetix.handle_position_opened(opportunity)
+            if position_data is None:
+                logger.error(f"MasterPositionController - Could not read late-settled Synthetix position for {symbol}, unwinding it.")
+                self.unwind_leg('Synthetix', opportunity)
+            return position_data
+        except Exception as e:
+            logger.error(f"MasterPositionController - Error reconciling Synthetix leg for {symbol}, closing all positions: {e}")
+            self.close_all_positions(PositionCloseReason.POSITION_OPEN_ERROR.value)
+            return None
+
+    def unwind_leg(self, exchange_name: str, opportunity) -> LegExecutionState:
+        symbol = opportunity['symbol']
+        try:
+            if exchange_name == 'Synthetix':
+                close_details = self.synthetix.close_position(MarketDirectory.get_market_id(symbol))
+            elif exchange_name == 'Binance':
+                close_details = self.binance.close_position(symbol + 'USDT')
+            else:
+                raise ValueError(f"Unknown exchange {exchange_name}")
+
+            if not close_details:
+                logger.error(f"MasterPositionController - No close confirmation while unwinding {exchange_name} leg for {symbol}.")
+                return LegExecutionState.UNWIND_FAILED
+
+            logger.info(f"MasterPositionController - Unwound {exchange_name} leg for {symbol}: {close_details}")
+            return LegExecutionState.UNWOUND
+        except Exception as e:
+            logger.error(f"MasterPositionController - Failed to unwind {exchange_name} leg for {symbol}. Error: {e}")
+            return LegExecutionState.UNWIND_FAILED
+
+    def execute_trades_sequentially(self, opportunity):
         try:
             if self.is_already_position_open():
                 logger.info("MasterPositionController - Position already open, skipping opportunity.")
@@ -40,7 +166,11 @@ class MasterPositionController:
                 if position_data:
                     position_data_dict[exchange_name] = position_data
 
- 
+            if 'Synthetix' not in position_data_dict:
+                position_data = self.reconcile_synthetix_leg(opportunity)
+                if position_data:
+                    position_data_dict['Synthetix'] = position_data
+
             if len(position_data_dict) == 2:
                 logger.info(f"Publishing POSITION_OPENED with position_data: {position_data_dict}")
                 pub.sendMessage(EventsDirectory.POSITION_OPENED.value, position_data=position_data_dict)
@@ -55,17 +185,31 @@ class MasterPositionController:
             self.close_all_positions(PositionCloseReason.POSITION_OPEN_ERROR.value)
 
     def close_all_positions(self, reason: str):
-        synthetix_position_report = self.synthetix.close_all_positions()
-        binance_position_report = self.binance.close_all_positions()
-        position_report = {
-            'Synthetix': synthetix_position_report,
-            'Binance': binance_position_report,
-            'close_reason': reason
-        }
+        started_at = time.perf_counter()
+        venues = {'Synthetix': self.synthetix, 'Binance': self.binance}
+        position_report = {}
+        with ThreadPoolExecutor(max_workers=len(venues)) as executor:
+            futures = {executor.submit(venue.close_all_positions): exchange_name for exchange_name, venue in venues.items()}
+            for future in as_completed(futures):
+                exchange_name = futures[future]
+                try:
+                    close_results = future.result()
+                except Exception as e:
+                    logger.error(f"MasterPositionController - {exchange_name} failed while closing positions: {e}")
+                    close_results = None
+                position_report[exchange_name] = consolidate_close_details(exchange_name, close_results)
+
+        position_report['close_reason'] = reason
+        position_report['time_to_flat_seconds'] = round(time.perf_counter() - started_at, 3)
+        self.order_preparer.invalidate()
         logger.info(f'MasterPositionController - Closing positions with position report: {position_report}')
         pub.sendMessage(EventsDirectory.POSITION_CLOSED.value, position_report=position_report)
 
+    def prepare_orders(self, opportunities):
+        self.order_preparer.update_ranked_opportunities(opportunities)
+
     def subscribe_to_events(self):
+        pub.subscribe(self.prepare_orders, EventsDirectory.OPPORTUNITIES_RANKED.value)
         pub.subscribe(self.execute_trades, EventsDirectory.OPPORTUNITY_FOUND.value)
         pub.subscribe(self.close_all_positions, EventsDirectory.CLOSE_ALL_POSITIONS.value)
 
@@ -1,10 +1,21 @@
 import os
+import time
+from enum import Enum
 from dotenv import load_dotenv
 from GlobalUtils.logger import logger
 from GlobalUtils.globalUtils import *
 
 load_dotenv()
 
+LATE_SETTLEMENT_GRACE_SECONDS = 60
+
+class LegExecutionState(Enum):
+    PENDING = "PENDING"
+    FILLED = "FILLED"
+    FAILED = "FAILED"
+    UNWOUND = "UNWOUND"
+    UNWIND_FAILED = "UNWIND_FAILED"
+
 def adjust_collateral_allocation(
         collateral_amounts, 
         long_exchange, 
@@ -46,3 +57,51 @@ def calculate_adjusted_trade_size(opportunity, is_long: bool, trade_size: float)
             raise
 
 
+
+def get_opportunity_key(opportunity) -> tuple:
+    return (opportunity['symbol'], opportunity['long_exchange'], opportunity['short_exchange'])
+
+def build_order_template(opportunity, collateral_amounts: dict, asset_price: float, leverage_factor: float) -> dict:
+    """Sizes both legs of an opportunity ahead of time, so execution only has to fill in the quantity and send."""
+    try:
+        trade_size_usd = round(adjust_collateral_allocation(
+            collateral_amounts,
+            opportunity['long_exchange'],
+            opportunity['short_exchange']), 6)
+        if trade_size_usd <= 0 or not asset_price:
+            return None
+
+        levered_size_in_asset = (trade_size_usd / asset_price) * leverage_factor
+        legs = {}
+        for exchange_name in [opportunity['long_exchange'], opportunity['short_exchange']]:
+            is_long = exchange_name == opportunity['long_exchange']
+            legs[exchange_name] = {
+                'is_long': is_long,
+                'size': round(adjust_trade_size_for_direction(levered_size_in_asset, is_long), 3)
+            }
+
+        return {
+            'key': get_opportunity_key(opportunity),
+            'symbol': opportunity['symbol'],
+            'trade_size_usd': trade_size_usd,
+            'asset_price': asset_price,
+            'legs': legs,
+            'prepared_at': time.monotonic()
+        }
+    except Exception as e:
+        logger.error(f"MasterPositionControllerUtils - Failed to build order template for {opportunity.get('symbol')}: {e}")
+        return None
+
+def consolidate_close_details(exchange: str, close_results) -> dict:
+    """Merges per-market close details from one venue into a single entry of the position report."""
+    if not close_results:
+        return {}
+    if isinstance(close_results, dict):
+        close_results = [close_results]
+
+    return {
+        'exchange': exchange,
+        'pnl': sum(float(details.get('pnl', 0) or 0) for details in close_results),
+        'accrued_funding': sum(float(details.get('accrued_funding', 0) or 0) for details in close_results),
+        'positions': close_results
+    }
@@ -0,0 +1,114 @@
+from TxExecution.Master.MasterPositionControllerUtils import *
+from GlobalUtils.logger import *
+from GlobalUtils.globalUtils import *
+import threading
+import time
+import os
+
+PREPARED_OPPORTUNITY_COUNT = 3
+PREPARED_ORDER_TTL_SECONDS = float(os.getenv('PREPARED_ORDER_TTL_SECONDS', 15))
+PREPARED_ORDER_REFRESH_SECONDS = PREPARED_ORDER_TTL_SECONDS / 3
+
+class OrderPreparer:
+    """
+    Builds collateral, leverage and price-derived leg sizes for the top ranked opportunities on a background thread,
+    on every OPPORTUNITIES_RANKED update and again every PREPARED_ORDER_REFRESH_SECONDS, so the templates for the
+    current ranking are still inside PREPARED_ORDER_TTL_SECONDS when the next scan publishes OPPORTUNITY_FOUND.
+    Templates are dropped on a collateral change; whether a position is open is always checked at execution time.
+    """
+    def __init__(self, synthetix, binance):
+        self.synthetix = synthetix
+        self.binance = binance
+        self.leverage_factor = float(os.getenv('TRADE_LEVERAGE'))
+        self.ranked_opportunities = []
+        self.templates = {}
+        self._generation = 0
+        self._suspended = False
+        self._lock = threading.Lock()
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='OrderPreparer', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        self._wake_event.set()
+
+    def update_ranked_opportunities(self, opportunities):
+        with self._lock:
+            self.ranked_opportunities = list(opportunities[:PREPARED_OPPORTUNITY_COUNT])
+        self.start()
+        self._wake_event.set()
+
+    def invalidate(self):
+        """Drops templates after collateral changes; they are rebuilt on the next ranking."""
+        with self._lock:
+            self.templates = {}
+            self._generation += 1
+
+    def suspend(self):
+        """Holds off preparation while an execution is in flight so it does not compete for RPC capacity; templates are kept."""
+        with self._lock:
+            self._suspended = True
+
+    def resume(self):
+        with self._lock:
+            self._suspended = False
+        self._wake_event.set()
+
+    def get_template(self, opportunity):
+        with self._lock:
+            template = self.templates.get(get_opportunity_key(opportunity))
+            if template is None:
+                return None
+            if time.monotonic() - template['prepared_at'] > PREPARED_ORDER_TTL_SECONDS:
+                return None
+            return template
+
+    def prepare(self) -> int:
+        with self._lock:
+            if self._suspended:
+                return 0
+            opportunities = list(self.ranked_opportunities)
+            generation = self._generation
+        if not opportunities:
+            return 0
+
+        try:
+            collateral_amounts = {
+                'Synthetix': self.synthetix.get_available_collateral(),
+                'Binance': self.binance.get_available_collateral()
+            }
+            prices = PriceCache.get_prices([opportunity['symbol'] for opportunity in opportunities])
+
+            templates = {}
+            for opportunity in opportunities:
+                template = build_order_template(opportunity, collateral_amounts, prices.get(opportunity['symbol']), self.leverage_factor)
+                if template:
+                    templates[template['key']] = template
+
+            with self._lock:
+                if generation != self._generation:
+                    return 0
+                now = time.monotonic()
+                self.templates = {
+                    key: template for key, template in {**self.templates, **templates}.items()
+                    if now - template['prepared_at'] <= PREPARED_ORDER_TTL_SECONDS
+                }
+            return len(templates)
+        except Exception as e:
+            logger.error(f"OrderPreparer - Failed to prepare order templates: {e}")
+            return 0
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            self._wake_event.wait(PREPARED_ORDER_REFRESH_SECONDS)
+            self._wake_event.clear()
+            if not self._stop_event.is_set():
+                self.prepare()
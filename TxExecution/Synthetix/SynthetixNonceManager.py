@@ -0,0 +1,153 @@
+from GlobalUtils.logger import *
+from TxExecution.Synthetix.SynthetixTransactionConfirmer import SynthetixTransactionConfirmer
+from synthetix import Synthetix
+from web3.exceptions import TransactionNotFound
+import threading
+
+GAS_LIMIT_BUFFER = 1.15
+BASE_FEE_MULTIPLIER = 2
+REPLACEMENT_FEE_MULTIPLIER = 1.15
+MAX_REPLACEMENT_ATTEMPTS = 2
+
+class SynthetixNonceManager:
+    """Hands out consecutive nonces locally so dependent transactions can be broadcast back-to-back, and replaces any that are dropped."""
+    def __init__(self, client: Synthetix, lock: threading.RLock = None):
+        self.client = client
+        self.next_nonce = None
+        self.pending_transactions = {}
+        self._lock = lock if lock is not None else threading.RLock()
+
+    def sync(self) -> int:
+        with self._lock:
+            return self._sync()
+
+    def _sync(self) -> int:
+        chain_nonce = self.client.web3.eth.get_transaction_count(self.client.address, 'pending')
+        confirmed_nonce = self.client.web3.eth.get_transaction_count(self.client.address, 'latest')
+        for nonce in [n for n in self.pending_transactions if n < confirmed_nonce]:
+            del self.pending_transactions[nonce]
+
+        local_nonce = max(self.pending_transactions) + 1 if self.pending_transactions else 0
+        self.next_nonce = max(chain_nonce, local_nonce)
+        return self.next_nonce
+
+    def send_transaction(self, tx_params: dict) -> str:
+        with self._lock:
+            if self.next_nonce is None:
+                self._sync()
+            nonce = self.next_nonce
+            tx = self._prepare_transaction(tx_params, nonce)
+            tx_hash = self._sign_and_send(tx)
+            self.pending_transactions[nonce] = {'tx': tx, 'tx_hash': tx_hash}
+            self.next_nonce = nonce + 1
+            logger.info(f"SynthetixNonceManager - Broadcast transaction {tx_hash} with nonce {nonce}.")
+            return tx_hash
+
+    def send_pipeline(self, tx_params_list: list, confirmer: SynthetixTransactionConfirmer) -> list:
+        """
+        Broadcasts each transaction with consecutive nonces. Every transaction is simulated against pending state
+        first; if that fails because it depends on an unmined predecessor, the pipeline waits for that receipt and
+        simulates again, so nothing is broadcast that the node expects to revert.
+        """
+        tx_hashes = []
+        try:
+            with self._lock:
+                for tx_params in tx_params_list:
+                    gas_estimate = self.estimate_gas(tx_params)
+                    if gas_estimate is None and tx_hashes:
+                        if confirmer.wait_for_receipt(tx_hashes[-1]) is None:
+                            raise Exception(f"predecessor {tx_hashes[-1]} was not confirmed")
+                        gas_estimate = self.estimate_gas(tx_params)
+                    if gas_estimate is None:
+                        raise Exception("transaction simulation failed")
+                    tx_hashes.append(self.send_transaction({**tx_params, 'gas': int(gas_estimate * GAS_LIMIT_BUFFER)}))
+        except Exception as e:
+            logger.error(f"SynthetixNonceManager - Pipeline halted after {len(tx_hashes)} of {len(tx_params_list)} transactions: {e}")
+            self.sync()
+        return tx_hashes
+
+    def estimate_gas(self, tx_params: dict):
+        try:
+            return self.client.web3.eth.estimate_gas({**tx_params, 'from': self.client.address}, 'pending')
+        except Exception as e:
+            logger.info(f"SynthetixNonceManager - Simulation against pending state failed: {e}")
+            return None
+
+    def wait_for_pipeline(self, tx_hashes: list, confirmer: SynthetixTransactionConfirmer) -> bool:
+        """Confirms pipelined transactions in nonce order, replacing any that were dropped from the mempool."""
+        with self._lock:
+            nonces_by_hash = {entry['tx_hash']: nonce for nonce, entry in self.pending_transactions.items()}
+        for tx_hash in tx_hashes:
+            nonce = nonces_by_hash.get(tx_hash)
+            receipt = confirmer.wait_for_receipt(tx_hash)
+            attempts = 0
+            while receipt is None and nonce is not None and attempts < MAX_REPLACEMENT_ATTEMPTS and self.is_dropped(tx_hash):
+                tx_hash = self.replace_transaction(nonce)
+                if not tx_hash:
+                    break
+                receipt = confirmer.wait_for_receipt(tx_hash)
+                attempts += 1
+
+            if receipt is None:
+                logger.error(f"SynthetixNonceManager - Pipeline failed at nonce {nonce}, later transactions will not be relied upon.")
+                self.sync()
+                return False
+
+            with self._lock:
+                self.pending_transactions.pop(nonce, None)
+        return True
+
+    def is_dropped(self, tx_hash: str) -> bool:
+        try:
+            self.client.web3.eth.get_transaction(tx_hash)
+            return False
+        except TransactionNotFound:
+            return True
+        except Exception as e:
+            logger.error(f"SynthetixNonceManager - Error looking up transaction {tx_hash}: {e}")
+            return False
+
+    def replace_transaction(self, nonce: int):
+        """Re-broadcasts the transaction at the given nonce with bumped fees."""
+        try:
+            with self._lock:
+                entry = self.pending_transactions.get(nonce)
+                if entry is None:
+                    logger.error(f"SynthetixNonceManager - No pending transaction tracked for nonce {nonce}.")
+                    return None
+                tx = self._prepare_transaction(entry['tx'], nonce)
+                self._bump_fees(tx, entry['tx'])
+                tx_hash = self._sign_and_send(tx)
+                self.pending_transactions[nonce] = {'tx': tx, 'tx_hash': tx_hash}
+                logger.info(f"SynthetixNonceManager - Replaced transaction at nonce {nonce} with {tx_hash}.")
+                return tx_hash
+        except Exception as e:
+            logger.error(f"SynthetixNonceManager - Failed to replace transaction at nonce {nonce}: {e}")
+            return None
+
+    def _prepare_transaction(self, tx_params: dict, nonce: int) -> dict:
+        tx = dict(tx_params)
+        tx['nonce'] = nonce
+        tx['from'] = self.client.address
+        tx.setdefault('chainId', self.client.network_id)
+        tx.setdefault('value', 0)
+        if 'gas' not in tx:
+            tx['gas'] = int(self.client.web3.eth.estimate_gas(tx) * GAS_LIMIT_BUFFER)
+        if 'gasPrice' not in tx and 'maxFeePerGas' not in tx:
+            base_fee = self.client.web3.eth.get_block('pending')['baseFeePerGas']
+            priority_fee = self.client.web3.eth.max_priority_fee
+            tx['maxPriorityFeePerGas'] = priority_fee
+            tx['maxFeePerGas'] = base_fee * BASE_FEE_MULTIPLIER + priority_fee
+        return tx
+
+    def _bump_fees(self, tx: dict, previous_tx: dict):
+        for field in ['gasPrice', 'maxFeePerGas', 'maxPriorityFeePerGas']:
+            if field in previous_tx:
+                tx[field] = max(tx.get(field, 0), int(previous_tx[field] * REPLACEMENT_FEE_MULTIPLIER) + 1)
+        if 'maxFeePerGas' in tx:
+            tx.pop('gasPrice', None)
+
+    def _sign_and_send(self, tx: dict) -> str:
+        signed_tx = self.client.web3.eth.account.sign_transaction(tx, private_key=self.client.private_key)
+        tx_hash = self.client.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
+        return self.client.web3.to_hex(tx_hash)
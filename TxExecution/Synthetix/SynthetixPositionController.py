@@ -1,27 +1,42 @@
 from synthetix import *
 from APICaller.Synthetix.SynthetixUtils import *
 from TxExecution.Synthetix.SynthetixPositionControllerUtils import *
+from TxExecution.Synthetix.SynthetixTransactionConfirmer import SynthetixTransactionConfirmer
+from TxExecution.Synthetix.SynthetixNonceManager import SynthetixNonceManager
 from GlobalUtils.globalUtils import *
 from GlobalUtils.logger import *
 from GlobalUtils.marketDirectory import MarketDirectory
+from APICaller.master.MasterUtils import TARGET_TOKENS
 import time
 
 class SynthetixPositionController:
     def __init__(self):
         self.client = get_synthetix_client()
+        self.transaction_lock = get_synthetix_transaction_lock()
+        self.confirmer = SynthetixTransactionConfirmer(self.client)
+        self.nonce_manager = SynthetixNonceManager(self.client, self.transaction_lock)
         self.leverage_factor = float(os.getenv('TRADE_LEVERAGE'))
+        self.unsettled_orders = {}
 
     #######################
     ### WRITE FUNCTIONS ###
     #######################
 
-    def execute_trade(self, opportunity, is_long: bool, trade_size: float):
+    def execute_trade(self, opportunity, is_long: bool, trade_size: float, prepared_size: float = None):
         try:
             if not self.is_already_position_open():
-                adjusted_trade_size = self.calculate_adjusted_trade_size(opportunity, is_long, trade_size)
-                response = self.client.perps.commit_order(adjusted_trade_size, market_name=opportunity['symbol'], submit=True)
+                adjusted_trade_size = prepared_size if prepared_size is not None else self.calculate_adjusted_trade_size(opportunity, is_long, trade_size)
+                with self.transaction_lock:
+                    response = self.client.perps.commit_order(adjusted_trade_size, market_name=opportunity['symbol'], submit=True)
                 if is_transaction_hash(response):
-                    time.sleep(15)
+                    if not self.confirmer.wait_for_receipt(response):
+                        logger.error('SynthetixPositionController - Order commitment was not confirmed')
+                        self.unsettled_orders[opportunity['symbol']] = response
+                        return None
+                    if not self.confirmer.wait_for_order_settlement(opportunity['symbol']):
+                        logger.error('SynthetixPositionController - Committed order was not settled')
+                        self.unsettled_orders[opportunity['symbol']] = response
+                        return None
                     position_data = self.handle_position_opened(opportunity)
                     logger.info("SynthetixPositionController - Order executed successfully")
                     return position_data
@@ -35,38 +50,53 @@ class SynthetixPositionController:
 
     def close_all_positions(self):
         close_results = []
+        failed_symbols = []
         try:
-            for market in MarketDirectory:
-                symbol = market.value['symbol']
+            open_positions = self.get_open_positions()
+            if open_positions is None:
+                logger.error("SynthetixPositionController - Bulk position query failed, closing each target market individually.")
+                close_jobs = [(token["token"], None) for token in TARGET_TOKENS if token["is_target"]]
+            else:
+                close_jobs = list(open_positions.items())
+
+            for symbol, position in close_jobs:
                 try:
-                    close_details = self.close_position(market.value['market_id'])
+                    market_id = position['market_id'] if position is not None else MarketDirectory.get_market_id(symbol)
+                    close_details = self.close_position(market_id, position=position)
                     if close_details:
                         close_results.append(close_details)
                 except Exception as e:
                     logger.error(f"SynthetixPositionController - Error closing position for market {symbol}: {e}")
+                    failed_symbols.append(symbol)
+
+            if failed_symbols:
+                logger.error(f"SynthetixPositionController - Failed to close positions for {failed_symbols}, they may still be open.")
         except Exception as e:
             logger.error(f"SynthetixPositionController - General error in close all positions: {e}")
         
         return close_results if close_results else None
 
 
-    def close_position(self, market_id: int):
+    def close_position(self, market_id: int, position: dict = None):
         max_retries = 2 
         retry_delay_in_seconds = 3  
         
         for attempt in range(max_retries):
             try:
-                position = self.client.perps.get_open_position(market_id=market_id)
+                if position is None or attempt > 0:
+                    position = self.client.perps.get_open_position(market_id=market_id)
                 if position and position['position_size'] != 0:
                     close_position_details = {
                         'exchange': 'Synthetix',
+                        'symbol': position.get('market_name'),
                         'pnl': position['pnl'],
                         'accrued_funding': position['accrued_funding']
                     }
 
                     size = position['position_size']
                     inverse_size = size * -1
-                    response = self.client.perps.commit_order(size=inverse_size, market_id=market_id, submit=True)
+                    with self.transaction_lock:
+                        response = self.client.perps.commit_order(size=inverse_size, market_id=market_id, submit=True)
 
                     if is_transaction_hash(response):
                         logger.info(f'SynthetixPositionController - Position successfully closed: {close_position_details}')
@@ -83,37 +113,70 @@ class SynthetixPositionController:
                 else:
                     raise e
 
-    def approve_and_deposit_collateral(self, amount: int):
+    def approve_and_deposit_collateral(self, amount: int, pipelined: bool = True):
+        """Deposits through the nonce pipeline; pipelined=False sends each step only after the previous one is confirmed."""
+        if pipelined:
+            return self.approve_and_deposit_collateral_pipelined(amount)
         try:
-            self._approve_collateral_for_spot_market_proxy(amount)
-            time.sleep(1)
-            self._wrap_collateral(amount)
-            time.sleep(1)
-            self._approve_collateral_for_spot_market_proxy(amount)
-            time.sleep(1)
-            self._execute_atomic_order(amount, 'sell')
-            time.sleep(1)
-            self._approve_collateral_for_perps_market_proxy(amount)
-            time.sleep(1)
-            self._add_collateral(amount)
+            collateral_steps = [
+                lambda: self._approve_collateral_for_spot_market_proxy(amount),
+                lambda: self._wrap_collateral(amount),
+                lambda: self._approve_collateral_for_spot_market_proxy(amount),
+                lambda: self._execute_atomic_order(amount, 'sell'),
+                lambda: self._approve_collateral_for_perps_market_proxy(amount),
+                lambda: self._add_collateral(amount)
+            ]
+            for step in collateral_steps:
+                tx_hash = step()
+                if not tx_hash or not self.confirmer.wait_for_receipt(tx_hash):
+                    logger.error("SynthetixPositionController - Collateral deposit halted, previous transaction was not confirmed.")
+                    return
         except Exception as e:
             logger.error(f"SynthetixPositionController - An error occurred while attempting to add collateral: {e}")
 
+    def approve_and_deposit_collateral_pipelined(self, amount: int) -> bool:
+        try:
+            account_id = self.get_default_account()
+            if account_id is None:
+                return False
+            collateral_transactions = build_collateral_deposit_transactions(self.client, amount, account_id)
+            if not collateral_transactions:
+                return False
+            self.nonce_manager.sync()
+            tx_hashes = self.nonce_manager.send_pipeline(collateral_transactions, self.confirmer)
+            if len(tx_hashes) != len(collateral_transactions):
+                logger.error("SynthetixPositionController - Collateral pipeline was only partially broadcast.")
+                self.nonce_manager.wait_for_pipeline(tx_hashes, self.confirmer)
+                return False
+
+            if not self.nonce_manager.wait_for_pipeline(tx_hashes, self.confirmer):
+                logger.error("SynthetixPositionController - Collateral pipeline did not fully confirm, please check collateral manually.")
+                return False
+
+            logger.info(f"SynthetixPositionController - Successfully deposited {amount} collateral in a single pipeline of {len(tx_hashes)} transactions.")
+            return True
+        except Exception as e:
+            logger.error(f"SynthetixPositionController - An error occurred while pipelining collateral deposit: {e}")
+            return False
+
     def _add_collateral(self, amount: int):
         try:
-            tx = self.client.perps.modify_collateral(
-                amount=amount, 
-                market_id=0, 
-                submit=True
-            )
+            with self.transaction_lock:
+                tx = self.client.perps.modify_collateral(
+                    amount=amount, 
+                    market_id=0, 
+                    submit=True
+                )
             if is_transaction_hash(tx):
                 logger.info(f"SynthetixPositionController - Successfully added {amount} to collateral, market_id=0.")
+                return tx
         except Exception as e:
             logger.error(f"SynthetixPositionController - An error occurred while attempting to add collateral: {e}")
 
     def _create_account(self):
         try:
-            account = self.client.perps.create_account(submit=True)
+            with self.transaction_lock:
+                account = self.client.perps.create_account(submit=True)
             logger.info(f"SynthetixPositionController - Account creation successful: {account}")
         except Exception as e:
             logger.error(f"SynthetixPositionController - Account creation failed. Error: {e}")
@@ -121,40 +184,48 @@ class SynthetixPositionController:
     def _approve_collateral_for_spot_market_proxy(self, amount: int):
         try:
             spot_market_proxy_address = self.client.spot.market_proxy.address
-            approve_tx = self.client.spot.approve(
-                target_address=spot_market_proxy_address, 
-                market_id=0,
-                amount=amount,
-                submit=True
-            )
+            with self.transaction_lock:
+                approve_tx = self.client.spot.approve(
+                    target_address=spot_market_proxy_address, 
+                    market_id=0,
+                    amount=amount,
+                    submit=True
+                )
             if is_transaction_hash(approve_tx):
                 logger.info(f"SynthetixPositionController - Spot market collateral approval transaction successful. Transaction ID: {approve_tx}")
+                return approve_tx
         except Exception as e:
             logger.error(f"SynthetixPositionController - Collateral approval for spot market failed. Error: {e}")
 
     def _approve_collateral_for_perps_market_proxy(self, amount: int):
         try:
             perps_market_proxy_address = self.client.perps.market_proxy.address
-            approve_tx = self.client.spot.approve(
-                target_address=perps_market_proxy_address, 
-                market_id=0,
-                amount=amount,
-                submit=True
-            )
+            with self.transaction_lock:
+                approve_tx = self.client.spot.approve(
+                    target_address=perps_market_proxy_address, 
+                    market_id=0,
+                    amount=amount,
+                    submit=True
+                )
             if is_transaction_hash(approve_tx):
                 logger.info(f"SynthetixPositionController - Perps market collateral approval transaction successful. Transaction ID: {approve_tx}")
+                return approve_tx
         except Exception as e:
             logger.error(f"SynthetixPositionController - Collateral approval for perps market failed. Error: {e}")
 
     def _wrap_collateral(self, amount: int):
-        wrap_tx = self.client.spot.wrap(amount, market_name="sUSDC", submit=True)
+        with self.transaction_lock:
+            wrap_tx = self.client.spot.wrap(amount, market_name="sUSDC", submit=True)
         if is_transaction_hash(wrap_tx):
             logger.info(f"SynthetixPositionController - Wrap tx executed successfully")
+            return wrap_tx
 
     def _execute_atomic_order(self, amount: int, side: str):
-        order_tx = self.client.spot.atomic_order(side, amount, market_name="sUSDC", submit=True)
+        with self.transaction_lock:
+            order_tx = self.client.spot.atomic_order(side, amount, market_name="sUSDC", submit=True)
         if is_transaction_hash(order_tx):
             logger.info(f"SynthetixPositionController - Atomic order transaction successful. Side: {side}, Transaction ID: {order_tx}")
+            return order_tx
 
 
 
@@ -228,6 +299,16 @@ class SynthetixPositionController:
             logger.error(f"SynthetixPositionController - Failed to calculate adjusted trade size. Error: {e}")
             return None
 
+    def get_open_positions(self) -> dict:
+        try:
+            positions = self.client.perps.get_open_positions()
+            if not positions:
+                return {}
+            return {symbol: position for symbol, position in positions.items() if float(position['position_size']) != 0}
+        except Exception as e:
+            logger.error(f"SynthetixPositionController - Error while fetching open positions: {e}")
+            return None
+
     def is_already_position_open(self) -> bool:
         try:
             positions = self.client.perps.get_open_positions()
@@ -5,6 +5,8 @@ from decimal import DivisionByZero
 import re
 import uuid
 
+ZERO_ADDRESS = '0x0000000000000000000000000000000000000000'
+
 ALL_MARKET_IDS = [
     100,
     200
@@ -13,7 +15,7 @@ ALL_MARKET_IDS = [
 def parse_trade_data_from_position_details(position_details) -> dict:
     try:
         side = get_side(position_details['position']['position_size'])
-        asset_price = get_price_from_pyth(position_details['position']['symbol'])
+        asset_price = PriceCache.get_price(position_details['position']['symbol'])
         liquidation_price = calculate_liquidation_price(position_details, asset_price)
         order_id_hash = uuid.uuid4()
         order_id = order_id_hash.int % (10**18)
@@ -71,4 +73,44 @@ def get_side(size: float) -> str:
             return 'Short'
     except Exception as e:
         logger.error(f"SynthetixPositionControllerUtils - Error determining side from size {size}: {e}")
-        return 'Error'
\ No newline at end of file
+        return 'Error'
+
+def build_contract_transaction(client, contract, function_name: str, args: list) -> dict:
+    """Encodes a contract call; gas is estimated by the nonce manager right before broadcast."""
+    return {
+        'to': contract.address,
+        'data': contract.encodeABI(fn_name=function_name, args=args),
+        'value': 0,
+        'chainId': client.network_id
+    }
+
+def get_wrapper_amount(client, market_id: int, amount: float) -> int:
+    """Converts an ether amount into the wrapped collateral token's own decimals, read from the token contract."""
+    collateral_address, _ = client.spot.market_proxy.functions.getWrapper(market_id).call()
+    collateral_token = client.web3.eth.contract(
+        address=client.web3.to_checksum_address(collateral_address),
+        abi=client.contracts['common']['ERC20']['abi']
+    )
+    decimals = collateral_token.functions.decimals().call()
+    return int(amount * 10**decimals)
+
+def build_collateral_deposit_transactions(client, amount: float, account_id: int) -> list:
+    try:
+        spot = client.spot
+        perps = client.perps
+        susd_contract = spot.markets_by_id[0]['contract']
+        susdc_market_id = spot.markets_by_name['sUSDC']['market_id']
+        amount_wei = client.web3.to_wei(amount, 'ether')
+        wrap_amount = get_wrapper_amount(client, susdc_market_id, amount)
+
+        return [
+            build_contract_transaction(client, susd_contract, 'approve', [spot.market_proxy.address, amount_wei]),
+            build_contract_transaction(client, spot.market_proxy, 'wrap', [susdc_market_id, wrap_amount, amount_wei]),
+            build_contract_transaction(client, susd_contract, 'approve', [spot.market_proxy.address, amount_wei]),
+            build_contract_transaction(client, spot.market_proxy, 'sell', [susdc_market_id, amount_wei, amount_wei, ZERO_ADDRESS]),
+            build_contract_transaction(client, susd_contract, 'approve', [perps.market_proxy.address, amount_wei]),
+            build_contract_transaction(client, perps.market_proxy, 'modifyCollateral', [account_id, 0, amount_wei])
+        ]
+    except Exception as e:
+        logger.error(f"SynthetixPositionControllerUtils - Failed to build collateral deposit transactions: {e}")
+        return []
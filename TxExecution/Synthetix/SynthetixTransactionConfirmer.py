@@ -0,0 +1,44 @@
+from GlobalUtils.logger import *
+from synthetix import Synthetix
+import time
+
+RECEIPT_TIMEOUT_SECONDS = 60
+SETTLEMENT_TIMEOUT_SECONDS = 30
+POLL_INTERVAL_SECONDS = 0.5
+
+class SynthetixTransactionConfirmer:
+    def __init__(self, client: Synthetix):
+        self.client = client
+
+    def wait_for_receipt(self, tx_hash: str, timeout: float = RECEIPT_TIMEOUT_SECONDS):
+        try:
+            receipt = self.client.web3.eth.wait_for_transaction_receipt(
+                tx_hash,
+                timeout=timeout,
+                poll_latency=POLL_INTERVAL_SECONDS
+            )
+            if receipt['status'] != 1:
+                logger.error(f"SynthetixTransactionConfirmer - Transaction {tx_hash} reverted in block {receipt['blockNumber']}.")
+                return None
+
+            logger.info(f"SynthetixTransactionConfirmer - Transaction {tx_hash} confirmed in block {receipt['blockNumber']}.")
+            return receipt
+        except Exception as e:
+            logger.error(f"SynthetixTransactionConfirmer - No receipt for transaction {tx_hash} within {timeout}s: {e}")
+            return None
+
+    def wait_for_order_settlement(self, market_name: str, previous_size: float = 0.0, timeout: float = SETTLEMENT_TIMEOUT_SECONDS) -> bool:
+        """Polls the account's position until a keeper settles the committed order, i.e. the position size moves away from previous_size."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                position = self.client.perps.get_open_position(market_name=market_name)
+                if position and float(position['position_size']) != float(previous_size):
+                    logger.info(f"SynthetixTransactionConfirmer - Order settled for {market_name}, position size now {position['position_size']}.")
+                    return True
+            except Exception as e:
+                logger.error(f"SynthetixTransactionConfirmer - Error polling position while awaiting settlement for {market_name}: {e}")
+            time.sleep(POLL_INTERVAL_SECONDS)
+
+        logger.error(f"SynthetixTransactionConfirmer - Order for {market_name} not settled within {timeout}s.")
+        return False
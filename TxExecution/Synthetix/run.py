@@ -4,11 +4,12 @@ import argparse
 def run(args):
     x = SynthetixPositionController()
     x.check_for_accounts()
-    x.approve_and_deposit_collateral(token_address=args.token_address, amount=args.token_amount)
+    x.approve_and_deposit_collateral(amount=args.token_amount, pipelined=not args.sequential)
 
 def main():
     parser = argparse.ArgumentParser(description="Approve and deposit collateral using the SynthetixPositionController")
     parser.add_argument('token_address', type=str, help='The address of the token to use as collateral')
     parser.add_argument('token_amount', type=float, help='The amount of the token to deposit (in token decimals)')
+    parser.add_argument('--sequential', action='store_true', help='Wait for each collateral transaction to confirm before sending the next')
     args = parser.parse_args()
     run(args)
@@ -0,0 +1 @@
+# Keeps the repository root importable so tests can use the same absolute imports as the application.
@@ -0,0 +1,46 @@
+from Backtesting.utils.adaptiveLogFetcher import AdaptiveLogFetcher, LogFetchIncompleteError, get_uncovered_ranges
+import Backtesting.utils.adaptiveLogFetcher as adaptiveLogFetcher
+import pytest
+
+class FakeNode:
+    """Serves one log every 25 blocks and fails any range containing a block in failing_blocks."""
+    def __init__(self, failing_blocks: set = None):
+        self.failing_blocks = failing_blocks or set()
+        self.requested_ranges = []
+
+    def get_logs(self, from_block: int, to_block: int) -> list:
+        self.requested_ranges.append((from_block, to_block))
+        if any(from_block <= block <= to_block for block in self.failing_blocks):
+            raise ConnectionError("upstream timeout")
+        return [{'block_number': block} for block in range(from_block, to_block + 1) if block % 25 == 0]
+
+def make_fetcher(node: FakeNode, checkpoint_path: str) -> AdaptiveLogFetcher:
+    return AdaptiveLogFetcher(node.get_logs, lambda logs: logs, str(checkpoint_path), max_workers=1, initial_chunk_blocks=100)
+
+@pytest.fixture(autouse=True)
+def fixed_chunks_without_backoff(monkeypatch):
+    monkeypatch.setattr(adaptiveLogFetcher, 'RETRY_BACKOFF_SECONDS', 0)
+    monkeypatch.setattr(adaptiveLogFetcher, 'MAX_LOG_CHUNK_BLOCKS', 100)
+
+def test_failed_range_keeps_completed_chunks(tmp_path):
+    node = FakeNode(failing_blocks={250})
+    with pytest.raises(LogFetchIncompleteError) as error:
+        make_fetcher(node, tmp_path / 'checkpoint.jsonl').fetch(0, 499)
+
+    assert error.value.failed_ranges == [(200, 299)]
+    assert [event['block_number'] for event in error.value.events] == [0, 25, 50, 75, 100, 125, 150, 175, 300, 325, 350, 375, 400, 425, 450, 475]
+
+def test_resume_fetches_only_uncovered_ranges(tmp_path):
+    checkpoint_path = tmp_path / 'checkpoint.jsonl'
+    with pytest.raises(LogFetchIncompleteError):
+        make_fetcher(FakeNode(failing_blocks={250}), checkpoint_path).fetch(0, 499)
+
+    node = FakeNode()
+    events = make_fetcher(node, checkpoint_path).fetch(0, 499)
+
+    assert node.requested_ranges == [(200, 299)]
+    assert [event['block_number'] for event in events] == list(range(0, 500, 25))
+
+def test_uncovered_ranges_fill_gaps_between_checkpointed_chunks():
+    assert get_uncovered_ranges(0, 99, [(10, 19), (40, 59)]) == [(0, 9), (20, 39), (60, 99)]
+    assert get_uncovered_ranges(0, 99, [(0, 99)]) == []
@@ -0,0 +1,77 @@
+from MatchingEngine.profitabilityChecks.checkProfitability import ProfitabilityChecker
+from MatchingEngine.profitabilityChecks.batchProfitabilityUtils import build_opportunity_arrays, score_opportunity_arrays
+from GlobalUtils.marketDirectory import MarketDirectory
+from GlobalUtils.globalUtils import PriceCache
+from GlobalUtils.blockClock import BlockClock
+from types import SimpleNamespace
+import pytest
+
+CURRENT_BLOCK = 20000000
+TRADE_SIZE_USD = 15000.0
+DEFAULT_TRADE_DURATION_HOURS = 8.0
+PREMIUM = 0.001
+PRICES = {'ETH': 2000.0, 'BTC': 60000.0, 'SOL': 150.0}
+MARKET_PARAMS = {'max_funding_velocity': 9, 'skew_scale': 1000000, 'maker_fee': 0.0002, 'taker_fee': 0.0005}
+
+def make_opportunity(symbol: str, synthetix_rate: float, binance_rate: float, skew: float) -> dict:
+    is_synthetix_long = synthetix_rate < binance_rate
+    return {
+        'symbol': symbol,
+        'long_exchange': 'Synthetix' if is_synthetix_long else 'Binance',
+        'short_exchange': 'Binance' if is_synthetix_long else 'Synthetix',
+        'long_exchange_funding_rate': min(synthetix_rate, binance_rate),
+        'short_exchange_funding_rate': max(synthetix_rate, binance_rate),
+        'skew': skew,
+        'funding_velocity': 0.0
+    }
+
+OPPORTUNITIES = [
+    make_opportunity('ETH', -0.0002, 0.0001, -500.0),
+    make_opportunity('BTC', 0.0006, -0.0001, 1000.0),
+    make_opportunity('SOL', -0.0003, 0.00005, 200.0),
+    make_opportunity('ETH', 0.0004, 0.0001, -100.0),
+]
+
+@pytest.fixture
+def checker(monkeypatch):
+    monkeypatch.setattr(MarketDirectory, '_markets', {symbol: dict(MARKET_PARAMS, market_id=index) for index, symbol in enumerate(PRICES)})
+    monkeypatch.setattr(PriceCache, 'get_prices', classmethod(lambda cls, symbols: {symbol: PRICES[symbol] for symbol in symbols}))
+    monkeypatch.setattr(BlockClock, 'get_current_block', classmethod(lambda cls: CURRENT_BLOCK))
+    checker = ProfitabilityChecker.__new__(ProfitabilityChecker)
+    checker.default_trade_duration = DEFAULT_TRADE_DURATION_HOURS
+    checker.default_trade_size_usd = TRADE_SIZE_USD
+    checker.position_controller = SimpleNamespace(synthetix=SimpleNamespace(calculate_premium=lambda symbol, size: PREMIUM))
+    return checker
+
+def score(opportunities: list) -> tuple:
+    arrays = build_opportunity_arrays(opportunities, PRICES, [PREMIUM] * len(opportunities), TRADE_SIZE_USD)
+    return arrays, score_opportunity_arrays(arrays, CURRENT_BLOCK, DEFAULT_TRADE_DURATION_HOURS)
+
+def test_batch_scores_match_scalar_path(checker):
+    arrays, scores = score(OPPORTUNITIES)
+
+    for index, opportunity in enumerate(arrays['opportunities']):
+        size_per_exchange = TRADE_SIZE_USD / PRICES[opportunity['symbol']] / 2
+        hours_to_neutralize = checker.estimate_time_to_neutralize_funding_rate(opportunity, size_per_exchange)
+        profit = checker.estimate_profit_for_time_period(hours_to_neutralize, size_per_exchange, opportunity)
+
+        assert scores['hours_to_neutralize'][index] == pytest.approx(hours_to_neutralize, rel=1e-9)
+        assert scores['snx_profit_loss'][index] == pytest.approx(profit['snx_profit_loss'], rel=1e-9)
+        assert scores['binance_profit_loss'][index] == pytest.approx(profit['binance_profit_loss'], rel=1e-9)
+        assert scores['profit_estimate_usd'][index] == pytest.approx(profit['total_profit_loss'] * PRICES[opportunity['symbol']], rel=1e-9)
+
+def test_cases_cover_neutralizing_and_default_durations(checker):
+    _, scores = score(OPPORTUNITIES)
+
+    assert (scores['hours_to_neutralize'] == DEFAULT_TRADE_DURATION_HOURS).sum() == 2
+    assert (scores['hours_to_neutralize'] < DEFAULT_TRADE_DURATION_HOURS).sum() == 1
+
+def test_unscorable_opportunities_are_skipped_not_fatal(checker):
+    missing_skew = dict(OPPORTUNITIES[0], skew=None)
+    unsupported_pair = dict(OPPORTUNITIES[1], long_exchange='Bybit', short_exchange='Binance')
+    unknown_market = dict(OPPORTUNITIES[2], symbol='DOGE')
+
+    arrays, scores = score([missing_skew, unsupported_pair, unknown_market, OPPORTUNITIES[3]])
+
+    assert arrays['opportunities'] == [OPPORTUNITIES[3]]
+    assert len(scores['ranking']) == 1
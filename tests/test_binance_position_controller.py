@@ -0,0 +1,45 @@
+from TxExecution.Binance.BinancePositionController import BinancePositionController
+
+class StubClient:
+    def __init__(self, position_risks: list):
+        self.position_risks = position_risks
+
+    def get_position_risk(self, symbol: str = None):
+        if symbol is None:
+            return self.position_risks
+        return [position_risk for position_risk in self.position_risks if position_risk['symbol'] == symbol]
+
+def make_controller(position_risks: list) -> BinancePositionController:
+    controller = BinancePositionController.__new__(BinancePositionController)
+    controller.client = StubClient(position_risks)
+    return controller
+
+def test_open_positions_are_limited_to_target_markets():
+    controller = make_controller([
+        {'symbol': 'ETHUSDT', 'positionAmt': '0.5'},
+        {'symbol': 'BTCUSDT', 'positionAmt': '0'},
+        {'symbol': 'XRPUSDT', 'positionAmt': '-100'},
+    ])
+
+    assert [position_risk['symbol'] for position_risk in controller.get_open_positions()] == ['ETHUSDT']
+
+def test_close_all_positions_leaves_non_target_positions_open():
+    controller = make_controller([
+        {'symbol': 'ETHUSDT', 'positionAmt': '0.5'},
+        {'symbol': 'XRPUSDT', 'positionAmt': '-100'},
+    ])
+    closed_symbols = []
+    controller.close_position = lambda symbol, position_risk=None: closed_symbols.append(symbol) or {'symbol': symbol}
+
+    controller.close_all_positions()
+
+    assert closed_symbols == ['ETHUSDT']
+
+def test_failed_query_returns_none():
+    def get_position_risk(symbol: str = None):
+        raise ConnectionError('down')
+
+    controller = make_controller([])
+    controller.client.get_position_risk = get_position_risk
+
+    assert controller.get_open_positions() is None
@@ -0,0 +1,25 @@
+from Backtesting.utils.columnarStore import ColumnarStore
+from Backtesting.utils.memoryMappedDataset import MemoryMappedDataset
+
+SCHEMA = {'block_number': 'int64', 'funding_rate': 'float64'}
+
+def make_rows(block_numbers: list) -> list:
+    return [{'block_number': block_number, 'funding_rate': block_number / 1000} for block_number in block_numbers]
+
+def test_write_sorts_rows_by_block(tmp_path):
+    store = ColumnarStore('Binance', SCHEMA, root=str(tmp_path))
+    store.write('ETH', make_rows([30, 10, 20]))
+
+    dataset = MemoryMappedDataset(store, 'ETH')
+    assert dataset.get_frame()['block_number'].tolist() == [10, 20, 30]
+    assert dataset.get_frame()['funding_rate'].tolist() == [0.01, 0.02, 0.03]
+
+def test_out_of_order_append_keeps_store_sorted(tmp_path):
+    store = ColumnarStore('Binance', SCHEMA, root=str(tmp_path))
+    store.write('ETH', make_rows([10, 30]))
+    store.append('ETH', make_rows([50, 40]))
+    store.append('ETH', make_rows([20, 60]))
+
+    dataset = MemoryMappedDataset(store, 'ETH')
+    assert store.get_last_block('ETH') == 60
+    assert dataset.get_frame(20, 40)['block_number'].tolist() == [20, 30, 40]
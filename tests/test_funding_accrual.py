@@ -0,0 +1,33 @@
+from MatchingEngine.profitabilityChecks.checkProfitabilityUtils import calculate_funding_accrual, calculate_funding_accrual_per_block
+from MatchingEngine.profitabilityChecks.batchProfitabilityUtils import calculate_funding_accrual_vectorized
+import numpy as np
+import pytest
+
+BLOCKS_PER_DAY = 43200
+
+FUNDING_CASES = [
+    (0.0004, 0.0, 3.0, True, 14400),
+    (-0.0004, 0.0, 3.0, False, 14400),
+    (0.0004, 0.002, 2.5, True, 21600),
+    (-0.0004, -0.002, 2.5, False, 21600),
+    (0.0004, -0.03, 1.5, True, 43200),
+    (0.0004, -0.03, -1.5, False, 43200),
+    (-0.00025, 0.017, 4.0, True, 28801),
+    (-0.00025, 0.017, -4.0, False, 28801),
+    (0.001, -0.0001, 1.0, True, 1),
+]
+
+@pytest.mark.parametrize("initial_rate, funding_velocity, size, is_long, total_blocks", FUNDING_CASES)
+def test_closed_form_matches_per_block_sum(initial_rate, funding_velocity, size, is_long, total_blocks):
+    expected = calculate_funding_accrual_per_block(initial_rate, funding_velocity, size, is_long, total_blocks, BLOCKS_PER_DAY)
+    actual = calculate_funding_accrual(initial_rate, funding_velocity, size, is_long, total_blocks, BLOCKS_PER_DAY)
+    assert actual == pytest.approx(expected, rel=1e-9, abs=1e-15)
+
+def test_vectorized_matches_closed_form():
+    initial_rates, funding_velocities, sizes, is_long, total_blocks = (np.array(values) for values in zip(*FUNDING_CASES))
+    actual = calculate_funding_accrual_vectorized(initial_rates, funding_velocities, sizes, is_long, total_blocks, BLOCKS_PER_DAY)
+    expected = [calculate_funding_accrual(*case, BLOCKS_PER_DAY) for case in FUNDING_CASES]
+    assert actual == pytest.approx(expected, rel=1e-9, abs=1e-15)
+
+def test_no_blocks_accrues_nothing():
+    assert calculate_funding_accrual(0.0004, 0.002, 2.5, True, 0, BLOCKS_PER_DAY) == 0.0
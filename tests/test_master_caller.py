@@ -0,0 +1,53 @@
+from APICaller.master.MasterCaller import MasterCaller
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import pytest
+
+class StubExchange:
+    def __init__(self, rates: list = None, error: Exception = None, release: threading.Event = None):
+        self.rates = rates or []
+        self.error = error
+        self.release = release
+        self.calls = 0
+
+    def get_funding_rates(self, tokens: list) -> list:
+        self.calls += 1
+        if self.release is not None:
+            self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return self.rates
+
+def make_caller(exchanges: dict) -> MasterCaller:
+    caller = MasterCaller.__new__(MasterCaller)
+    caller.filtered_exchange_objects_and_tokens = {name: (exchange, ['ETH']) for name, exchange in exchanges.items()}
+    caller.last_fetch_times = {}
+    caller.fetch_executor = ThreadPoolExecutor(max_workers=len(exchanges))
+    caller.in_flight_fetches = {}
+    return caller
+
+@pytest.fixture
+def release():
+    event = threading.Event()
+    yield event
+    event.set()
+
+def test_hung_exchange_is_not_queued_again(release):
+    hung = StubExchange(release=release)
+    healthy = StubExchange(rates=[{'exchange': 'Synthetix', 'symbol': 'ETH', 'funding_rate': 0.001}])
+    caller = make_caller({'Binance': hung, 'Synthetix': healthy})
+
+    for _ in range(3):
+        assert caller.get_funding_rates_concurrently(timeout_seconds=0.1) == healthy.rates
+
+    assert hung.calls == 1
+    assert healthy.calls == 3
+    assert caller.last_fetch_times['Binance'] is None
+
+def test_failed_exchange_is_recorded_in_fetch_times():
+    caller = make_caller({'Binance': StubExchange(error=ConnectionError("reset")), 'Synthetix': StubExchange()})
+
+    caller.get_funding_rates_concurrently(timeout_seconds=1)
+
+    assert caller.last_fetch_times['Binance'] is None
+    assert caller.last_fetch_times['Synthetix'] is not None
@@ -0,0 +1,130 @@
+from TxExecution.Master.MasterPositionController import MasterPositionController
+from GlobalUtils.globalUtils import EventsDirectory
+from GlobalUtils.marketDirectory import MarketDirectory
+from pubsub import pub
+import pytest
+
+OPPORTUNITY = {'symbol': 'ETH', 'long_exchange': 'Synthetix', 'short_exchange': 'Binance'}
+ETH_MARKET_ID = 100
+
+class StubVenue:
+    def __init__(self, fills: bool, closes: bool = True):
+        self.fills = fills
+        self.closes = closes
+        self.closed = []
+        self.unsettled_orders = {}
+
+    def is_already_position_open(self) -> bool:
+        return False
+
+    def execute_trade(self, opportunity, is_long: bool, trade_size: float, prepared_size: float = None):
+        if not self.fills:
+            return None
+        return {'symbol': opportunity['symbol'], 'is_long': is_long}
+
+    def close_position(self, market, position=None):
+        self.closed.append(market)
+        return {'symbol': market} if self.closes else None
+
+class StubConfirmer:
+    def __init__(self, settles: bool):
+        self.settles = settles
+
+    def wait_for_order_settlement(self, symbol: str, timeout: float) -> bool:
+        return self.settles
+
+class StubOrderPreparer:
+    def __init__(self):
+        self.suspended = False
+
+    def get_template(self, opportunity):
+        return None
+
+    def suspend(self):
+        self.suspended = True
+
+    def resume(self):
+        self.suspended = False
+
+@pytest.fixture
+def published(monkeypatch):
+    monkeypatch.setattr(MarketDirectory, '_markets', {'ETH': {'market_id': ETH_MARKET_ID}})
+    messages = []
+    def record_opened(position_data):
+        messages.append(position_data)
+    pub.subscribe(record_opened, EventsDirectory.POSITION_OPENED.value)
+    yield messages
+    pub.unsubscribe(record_opened, EventsDirectory.POSITION_OPENED.value)
+
+def make_controller(synthetix: StubVenue, binance: StubVenue) -> MasterPositionController:
+    controller = MasterPositionController.__new__(MasterPositionController)
+    controller.synthetix = synthetix
+    controller.binance = binance
+    controller.concurrent_execution = True
+    controller.order_preparer = StubOrderPreparer()
+    controller.get_trade_size = lambda opportunity: 250.0
+    controller.close_all_reasons = []
+    controller.close_all_positions = controller.close_all_reasons.append
+    return controller
+
+def test_both_legs_filled_publishes_position_opened(published):
+    controller = make_controller(StubVenue(fills=True), StubVenue(fills=True))
+
+    controller.execute_trades_concurrently(OPPORTUNITY)
+
+    assert set(published[0]) == {'Synthetix', 'Binance'}
+    assert controller.synthetix.closed == [] and controller.binance.closed == []
+    assert controller.close_all_reasons == []
+    assert not controller.order_preparer.suspended
+
+def test_one_failed_leg_unwinds_the_filled_leg(published):
+    controller = make_controller(StubVenue(fills=False), StubVenue(fills=True))
+
+    controller.execute_trades_concurrently(OPPORTUNITY)
+
+    assert published == []
+    assert controller.binance.closed == ['ETHUSDT']
+    assert controller.synthetix.closed == []
+    assert controller.close_all_reasons == []
+
+def test_both_failed_legs_unwind_nothing(published):
+    controller = make_controller(StubVenue(fills=False), StubVenue(fills=False))
+
+    controller.execute_trades_concurrently(OPPORTUNITY)
+
+    assert published == []
+    assert controller.synthetix.closed == [] and controller.binance.closed == []
+    assert controller.close_all_reasons == []
+
+def test_failed_unwind_closes_all_positions(published):
+    controller = make_controller(StubVenue(fills=True, closes=False), StubVenue(fills=False))
+
+    controller.execute_trades_concurrently(OPPORTUNITY)
+
+    assert published == []
+    assert controller.synthetix.closed == [ETH_MARKET_ID]
+    assert len(controller.close_all_reasons) == 1
+
+def test_late_synthetix_settlement_counts_as_filled(published):
+    synthetix = StubVenue(fills=False)
+    synthetix.unsettled_orders['ETH'] = '0xabc'
+    synthetix.confirmer = StubConfirmer(settles=True)
+    synthetix.handle_position_opened = lambda opportunity: {'symbol': opportunity['symbol'], 'is_long': True}
+    controller = make_controller(synthetix, StubVenue(fills=True))
+
+    controller.execute_trades_concurrently(OPPORTUNITY)
+
+    assert set(published[0]) == {'Synthetix', 'Binance'}
+    assert controller.binance.closed == []
+    assert synthetix.unsettled_orders == {}
+
+def test_unsettled_synthetix_order_unwinds_the_other_leg(published):
+    synthetix = StubVenue(fills=False)
+    synthetix.unsettled_orders['ETH'] = '0xabc'
+    synthetix.confirmer = StubConfirmer(settles=False)
+    controller = make_controller(synthetix, StubVenue(fills=True))
+
+    controller.execute_trades_concurrently(OPPORTUNITY)
+
+    assert published == []
+    assert controller.binance.closed == ['ETHUSDT']
@@ -0,0 +1,41 @@
+from MatchingEngine.MatchingEngine import matchingEngine
+from GlobalUtils.blockClock import BlockClock
+import pytest
+
+def synthetix_rate(symbol: str, funding_rate: float, skew: float = 100.0) -> dict:
+    return {'exchange': 'Synthetix', 'symbol': symbol, 'funding_rate': funding_rate, 'funding_velocity': 0.002, 'skew': skew}
+
+def venue_rate(exchange: str, symbol: str, funding_rate) -> dict:
+    return {'exchange': exchange, 'symbol': symbol, 'funding_rate': funding_rate}
+
+FUNDING_RATES = [
+    synthetix_rate('ETH', 0.0003, skew=-250.0),
+    synthetix_rate('BTC', -0.0002),
+    synthetix_rate('SOL', 0.0001),
+    synthetix_rate('SNX', 0.0004),
+    venue_rate('Binance', 'ETHUSDT', '0.0001'),
+    venue_rate('Binance', 'BTCUSDT', '0.00005'),
+    venue_rate('Binance', 'SOLUSDT', '0.0001'),
+    venue_rate('Binance', 'DOGEUSDT', '0.0002'),
+]
+
+@pytest.fixture
+def engine(monkeypatch):
+    monkeypatch.setattr(BlockClock, 'get_current_block', classmethod(lambda cls: 20000000))
+    engine = matchingEngine.__new__(matchingEngine)
+    engine.exchanges = ['Synthetix', 'Binance']
+    return engine
+
+def test_matrix_matches_per_symbol_matching_for_two_venues(engine):
+    assert engine.find_arbitrage_opportunities_from_matrix(FUNDING_RATES) == engine.find_arbitrage_opportunities_by_symbol(FUNDING_RATES)
+
+def test_every_pair_includes_the_skew_venue(engine):
+    funding_rates = FUNDING_RATES + [venue_rate('Bybit', 'ETHUSDT', '-0.0005'), venue_rate('Bybit', 'DOGEUSDT', '0.0009')]
+
+    opportunities = engine.find_arbitrage_opportunities_from_matrix(funding_rates)
+
+    assert {opportunity['symbol'] for opportunity in opportunities} == {'ETH', 'BTC', 'SOL'}
+    assert all('Synthetix' in (opportunity['long_exchange'], opportunity['short_exchange']) for opportunity in opportunities)
+    assert all(opportunity['skew'] is not None for opportunity in opportunities)
+    eth = next(opportunity for opportunity in opportunities if opportunity['symbol'] == 'ETH')
+    assert (eth['long_exchange'], eth['short_exchange'], eth['skew']) == ('Bybit', 'Synthetix', -250.0)
@@ -0,0 +1,59 @@
+from TxExecution.Master.MasterPositionController import MasterPositionController
+from TxExecution.Master.OrderPreparer import OrderPreparer
+import TxExecution.Master.OrderPreparer as orderPreparer
+from GlobalUtils.globalUtils import PriceCache
+import pytest
+import time
+
+OPPORTUNITY = {'symbol': 'ETH', 'long_exchange': 'Synthetix', 'short_exchange': 'Binance'}
+
+class StubVenue:
+    def __init__(self, collateral: float = 1000.0):
+        self.collateral = collateral
+        self.collateral_requests = 0
+        self.trades = []
+        self.unsettled_orders = {}
+
+    def get_available_collateral(self) -> float:
+        self.collateral_requests += 1
+        return self.collateral
+
+    def is_already_position_open(self) -> bool:
+        return False
+
+    def execute_trade(self, opportunity, is_long: bool, trade_size: float, prepared_size: float = None):
+        self.trades.append({'is_long': is_long, 'trade_size': trade_size, 'prepared_size': prepared_size})
+        return {'symbol': opportunity['symbol'], 'is_long': is_long}
+
+@pytest.fixture
+def controller(monkeypatch):
+    monkeypatch.setenv('TRADE_LEVERAGE', '5')
+    monkeypatch.setenv('PERCENTAGE_CAPITAL_PER_TRADE', '25')
+    monkeypatch.setattr(PriceCache, 'get_prices', classmethod(lambda cls, symbols: {symbol: 2000.0 for symbol in symbols}))
+    controller = MasterPositionController.__new__(MasterPositionController)
+    controller.synthetix = StubVenue()
+    controller.binance = StubVenue()
+    controller.concurrent_execution = True
+    controller.order_preparer = OrderPreparer(controller.synthetix, controller.binance)
+    controller.get_trade_size = lambda opportunity: pytest.fail("execution fell back to get_trade_size")
+    yield controller
+    controller.order_preparer.stop()
+
+def test_execution_uses_prepared_template(controller):
+    controller.order_preparer.ranked_opportunities = [OPPORTUNITY]
+    assert controller.order_preparer.prepare() == 1
+
+    controller.execute_trades_concurrently(dict(OPPORTUNITY))
+
+    assert controller.synthetix.trades == [{'is_long': True, 'trade_size': 250.0, 'prepared_size': 0.625}]
+    assert controller.binance.trades == [{'is_long': False, 'trade_size': 250.0, 'prepared_size': -0.625}]
+
+def test_templates_are_refreshed_before_they_expire(controller, monkeypatch):
+    monkeypatch.setattr(orderPreparer, 'PREPARED_ORDER_TTL_SECONDS', 0.3)
+    monkeypatch.setattr(orderPreparer, 'PREPARED_ORDER_REFRESH_SECONDS', 0.1)
+    controller.order_preparer.update_ranked_opportunities([OPPORTUNITY])
+
+    time.sleep(0.6)
+
+    assert controller.order_preparer.get_template(OPPORTUNITY) is not None
+    assert controller.synthetix.collateral_requests >= 3
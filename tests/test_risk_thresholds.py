@@ -0,0 +1,64 @@
+from PositionMonitor.Master.MasterPositionMonitorUtils import (
+    build_risk_thresholds, is_price_threshold_crossed, is_funding_threshold_crossed, is_market_summary_threshold_crossed,
+    PRICE_MOVE_TRIGGER_FRACTION, LIQUIDATION_PROXIMITY_FRACTION
+)
+from APICaller.Synthetix.SynthetixUtils import FUNDING_PERIODS_PER_DAY
+import pytest
+
+def make_snapshot(price: float = 2000.0, synthetix_liquidation_price: float = 0, funding_rate: float = 0.0006, funding_velocity: float = 0.0) -> dict:
+    return {
+        'synthetix_position': {'symbol': 'ETH', 'liquidation_price': synthetix_liquidation_price, 'size': -1.0},
+        'binance_position': {'symbol': 'ETHUSDT', 'liquidation_price': 0, 'size': 1.0},
+        'prices': {'ETH': price},
+        'synthetix_market_summary': {'current_funding_rate': funding_rate, 'current_funding_velocity': funding_velocity}
+    }
+
+def test_price_band_is_one_move_fraction_around_snapshot_price():
+    thresholds = build_risk_thresholds(make_snapshot())
+
+    lower, upper = thresholds['price_bands']['ETH']
+    assert lower == pytest.approx(2000.0 * (1 - PRICE_MOVE_TRIGGER_FRACTION))
+    assert upper == pytest.approx(2000.0 * (1 + PRICE_MOVE_TRIGGER_FRACTION))
+    assert not is_price_threshold_crossed(thresholds, {'ETH': 2010.0})
+    assert is_price_threshold_crossed(thresholds, {'ETH': 2030.0})
+    assert is_price_threshold_crossed(thresholds, {'ETH': 1970.0})
+
+def test_price_band_is_clipped_at_liquidation_alert_level():
+    liquidation_price = 2130.0
+    alert_price = liquidation_price * (1 - LIQUIDATION_PROXIMITY_FRACTION)
+    thresholds = build_risk_thresholds(make_snapshot(price=1900.0, synthetix_liquidation_price=liquidation_price))
+
+    _, upper = thresholds['price_bands']['ETH']
+    assert alert_price < 1900.0 * (1 + PRICE_MOVE_TRIGGER_FRACTION)
+    assert upper == pytest.approx(alert_price)
+    assert not is_price_threshold_crossed(thresholds, {'ETH': alert_price - 1})
+    assert is_price_threshold_crossed(thresholds, {'ETH': alert_price + 1})
+
+def test_prices_for_other_symbols_do_not_wake_the_monitor():
+    thresholds = build_risk_thresholds(make_snapshot())
+
+    assert not is_price_threshold_crossed(thresholds, {'BTC': 1.0})
+
+def test_funding_update_in_caller_units_wakes_on_sign_change():
+    thresholds = build_risk_thresholds(make_snapshot(funding_rate=0.0006))
+    unchanged = [{'exchange': 'Synthetix', 'symbol': 'ETH', 'funding_rate': 0.0006 / FUNDING_PERIODS_PER_DAY, 'funding_velocity': 0.0}]
+    flipped = [{'exchange': 'Synthetix', 'symbol': 'ETH', 'funding_rate': -0.0001 / FUNDING_PERIODS_PER_DAY, 'funding_velocity': 0.0}]
+    other_venue = [{'exchange': 'Binance', 'symbol': 'ETH', 'funding_rate': -0.01}]
+
+    assert not is_funding_threshold_crossed(thresholds, unchanged)
+    assert not is_funding_threshold_crossed(thresholds, other_venue)
+    assert is_funding_threshold_crossed(thresholds, flipped)
+
+def test_predicted_funding_flip_wakes_the_monitor():
+    thresholds = build_risk_thresholds(make_snapshot(funding_rate=0.0006, funding_velocity=0.0))
+
+    assert is_market_summary_threshold_crossed(thresholds, {'current_funding_rate': 0.0006, 'current_funding_velocity': -0.01})
+    assert not is_market_summary_threshold_crossed(thresholds, {'current_funding_rate': 0.0005, 'current_funding_velocity': 0.0})
+
+def test_no_thresholds_without_a_position():
+    snapshot = make_snapshot()
+    snapshot.update(synthetix_position=None, binance_position=None)
+    thresholds = build_risk_thresholds(snapshot)
+
+    assert thresholds == {'price_bands': {}, 'funding': None}
+    assert not is_funding_threshold_crossed(thresholds, [{'exchange': 'Synthetix', 'symbol': 'ETH', 'funding_rate': -1}])
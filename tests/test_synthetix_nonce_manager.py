@@ -0,0 +1,100 @@
+from TxExecution.Synthetix.SynthetixNonceManager import SynthetixNonceManager, GAS_LIMIT_BUFFER, BASE_FEE_MULTIPLIER
+from types import SimpleNamespace
+
+ADDRESS = '0x0000000000000000000000000000000000000001'
+
+class StubEth:
+    """Records broadcast nonces; estimate_gas fails for transactions whose data is listed in depends_on_mined until mined_count grows."""
+    def __init__(self, pending_nonce: int, confirmed_nonce: int, depends_on_mined: set = None):
+        self.pending_nonce = pending_nonce
+        self.confirmed_nonce = confirmed_nonce
+        self.depends_on_mined = depends_on_mined or set()
+        self.mined_count = 0
+        self.sent = []
+        self.max_priority_fee = 2
+        self.account = SimpleNamespace(sign_transaction=lambda tx, private_key: SimpleNamespace(rawTransaction=tx))
+
+    def get_transaction_count(self, address: str, block_identifier: str) -> int:
+        return self.pending_nonce if block_identifier == 'pending' else self.confirmed_nonce
+
+    def estimate_gas(self, tx: dict, block_identifier: str = None) -> int:
+        if tx.get('data') in self.depends_on_mined and self.mined_count == 0:
+            raise ValueError("execution reverted")
+        return 100000
+
+    def get_block(self, block_identifier: str) -> dict:
+        return {'baseFeePerGas': 10}
+
+    def send_raw_transaction(self, tx: dict) -> str:
+        self.sent.append(tx)
+        return f"0x{tx['nonce']:064x}"
+
+class StubConfirmer:
+    def __init__(self, eth: StubEth):
+        self.eth = eth
+        self.waited_for = []
+
+    def wait_for_receipt(self, tx_hash: str):
+        self.waited_for.append(tx_hash)
+        self.eth.mined_count += 1
+        return {'status': 1, 'transactionHash': tx_hash}
+
+def make_manager(eth: StubEth) -> SynthetixNonceManager:
+    web3 = SimpleNamespace(eth=eth, to_hex=lambda value: value)
+    client = SimpleNamespace(web3=web3, address=ADDRESS, private_key='0x01', network_id=8453)
+    return SynthetixNonceManager(client)
+
+def test_pipeline_uses_consecutive_nonces_from_pending_count():
+    eth = StubEth(pending_nonce=7, confirmed_nonce=5)
+    manager = make_manager(eth)
+
+    tx_hashes = manager.send_pipeline([{'to': ADDRESS, 'data': f'0x0{index}'} for index in range(3)], StubConfirmer(eth))
+
+    assert [tx['nonce'] for tx in eth.sent] == [7, 8, 9]
+    assert len(tx_hashes) == 3
+    assert manager.next_nonce == 10
+    assert all(tx['gas'] == int(100000 * GAS_LIMIT_BUFFER) for tx in eth.sent)
+    assert all(tx['maxFeePerGas'] == 10 * BASE_FEE_MULTIPLIER + 2 for tx in eth.sent)
+
+def test_later_sends_continue_after_locally_tracked_nonces():
+    eth = StubEth(pending_nonce=3, confirmed_nonce=3)
+    manager = make_manager(eth)
+    manager.send_pipeline([{'to': ADDRESS, 'data': '0x00'}, {'to': ADDRESS, 'data': '0x01'}], StubConfirmer(eth))
+
+    manager.sync()
+    manager.send_transaction({'to': ADDRESS, 'data': '0x02'})
+
+    assert [tx['nonce'] for tx in eth.sent] == [3, 4, 5]
+
+def test_dependent_transaction_waits_for_predecessor_receipt():
+    eth = StubEth(pending_nonce=0, confirmed_nonce=0, depends_on_mined={'0x01'})
+    confirmer = StubConfirmer(eth)
+    manager = make_manager(eth)
+
+    tx_hashes = manager.send_pipeline([{'to': ADDRESS, 'data': '0x00'}, {'to': ADDRESS, 'data': '0x01'}], confirmer)
+
+    assert [tx['nonce'] for tx in eth.sent] == [0, 1]
+    assert confirmer.waited_for == [tx_hashes[0]]
+
+def test_wait_for_pipeline_confirms_in_nonce_order():
+    eth = StubEth(pending_nonce=4, confirmed_nonce=4)
+    confirmer = StubConfirmer(eth)
+    manager = make_manager(eth)
+    tx_hashes = manager.send_pipeline([{'to': ADDRESS, 'data': f'0x0{index}'} for index in range(3)], confirmer)
+
+    assert manager.wait_for_pipeline(tx_hashes, confirmer)
+    assert confirmer.waited_for == tx_hashes
+    assert manager.pending_transactions == {}
+
+def test_collateral_deposit_is_pipelined_by_default(monkeypatch):
+    from TxExecution.Synthetix import SynthetixPositionController as controllerModule
+    eth = StubEth(pending_nonce=12, confirmed_nonce=12)
+    controller = controllerModule.SynthetixPositionController.__new__(controllerModule.SynthetixPositionController)
+    controller.nonce_manager = make_manager(eth)
+    controller.confirmer = StubConfirmer(eth)
+    controller.client = controller.nonce_manager.client
+    controller.get_default_account = lambda: 1
+    monkeypatch.setattr(controllerModule, 'build_collateral_deposit_transactions', lambda client, amount, account_id: [{'to': ADDRESS, 'data': f'0x0{index}'} for index in range(6)])
+
+    assert controller.approve_and_deposit_collateral(100)
+    assert [tx['nonce'] for tx in eth.sent] == list(range(12, 18))